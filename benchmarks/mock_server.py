@@ -0,0 +1,225 @@
+import argparse
+import json
+import random
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+_QUOTED_RE = re.compile(r"'([^']+)'")
+_HARAM_WORDS = ("pork", "bacon", "ham", "lard", "wine", "beer", "rum", "blood")
+_QUESTIONABLE_WORDS = ("gelatin", "e471", "whey", "rennet", "enzyme", "flavor")
+
+
+def verdict(name: str) -> str:
+    name = name.lower()
+    if any(word in name for word in _HARAM_WORDS):
+        return "Haram"
+    if any(word in name for word in _QUESTIONABLE_WORDS):
+        return "Questionable"
+    return "Halal"
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class LatencyModel:
+    def __init__(self, spec: str = "fixed:0", seed: Optional[int] = None):
+        self.spec = spec
+        kind, _, params = spec.partition(":")
+        self.kind = kind
+        self.params = [float(p) for p in params.split(":") if p]
+        if kind not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {spec}")
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self) -> float:
+        with self._lock:
+            if self.kind == "uniform":
+                low, high = self.params
+                millis = self._random.uniform(low, high)
+            elif self.kind == "lognormal":
+                median, sigma = self.params
+                millis = self._random.lognormvariate(0.0, sigma) * median
+            else:
+                millis = self.params[0] if self.params else 0.0
+        return millis / 1000.0
+
+
+class MockLLMServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: str = "fixed:0",
+        error_rate: float = 0.0,
+        malformed_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.host = host
+        self.latency = LatencyModel(latency, seed)
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.malformed = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self._server = _Server((host, port), self._handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self._server.server_port}/"
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "malformed": self.malformed,
+                "bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+            }
+
+    def start(self) -> "MockLLMServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _roll(self) -> float:
+        with self._lock:
+            return self._random.random()
+
+    def respond(self, payload: Dict[str, Any]) -> Optional[str]:
+        prompt = payload["messages"][-1]["content"]
+        roll = self._roll()
+        if roll < self.error_rate:
+            return None
+        if roll < self.error_rate + self.malformed_rate:
+            with self._lock:
+                self.malformed += 1
+            return '{"status": "Halal", "explanation": "truncated'
+        if "ITEMS:" in prompt:
+            items: List[str] = json.loads(prompt.rsplit("ITEMS:", 1)[1])
+            return json.dumps(
+                {
+                    "results": [
+                        {
+                            "ingredient": item,
+                            "status": verdict(item),
+                            "explanation": "mock verdict",
+                            "confidence": "High",
+                        }
+                        for item in items
+                    ]
+                }
+            )
+        match = _QUOTED_RE.search(prompt)
+        name = match.group(1) if match else prompt
+        status = verdict(name)
+        if payload.get("max_tokens"):
+            return json.dumps({"status": status, "confidence": "High"})
+        return json.dumps(
+            {
+                "status": status,
+                "explanation": f"mock verdict for {name}",
+                "confidence": "High",
+                "concerns": [] if status == "Halal" else [f"{name} needs review"],
+                "recommendations": [],
+                "certification_required": status != "Halal",
+                "alternatives": [],
+            }
+        )
+
+    def _handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                time.sleep(server.latency.sample())
+                try:
+                    text = server.respond(json.loads(body))
+                except (ValueError, KeyError, IndexError):
+                    text = None
+                if text is None:
+                    status, data = 500, b'{"error": "mock failure"}'
+                else:
+                    status, data = 200, text.encode("utf-8")
+                with server._lock:
+                    server.requests += 1
+                    server.errors += status != 200
+                    server.bytes_in += len(body)
+                    server.bytes_out += len(data)
+                self.send_response(status)
+                self.send_header("Content-Type", "text/plain; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for the LLM API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument(
+        "--latency",
+        default="lognormal:40:0.5",
+        help="fixed:MS, uniform:LOW:HIGH or lognormal:MEDIAN:SIGMA (milliseconds)",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+    server = MockLLMServer(
+        args.host,
+        args.port,
+        args.latency,
+        args.error_rate,
+        args.malformed_rate,
+        args.seed,
+    )
+    print(f"Mock LLM listening on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
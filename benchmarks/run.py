@@ -0,0 +1,325 @@
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from quran import HalalDetector, VerdictCache, __version__
+
+from .mock_server import MockLLMServer
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+BASE_INGREDIENTS = (
+    "chicken",
+    "beef stock",
+    "pork fat",
+    "gelatin",
+    "whey powder",
+    "rennet",
+    "natural flavor",
+    "vanilla extract",
+    "E471",
+    "E120",
+    "soy lecithin",
+    "mono and diglycerides",
+    "l-cysteine",
+    "shellac",
+    "glycerin",
+    "rice flour",
+    "cocoa butter",
+    "wine vinegar",
+    "enzymes",
+    "stearic acid",
+)
+DESCRIPTORS = ("", "organic", "refined", "dried", "blend", "concentrate", "powder")
+
+Op = Callable[[], Any]
+Workload = Callable[[HalalDetector, random.Random, int], List[Op]]
+
+
+def make_vocabulary(size: int, rng: random.Random) -> List[str]:
+    names = []
+    for index in range(size):
+        base = BASE_INGREDIENTS[index % len(BASE_INGREDIENTS)]
+        descriptor = rng.choice(DESCRIPTORS)
+        names.append(" ".join(filter(None, (descriptor, base, f"lot {index}"))))
+    return names
+
+
+def zipf_sample(vocabulary: Sequence[str], count: int, rng: random.Random) -> List[str]:
+    weights = [1.0 / (rank + 1) for rank in range(len(vocabulary))]
+    return rng.choices(vocabulary, weights=weights, k=count)
+
+
+def single_lookups(detector: HalalDetector, rng: random.Random, size: int) -> List[Op]:
+    return [partial(detector.detect_ingredient, n) for n in make_vocabulary(size, rng)]
+
+
+def quick_checks(detector: HalalDetector, rng: random.Random, size: int) -> List[Op]:
+    return [partial(detector.is_halal, n) for n in make_vocabulary(size, rng)]
+
+
+def batch(detector: HalalDetector, rng: random.Random, size: int) -> List[Op]:
+    batch_size = 50
+    vocabulary = make_vocabulary(size, rng)
+    return [
+        partial(detector.batch_detect, vocabulary[i : i + batch_size])
+        for i in range(0, len(vocabulary), batch_size)
+    ]
+
+
+def packed_batch(detector: HalalDetector, rng: random.Random, size: int) -> List[Op]:
+    batch_size = 50
+    vocabulary = make_vocabulary(size, rng)
+    return [
+        partial(detector.batch_detect, vocabulary[i : i + batch_size], packed=True)
+        for i in range(0, len(vocabulary), batch_size)
+    ]
+
+
+def recipes(detector: HalalDetector, rng: random.Random, size: int) -> List[Op]:
+    vocabulary = make_vocabulary(size, rng)
+    ops: List[Op] = []
+    for index in range(max(1, size // 10)):
+        ingredients = rng.sample(vocabulary, min(10, len(vocabulary)))
+        ops.append(partial(detector.analyze_recipe, f"recipe {index}", ingredients))
+    return ops
+
+
+def mixed_recipes(detector: HalalDetector, rng: random.Random, size: int) -> List[Op]:
+    vocabulary = make_vocabulary(max(10, size // 5), rng)
+    ops: List[Op] = []
+    for index in range(max(1, size // 10)):
+        ingredients = zipf_sample(vocabulary, rng.randint(5, 15), rng)
+        ops.append(partial(detector.analyze_recipe, f"recipe {index}", ingredients))
+    return ops
+
+
+WORKLOADS: Dict[str, Workload] = {
+    "single": single_lookups,
+    "quick_checks": quick_checks,
+    "batch": batch,
+    "packed_batch": packed_batch,
+    "recipes": recipes,
+    "mixed_recipes": mixed_recipes,
+}
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100.0 * len(sorted_values)) - 1)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def max_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return int(rss / 1024) if sys.platform == "darwin" else int(rss)
+
+
+def run_workload(
+    name: str,
+    server: MockLLMServer,
+    args: argparse.Namespace,
+    cache_dir: str,
+) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    cache = VerdictCache(os.path.join(cache_dir, f"{name}.db")) if args.cache else None
+    detector = HalalDetector(
+        cache=cache, max_workers=args.workers, use_lexicon=not args.no_lexicon
+    )
+    detector.base_url = server.url
+    ops = WORKLOADS[name](detector, rng, args.size)
+    latencies: List[float] = []
+    failures = 0
+
+    def timed(op: Op) -> Optional[float]:
+        started = time.perf_counter()
+        try:
+            op()
+        except Exception:
+            return None
+        return time.perf_counter() - started
+
+    if args.trace_memory:
+        tracemalloc.start()
+    before = server.stats()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        for elapsed in executor.map(timed, ops):
+            if elapsed is None:
+                failures += 1
+            else:
+                latencies.append(elapsed)
+    wall = time.perf_counter() - started
+    after = server.stats()
+    traced_peak = None
+    if args.trace_memory:
+        traced_peak = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+    detector.close()
+    if cache is not None:
+        cache.close()
+
+    latencies.sort()
+    requests = after["requests"] - before["requests"]
+    return {
+        "workload": name,
+        "ops": len(ops),
+        "failures": failures,
+        "wall_s": round(wall, 4),
+        "ops_per_s": round(len(ops) / wall, 2) if wall else 0.0,
+        "latency_ms": {
+            "mean": (
+                round(1000 * sum(latencies) / len(latencies), 3) if latencies else 0.0
+            ),
+            "p50": round(1000 * percentile(latencies, 50), 3),
+            "p95": round(1000 * percentile(latencies, 95), 3),
+            "p99": round(1000 * percentile(latencies, 99), 3),
+            "max": round(1000 * latencies[-1], 3) if latencies else 0.0,
+        },
+        "requests": requests,
+        "requests_per_op": round(requests / len(ops), 3) if ops else 0.0,
+        "requests_per_s": round(requests / wall, 2) if wall else 0.0,
+        "upstream_errors": after["errors"] - before["errors"],
+        "malformed_responses": after["malformed"] - before["malformed"],
+        "bytes_sent": after["bytes_in"] - before["bytes_in"],
+        "bytes_received": after["bytes_out"] - before["bytes_out"],
+        # ru_maxrss is the peak of the whole process so far, not of this
+        # workload; only traced_peak_kb is per workload.
+        "memory": {
+            "traced_peak_kb": traced_peak,
+            "process_max_rss_kb": max_rss_kb(),
+        },
+    }
+
+
+def compare(
+    results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    previous = {r["workload"]: r for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        old = previous.get(result["workload"])
+        if old is None:
+            continue
+        name = result["workload"]
+        for key in ("p50", "p95", "p99"):
+            before, after = old["latency_ms"][key], result["latency_ms"][key]
+            if before and after > before * (1 + tolerance):
+                regressions.append(
+                    f"{name}: {key} latency {before:.1f}ms -> {after:.1f}ms"
+                )
+        before, after = old["ops_per_s"], result["ops_per_s"]
+        if before and after < before * (1 - tolerance):
+            regressions.append(f"{name}: throughput {before:.1f} -> {after:.1f} ops/s")
+        before, after = old["requests_per_op"], result["requests_per_op"]
+        if after > before * (1 + tolerance):
+            regressions.append(f"{name}: requests/op {before:.2f} -> {after:.2f}")
+    return regressions
+
+
+def print_table(results: List[Dict[str, Any]]) -> None:
+    traced = any(r["memory"]["traced_peak_kb"] is not None for r in results)
+    memory_key, memory_label = (
+        ("traced_peak_kb", "peak KB")
+        if traced
+        else ("process_max_rss_kb", "proc RSS KB")
+    )
+    header = (
+        f"{'workload':<14}{'ops':>6}{'ops/s':>10}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'p99 ms':>10}{'req':>7}{'req/op':>8}{memory_label:>13}"
+    )
+    sys.stderr.write(header + "\n")
+    for r in results:
+        sys.stderr.write(
+            f"{r['workload']:<14}{r['ops']:>6}{r['ops_per_s']:>10.1f}"
+            f"{r['latency_ms']['p50']:>10.1f}{r['latency_ms']['p95']:>10.1f}"
+            f"{r['latency_ms']['p99']:>10.1f}{r['requests']:>7}"
+            f"{r['requests_per_op']:>8.2f}{r['memory'][memory_key] or 0:>13}\n"
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Benchmark the detector against a local mock LLM server",
+    )
+    parser.add_argument(
+        "workloads", nargs="*", help=f"any of {', '.join(WORKLOADS)} (default: all)"
+    )
+    parser.add_argument("--size", type=int, default=200, help="items per workload")
+    parser.add_argument("--latency", default="lognormal:40:0.5")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--cache", action="store_true", help="enable VerdictCache")
+    parser.add_argument("--no-lexicon", action="store_true")
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="report each workload's tracemalloc peak (slows the timed run)",
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("-o", "--output", help="write JSON results to this file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+    unknown = set(args.workloads) - set(WORKLOADS)
+    if unknown:
+        parser.error(f"unknown workloads: {', '.join(sorted(unknown))}")
+
+    config = {k: v for k, v in vars(args).items() if k not in ("output", "baseline")}
+    results = []
+    with MockLLMServer(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed,
+    ) as server, tempfile.TemporaryDirectory() as cache_dir:
+        for name in args.workloads or list(WORKLOADS):
+            results.append(run_workload(name, server, args, cache_dir))
+
+    report = {
+        "quran_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "config": config,
+        "results": results,
+    }
+    print_table(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            sys.stderr.write(f"REGRESSION {line}\n")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
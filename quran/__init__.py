@@ -1,4 +1,56 @@
+from .async_detector import AsyncHalalDetector
+from .backends import (
+    FailoverBackend,
+    OpenAICompatibleBackend,
+    PollinationsBackend,
+    StubBackend,
+)
+from .cache import MemoryCache, VerdictCache, bypass_cache
+from .catalog import MenuCatalog
 from .halal_detector import HalalDetector
+from .label_parser import LabelToken, parse_label
+from .metrics import Metrics
+from .resilience import CircuitBreaker
+from .results import (
+    Confidence,
+    FoodItemResult,
+    IngredientResult,
+    LabelAnalysis,
+    RecipeAnalysis,
+    Status,
+    VerdictResult,
+)
+from .scheduler import Priority, RequestScheduler, priority
+from .snapshot import VerdictSnapshot, build_snapshot
+from .transport import HTTPTransport
 
 __version__ = "2.0.0"
-__all__ = ["HalalDetector"]
+__all__ = [
+    "AsyncHalalDetector",
+    "CircuitBreaker",
+    "Confidence",
+    "FailoverBackend",
+    "FoodItemResult",
+    "HalalDetector",
+    "HTTPTransport",
+    "IngredientResult",
+    "LabelAnalysis",
+    "LabelToken",
+    "MemoryCache",
+    "MenuCatalog",
+    "Metrics",
+    "OpenAICompatibleBackend",
+    "PollinationsBackend",
+    "Priority",
+    "RecipeAnalysis",
+    "RequestScheduler",
+    "Status",
+    "StubBackend",
+    "VerdictCache",
+    "VerdictResult",
+    "VerdictSnapshot",
+    "build_snapshot",
+    "bypass_cache",
+    "parse_label",
+    "priority",
+]
@@ -0,0 +1,708 @@
+# fmt: off
+HALAL_TERMS = (
+    # meat and poultry from permitted animals
+    "beef", "veal", "lamb", "mutton", "goat", "goat meat", "chicken", "turkey",
+    "duck", "goose", "quail", "pheasant", "partridge", "pigeon", "camel",
+    "venison", "deer", "buffalo", "bison", "ostrich", "rabbit", "halal beef",
+    "halal chicken", "halal lamb", "halal meat", "zabiha meat", "zabiha chicken",
+    "ground beef", "minced beef", "beef mince", "lamb mince", "chicken breast",
+    "chicken thigh", "chicken wing", "chicken drumstick", "chicken liver",
+    "beef liver", "lamb liver", "beef brisket", "beef steak", "sirloin",
+    "ribeye", "tenderloin", "lamb chop", "lamb shank", "beef broth",
+    "chicken broth", "beef stock", "chicken stock", "lamb stock", "bone broth",
+    "egg", "egg white", "egg yolk", "whole egg", "egg powder", "dried egg",
+    "liquid egg", "quail egg", "duck egg",
+    # fish
+    "fish", "seafood", "salmon", "tuna", "cod", "haddock", "pollock", "hake",
+    "mackerel", "sardine", "anchovy", "herring", "trout", "tilapia", "catfish",
+    "carp", "halibut", "sole", "plaice", "sea bass", "sea bream", "snapper",
+    "grouper", "swordfish", "mahi mahi", "barramundi", "perch", "pike",
+    "whitefish", "monkfish", "turbot", "dory", "john dory", "sprat",
+    "whitebait", "pilchard", "bonito", "skipjack", "albacore", "yellowfin",
+    "fish roe", "salmon roe", "caviar", "fish sauce", "fish oil", "cod liver oil",
+    "fish stock", "fish gelatin", "fish gelatine", "fish collagen", "surimi",
+    "smoked salmon", "dried fish", "bombay duck", "eel",
+    # dairy and eggs
+    "milk", "whole milk", "skimmed milk", "skim milk", "semi skimmed milk",
+    "milk powder", "skimmed milk powder", "whole milk powder", "dried milk",
+    "condensed milk", "evaporated milk", "buttermilk", "cream", "double cream",
+    "single cream", "whipping cream", "heavy cream", "sour cream", "creme fraiche",
+    "butter", "unsalted butter", "salted butter", "ghee", "clarified butter",
+    "butter oil", "yogurt", "yoghurt", "greek yogurt", "natural yogurt", "kefir",
+    "labneh", "milk protein", "milk solids", "milk fat", "lactose", "casein",
+    "sodium caseinate", "calcium caseinate", "milk protein concentrate",
+    "lactalbumin", "lactoglobulin", "paneer", "cottage cheese", "cream cheese",
+    "ricotta", "mascarpone", "halal cheese", "vegetarian cheese", "quark",
+    "curd", "dahi", "lassi", "ayran",
+    # grains and flours
+    "wheat", "wheat flour", "whole wheat flour", "wholemeal flour", "plain flour",
+    "self raising flour", "bread flour", "flour", "fortified wheat flour",
+    "durum wheat", "durum wheat semolina", "semolina", "bulgur", "couscous",
+    "freekeh", "spelt", "rye", "rye flour", "barley", "pearl barley",
+    "barley flour", "oat", "oats", "rolled oats", "oat flour", "oat bran",
+    "oatmeal", "corn", "maize", "cornmeal", "corn flour", "cornflour",
+    "corn starch", "cornstarch", "maize starch", "polenta", "grits", "popcorn",
+    "rice", "white rice", "brown rice", "basmati rice", "jasmine rice",
+    "arborio rice", "wild rice", "rice flour", "glutinous rice", "sticky rice",
+    "rice bran", "millet", "sorghum", "teff", "quinoa", "amaranth", "buckwheat",
+    "buckwheat flour", "tapioca", "tapioca starch", "cassava", "cassava flour",
+    "potato starch", "potato flour", "arrowroot", "sago", "wheat starch",
+    "wheat gluten", "vital wheat gluten", "gluten", "wheat bran", "wheat germ",
+    "malt", "barley malt", "malted barley", "malt extract", "malt flour",
+    "pasta", "spaghetti", "macaroni", "noodles", "rice noodles", "egg noodles",
+    "udon", "soba", "vermicelli", "bread", "pita", "naan", "tortilla",
+    "breadcrumbs", "crackers", "rusk", "bran", "muesli", "granola", "cereal",
+    # legumes, nuts and seeds
+    "chickpea", "chickpeas", "gram flour", "besan", "lentil", "red lentil",
+    "green lentil", "yellow lentil", "split pea", "pea", "green pea",
+    "pea protein", "bean", "kidney bean", "black bean", "pinto bean",
+    "navy bean", "haricot bean", "cannellini bean", "butter bean", "lima bean",
+    "broad bean", "fava bean", "mung bean", "adzuki bean", "black eyed pea",
+    "soybean", "soya bean", "soy", "soya", "soy flour", "soy protein",
+    "soy protein isolate", "soya protein", "textured vegetable protein", "tofu",
+    "tempeh", "edamame", "soy milk", "soya milk", "peanut", "peanut butter",
+    "groundnut", "almond", "almond flour", "ground almonds", "almond milk",
+    "cashew", "walnut", "pecan", "hazelnut", "pistachio", "macadamia",
+    "brazil nut", "pine nut", "chestnut", "coconut", "desiccated coconut",
+    "coconut milk", "coconut cream", "coconut flour", "sesame", "sesame seed",
+    "tahini", "sunflower seed", "pumpkin seed", "flaxseed", "linseed",
+    "chia seed", "hemp seed", "poppy seed", "mustard seed", "nigella seed",
+    "fennel seed", "caraway seed", "melon seed", "watermelon seed",
+    # vegetables
+    "vegetable", "vegetables", "mixed vegetables", "potato", "sweet potato",
+    "yam", "carrot", "onion", "red onion", "spring onion", "shallot", "leek",
+    "garlic", "ginger", "tomato", "cherry tomato", "tomato paste",
+    "tomato puree", "sun dried tomato", "cucumber", "lettuce", "spinach",
+    "kale", "cabbage", "red cabbage", "chinese cabbage", "bok choy",
+    "pak choi", "broccoli", "cauliflower", "brussels sprout", "celery",
+    "celeriac", "fennel", "asparagus", "artichoke", "aubergine", "eggplant",
+    "courgette", "zucchini", "squash", "butternut squash", "pumpkin",
+    "marrow", "okra", "bell pepper", "pepper", "red pepper", "green pepper",
+    "yellow pepper", "capsicum", "chili", "chilli", "chili pepper",
+    "jalapeno", "habanero", "green bean", "runner bean", "sugar snap pea",
+    "mangetout", "beetroot", "beet", "radish", "turnip", "swede", "parsnip",
+    "kohlrabi", "watercress", "rocket", "arugula", "endive", "chicory",
+    "radicchio", "chard", "swiss chard", "mushroom", "button mushroom",
+    "shiitake", "oyster mushroom", "portobello", "porcini", "truffle",
+    "sweetcorn", "corn on the cob", "bamboo shoot", "bean sprout",
+    "water chestnut", "lotus root", "taro", "plantain", "avocado", "olive",
+    "black olive", "green olive", "caper", "seaweed", "nori", "kelp", "kombu",
+    "wakame", "agar", "agar agar", "spirulina", "chlorella", "moringa",
+    # fruit
+    "fruit", "apple", "pear", "banana", "orange", "lemon", "lime",
+    "grapefruit", "mandarin", "tangerine", "clementine", "satsuma", "grape",
+    "raisin", "sultana", "currant", "blackcurrant", "redcurrant",
+    "strawberry", "raspberry", "blueberry", "blackberry", "cranberry",
+    "gooseberry", "cherry", "sour cherry", "plum", "prune", "apricot",
+    "dried apricot", "peach", "nectarine", "mango", "pineapple", "papaya",
+    "guava", "passion fruit", "kiwi", "kiwifruit", "melon", "watermelon",
+    "cantaloupe", "honeydew", "pomegranate", "fig", "date", "medjool date",
+    "lychee", "longan", "rambutan", "jackfruit", "durian", "persimmon",
+    "quince", "rhubarb", "elderberry", "acai", "goji berry", "mulberry",
+    "tamarind", "dragon fruit", "star fruit", "coconut water", "apple juice",
+    "orange juice", "grape juice", "lemon juice", "lime juice",
+    "fruit juice", "fruit puree", "fruit concentrate", "apple puree",
+    "orange peel", "lemon zest", "candied peel", "mixed peel",
+    # herbs and spices
+    "salt", "sea salt", "rock salt", "table salt", "iodised salt",
+    "iodized salt", "black salt", "himalayan salt", "black pepper",
+    "white pepper", "pepper corn", "peppercorn", "cumin", "coriander",
+    "turmeric", "paprika", "smoked paprika", "cayenne", "cayenne pepper",
+    "chili powder", "chilli powder", "chili flakes", "chilli flakes",
+    "cinnamon", "cassia", "clove", "cardamom", "nutmeg", "mace", "allspice",
+    "star anise", "anise", "aniseed", "fenugreek", "saffron", "sumac",
+    "za'atar", "zaatar", "garam masala", "curry powder", "five spice",
+    "ras el hanout", "baharat", "mixed spice", "spice", "spices",
+    "mixed herbs", "herb", "herbs", "basil", "oregano", "thyme", "rosemary",
+    "sage", "parsley", "mint", "dill", "tarragon", "chive", "bay leaf",
+    "curry leaf", "lemongrass", "galangal", "kaffir lime leaf", "marjoram",
+    "savory", "chervil", "lovage", "sorrel", "horseradish", "wasabi",
+    "mustard", "mustard powder", "english mustard", "dijon mustard",
+    "vanilla", "vanilla bean", "vanilla pod", "vanillin", "vanilla powder",
+    "cocoa", "cocoa powder", "cocoa butter", "cocoa mass", "cocoa solids",
+    "cacao", "cocoa bean", "carob", "coffee",
+    "instant coffee", "tea", "green tea", "black tea", "herbal tea",
+    "rooibos", "chamomile", "hibiscus", "matcha", "garlic powder",
+    "onion powder", "ginger powder", "dried onion", "dried garlic",
+    "celery salt", "celery seed", "asafoetida", "amchur", "mango powder",
+    "kalonji", "ajwain", "carom seed",
+    # oils and fats
+    "vegetable oil", "sunflower oil", "rapeseed oil", "canola oil",
+    "olive oil", "extra virgin olive oil", "palm oil", "palm kernel oil",
+    "palm fat", "coconut oil", "corn oil", "soybean oil", "soya oil",
+    "groundnut oil", "peanut oil", "sesame oil", "toasted sesame oil",
+    "cottonseed oil", "safflower oil", "rice bran oil", "grapeseed oil",
+    "avocado oil", "walnut oil", "hazelnut oil", "linseed oil",
+    "flaxseed oil", "mustard oil", "shea butter", "vegetable fat",
+    "hydrogenated vegetable oil", "vegetable shortening", "margarine",
+    "vegetable margarine", "vegetable ghee",
+    # sugars and sweeteners
+    "sugar", "cane sugar", "beet sugar", "brown sugar", "caster sugar",
+    "icing sugar", "powdered sugar", "granulated sugar", "demerara sugar",
+    "muscovado sugar", "raw sugar", "palm sugar", "coconut sugar", "jaggery",
+    "molasses", "treacle", "golden syrup", "honey", "maple syrup",
+    "agave syrup", "agave nectar", "date syrup", "corn syrup",
+    "glucose syrup", "glucose", "dextrose", "fructose", "sucrose",
+    "maltose", "maltodextrin", "dextrin", "invert sugar", "invert syrup",
+    "rice syrup", "brown rice syrup", "high fructose corn syrup",
+    "glucose fructose syrup", "fructose syrup", "isoglucose", "stevia",
+    "steviol glycosides", "erythritol", "xylitol", "sorbitol", "maltitol",
+    "mannitol", "isomalt", "sugar alcohol", "sucralose", "aspartame",
+    "acesulfame potassium", "acesulfame k", "saccharin", "monk fruit",
+    "trehalose", "tagatose", "allulose", "polydextrose", "inulin",
+    "oligofructose", "chicory root fibre", "chicory root fiber",
+    # baking and leavening
+    "yeast", "dried yeast", "instant yeast", "baker's yeast",
+    "nutritional yeast", "yeast extract", "baking powder", "baking soda",
+    "bicarbonate of soda", "sodium bicarbonate", "cream of tartar",
+    "raising agent", "raising agents", "leavening agent", "corn syrup solids",
+    # acids, salts and minerals
+    "citric acid", "lactic acid", "malic acid", "tartaric acid",
+    "acetic acid", "ascorbic acid", "fumaric acid", "phosphoric acid",
+    "sorbic acid", "benzoic acid", "propionic acid", "sodium citrate",
+    "potassium citrate", "calcium citrate", "sodium lactate",
+    "calcium lactate", "potassium sorbate", "sodium benzoate",
+    "calcium propionate", "sodium propionate", "sodium chloride",
+    "potassium chloride", "calcium chloride", "magnesium chloride",
+    "calcium carbonate", "magnesium carbonate", "sodium carbonate",
+    "potassium carbonate", "calcium phosphate", "dicalcium phosphate",
+    "tricalcium phosphate", "sodium phosphate", "disodium phosphate",
+    "trisodium phosphate", "sodium acid pyrophosphate", "potassium phosphate",
+    "calcium sulphate", "calcium sulfate", "magnesium sulphate",
+    "magnesium sulfate", "ferrous sulphate", "ferrous sulfate", "iron",
+    "reduced iron", "zinc oxide", "zinc sulphate", "potassium iodide",
+    "sodium selenite", "monosodium glutamate", "msg", "sodium metabisulphite",
+    "sodium metabisulfite", "sodium nitrite", "sodium nitrate",
+    "potassium nitrate", "sulphur dioxide", "sulfur dioxide", "silicon dioxide",
+    "titanium dioxide", "sodium hydroxide", "potassium hydroxide", "water",
+    "mineral water", "carbonated water", "sparkling water", "ice",
+    # vitamins
+    "vitamin a", "vitamin b1", "vitamin b2", "vitamin b3", "vitamin b5",
+    "vitamin b6", "vitamin b12", "vitamin c", "vitamin e", "vitamin k",
+    "thiamin", "thiamine", "riboflavin", "niacin", "nicotinamide",
+    "pantothenic acid", "pyridoxine", "folic acid", "folate", "biotin",
+    "cyanocobalamin", "tocopherol", "mixed tocopherols", "beta carotene",
+    # gums, fibres and thickeners
+    "pectin", "fruit pectin", "xanthan gum", "guar gum", "gum arabic",
+    "acacia gum", "locust bean gum", "carob bean gum", "carrageenan",
+    "gellan gum", "tara gum", "karaya gum", "tragacanth", "konjac",
+    "konjac gum", "alginate", "sodium alginate", "cellulose",
+    "microcrystalline cellulose", "methylcellulose", "carboxymethylcellulose",
+    "cellulose gum", "psyllium", "psyllium husk", "modified starch",
+    "modified maize starch", "modified corn starch", "modified tapioca starch",
+    "modified potato starch", "starch", "resistant starch", "soy lecithin",
+    "soya lecithin", "sunflower lecithin", "rapeseed lecithin", "lecithin",
+    # condiments and flavourings
+    "vinegar", "white vinegar", "distilled vinegar", "spirit vinegar",
+    "malt vinegar", "rice vinegar", "apple cider vinegar", "cider vinegar",
+    "coconut vinegar", "date vinegar", "ketchup", "tomato ketchup",
+    "hot sauce", "chili sauce", "sriracha", "harissa", "pesto",
+    "tomato sauce", "salsa", "chutney", "mango chutney", "pickle", "relish",
+    "mayonnaise", "hummus", "baba ganoush", "tahini sauce", "soy sauce",
+    "tamari", "miso", "liquid smoke", "smoke flavouring", "rose water",
+    "orange blossom water", "lemon extract", "peppermint oil",
+    # misc
+    "chocolate chips", "sprinkles", "coconut flakes", "oat milk", "rice milk",
+    "jam", "marmalade", "fruit jam", "cornflakes", "tofu skin", "ginger ale",
+    "blood orange", "scotch bonnet", "snake fruit", "monkey nut",
+    "halal gelatin", "halal gelatine", "bitter orange", "bitter melon",
+    "bitter gourd",
+)
+
+HARAM_TERMS = (
+    # swine
+    "pork", "pig", "pigs", "swine", "hog", "boar", "wild boar", "piglet",
+    "sow", "porcine", "pork meat", "pork fat", "pig fat", "pork rind",
+    "pork crackling", "pork belly", "pork loin", "pork chop", "pork shoulder",
+    "pork mince", "minced pork", "ground pork", "pulled pork", "pork sausage",
+    "pork gelatin", "pork gelatine", "porcine gelatin", "porcine gelatine",
+    "pork collagen", "porcine collagen", "pork broth", "pork stock",
+    "pork lard", "pork skin", "pork blood", "pork liver", "pork ribs",
+    "spare ribs", "lard", "leaf lard", "bacon", "bacon bits", "streaky bacon",
+    "back bacon", "smoked bacon", "pancetta", "prosciutto", "parma ham",
+    "serrano ham", "jamon", "jamon iberico", "ham", "smoked ham",
+    "cooked ham", "honey ham", "gammon", "ham hock", "mortadella",
+    "capocollo", "coppa", "guanciale", "lardon", "lardons", "chorizo",
+    "nduja", "andouille", "bratwurst", "kielbasa", "cotechino", "zampone",
+    "chicharron", "chicharrones", "char siu", "lap cheong", "speck",
+    "carnitas", "pig trotters", "pig's trotters",
+    "pig feet", "pig ear", "pig skin", "pork scratchings", "black pudding",
+    "blood sausage", "blood pudding", "morcilla", "boudin noir", "blood",
+    "animal blood", "blood plasma", "dried blood", "blood meal",
+    # alcoholic beverages
+    "alcohol", "ethyl alcohol", "alcoholic beverage", "liquor", "spirits",
+    "wine", "red wine", "white wine", "rose wine", "cooking wine",
+    "rice wine", "shaoxing wine", "fortified wine", "sparkling wine",
+    "champagne", "prosecco", "cava", "sherry", "port", "port wine",
+    "madeira", "marsala", "vermouth", "beer", "lager", "ale", "stout",
+    "porter", "cider", "hard cider", "perry", "mead", "sake",
+    "soju", "shochu", "baijiu", "rum", "dark rum", "white rum", "spiced rum",
+    "vodka", "gin", "whisky", "whiskey", "bourbon", "scotch", "brandy",
+    "cognac", "armagnac", "calvados", "grappa", "tequila", "mezcal", "absinthe",
+    "ouzo", "raki", "arak", "schnapps", "kirsch", "liqueur", "amaretto",
+    "triple sec", "cointreau", "grand marnier", "kahlua", "baileys",
+    "irish cream liqueur", "coffee liqueur", "cherry liqueur",
+    "orange liqueur", "creme de menthe", "limoncello", "sambuca", "malibu",
+    "rum flavouring with alcohol", "beer batter", "wine sauce",
+    "red wine sauce", "beer bread", "rum raisin", "rum essence",
+    "wine jelly", "brandy butter", "brandy sauce", "rum sauce",
+    # other prohibited animals
+    "dog meat", "dog", "cat meat", "donkey meat", "donkey", "mule",
+    "snake", "crocodile", "alligator", "frog", "frog legs", "monkey",
+    "carrion", "dead animal",
+)
+
+QUESTIONABLE_TERMS = (
+    # animal derivatives with unspecified source
+    "gelatin", "gelatine", "beef gelatin", "beef gelatine", "bovine gelatin",
+    "bovine gelatine", "gelatin hydrolysate", "hydrolysed collagen",
+    "hydrolyzed collagen", "collagen", "collagen peptides", "bovine collagen",
+    "marine collagen", "isinglass", "animal fat", "animal shortening",
+    "shortening", "tallow", "beef tallow", "suet", "beef suet", "beef fat",
+    "chicken fat", "dripping", "beef dripping", "schmaltz", "animal oil",
+    "bone char", "bone phosphate", "bone meal", "animal rennet", "rennet",
+    "calf rennet", "microbial rennet", "enzyme", "enzymes", "enzyme modified",
+    "pepsin", "lipase", "protease", "chymosin", "trypsin", "amylase",
+    "lysozyme", "lactase", "whey", "whey powder", "whey protein",
+    "whey protein concentrate", "whey protein isolate", "sweet whey",
+    "demineralised whey", "demineralized whey", "whey permeate", "cheese",
+    "cheddar", "mozzarella", "parmesan", "parmigiano reggiano",
+    "grana padano", "pecorino", "gouda", "edam", "emmental", "gruyere",
+    "brie", "camembert", "feta", "halloumi", "blue cheese", "gorgonzola",
+    "roquefort", "stilton", "manchego", "provolone", "monterey jack",
+    "colby", "havarti", "processed cheese", "cheese powder", "cheese sauce",
+    "cheese flavour", "cheese flavor",
+    # emulsifiers and fatty acid derivatives
+    "emulsifier", "emulsifiers", "mono and diglycerides",
+    "mono and diglycerides of fatty acids", "monoglycerides", "diglycerides",
+    "glyceryl monostearate", "glycerol monostearate", "glycerin", "glycerine",
+    "glycerol", "vegetable glycerin", "stearic acid", "stearate",
+    "magnesium stearate", "calcium stearate", "sodium stearate",
+    "sodium stearoyl lactylate", "calcium stearoyl lactylate",
+    "polysorbate", "polysorbate 20", "polysorbate 60", "polysorbate 80",
+    "sorbitan monostearate", "sorbitan tristearate", "fatty acids",
+    "fatty acid esters", "polyglycerol polyricinoleate", "triacetin",
+    "glyceryl triacetate", "oleic acid", "palmitic acid",
+    "datem", "ssl", "pgpr",
+    # flavourings and colours
+    "flavoring", "flavouring", "flavorings", "flavourings", "natural flavor",
+    "natural flavour", "natural flavors", "natural flavours",
+    "natural flavoring", "natural flavouring", "artificial flavor",
+    "artificial flavour", "artificial flavoring", "artificial flavouring",
+    "flavor", "flavour", "flavor enhancer", "flavour enhancer",
+    "smoke flavor", "meat flavor", "meat flavour", "beef flavor",
+    "beef flavour", "chicken flavor", "chicken flavour", "bacon flavor",
+    "bacon flavour", "ham flavor", "ham flavour", "pork flavor",
+    "pork flavour", "rum flavor", "rum flavour", "brandy flavor",
+    "brandy flavour", "wine flavor", "wine flavour", "vanilla extract",
+    "vanilla essence", "pure vanilla extract", "vanilla flavoring",
+    "vanilla flavouring", "almond extract", "carmine", "cochineal",
+    "cochineal extract", "carminic acid", "natural red 4", "crimson lake",
+    "shellac", "confectioner's glaze", "confectioners glaze", "glazing agent",
+    "beeswax glaze",
+    # amino acids and nucleotides
+    "l cysteine", "l-cysteine", "cysteine", "cystine", "l cystine",
+    "disodium inosinate", "disodium guanylate", "disodium ribonucleotides",
+    "calcium ribonucleotides", "inosinic acid", "guanylic acid",
+    # ambiguous meat products and alcohol-adjacent items
+    "sausage", "sausages", "salami", "pepperoni", "hot dog", "frankfurter",
+    "wiener", "hot dog sausage", "luncheon meat", "deli meat", "cold cuts",
+    "pate", "pâté", "foie gras", "meat extract", "meat stock",
+    "stock cube", "bouillon", "bouillon cube", "gravy", "gravy granules",
+    "turkey bacon", "beef bacon", "chicken bacon", "turkey ham",
+    "chicken ham", "beef ham", "beef salami", "chicken sausage",
+    "beef sausage", "lamb sausage", "turkey sausage", "beef pepperoni",
+    "chicken pepperoni", "halal sausage", "mirin", "cooking sake",
+    "wine vinegar", "red wine vinegar", "white wine vinegar",
+    "balsamic vinegar", "sherry vinegar", "champagne vinegar",
+    "rice wine vinegar", "non alcoholic beer", "alcohol free beer",
+    "alcohol free wine", "dealcoholised wine", "dealcoholized wine",
+    "kombucha", "kvass", "root beer", "ginger beer", "vanilla sugar",
+    "horse", "horse meat", "horsemeat", "shellfish", "shrimp", "prawn",
+    "prawns", "crab", "lobster", "crayfish", "crawfish", "langoustine",
+    "scampi", "clam", "clams", "oyster", "oysters", "mussel", "mussels",
+    "scallop", "scallops", "cockle", "squid", "calamari", "octopus",
+    "cuttlefish", "snail", "escargot", "oyster sauce", "worcestershire sauce",
+    "caesar dressing", "marshmallow", "marshmallows", "gummy bears",
+    "gummies", "jelly", "jello", "jelly sweets", "wine gums", "marzipan",
+    "chewing gum", "gum base", "l carnitine", "carnitine", "chondroitin",
+    "glucosamine", "hyaluronic acid", "vitamin d3", "cholecalciferol",
+    "lanolin", "omega 3", "dha", "civet", "castoreum", "musk",
+    "natural colour", "natural color", "colour", "color", "colouring",
+    "coloring", "animal protein", "hydrolysed animal protein",
+    "hydrolyzed animal protein", "hydrolysed protein", "hydrolyzed protein",
+    "milk chocolate", "white chocolate", "chocolate", "ice cream",
+    "frozen yogurt", "cheesecake", "tiramisu", "apple cider", "scotch egg",
+    "beef chorizo", "chicken chorizo", "halal chorizo",
+)
+
+MODIFIER_WORDS = (
+    "fresh", "frozen", "dried", "dry", "raw", "cooked", "organic", "whole",
+    "ground", "chopped", "sliced", "diced", "minced", "grated", "crushed",
+    "shredded", "powdered", "powder", "roasted", "toasted", "boiled",
+    "steamed", "baked", "grilled", "fried", "smoked", "peeled", "unpeeled",
+    "unsalted", "salted", "sweetened", "unsweetened", "pure", "extra",
+    "virgin", "refined", "unrefined", "light", "low", "reduced", "fat",
+    "free", "range", "cold", "pressed", "baby", "large", "small", "medium",
+    "red", "green", "yellow", "white", "brown", "golden", "skinless",
+    "boneless", "fillet", "fillets", "breast", "thigh", "leg", "wing",
+    "wings", "mince", "flakes", "flake", "juice", "paste", "puree",
+    "concentrate", "concentrated", "pieces", "piece", "chunks", "chunk",
+    "cubes", "cube", "slices", "slice", "halves", "halved", "quartered",
+    "canned", "tinned", "bottled", "pickled", "marinated", "seasoned",
+    "plain", "natural", "instant", "fortified", "enriched", "wholegrain",
+    "wholemeal", "multigrain", "mixed", "assorted", "blanched", "pitted",
+    "stoned", "seedless", "ripe", "young", "mature", "lean", "extra lean",
+    "premium", "finest", "fine", "coarse", "coarsely", "finely", "freshly",
+    "of", "and", "in", "with", "a", "the", "or", "&", "style", "halal",
+    "certified", "zabiha", "kosher", "vegan", "vegetarian", "plant", "based",
+)
+
+# Words that turn a Haram term into a substitute ("vegetarian bacon", "soy ham")
+SUBSTITUTE_WORDS = (
+    "vegan", "vegetarian", "veggie", "plant", "based", "meatless", "imitation",
+    "faux", "mock", "halal", "zabiha",
+)
+
+E_NUMBERS = {
+    # colours
+    "e100": ("Halal", "curcumin"),
+    "e101": ("Halal", "riboflavin"),
+    "e101a": ("Halal", "riboflavin 5 phosphate"),
+    "e102": ("Halal", "tartrazine"),
+    "e104": ("Halal", "quinoline yellow"),
+    "e110": ("Halal", "sunset yellow"),
+    "e120": ("Questionable", "carmine"),
+    "e122": ("Halal", "carmoisine"),
+    "e123": ("Halal", "amaranth"),
+    "e124": ("Halal", "ponceau 4r"),
+    "e127": ("Halal", "erythrosine"),
+    "e128": ("Halal", "red 2g"),
+    "e129": ("Halal", "allura red"),
+    "e131": ("Halal", "patent blue v"),
+    "e132": ("Halal", "indigo carmine"),
+    "e133": ("Halal", "brilliant blue"),
+    "e140": ("Halal", "chlorophylls"),
+    "e141": ("Halal", "copper chlorophyll"),
+    "e142": ("Halal", "green s"),
+    "e150a": ("Halal", "plain caramel"),
+    "e150b": ("Halal", "caustic sulphite caramel"),
+    "e150c": ("Halal", "ammonia caramel"),
+    "e150d": ("Halal", "sulphite ammonia caramel"),
+    "e151": ("Halal", "brilliant black"),
+    "e153": ("Questionable", "vegetable carbon"),
+    "e155": ("Halal", "brown ht"),
+    "e160a": ("Halal", "carotenes"),
+    "e160b": ("Halal", "annatto"),
+    "e160c": ("Halal", "paprika extract"),
+    "e160d": ("Halal", "lycopene"),
+    "e160e": ("Halal", "beta apo 8 carotenal"),
+    "e160f": ("Halal", "ethyl ester of beta apo 8 carotenoic acid"),
+    "e161b": ("Halal", "lutein"),
+    "e161g": ("Halal", "canthaxanthin"),
+    "e162": ("Halal", "beetroot red"),
+    "e163": ("Halal", "anthocyanins"),
+    "e170": ("Halal", "calcium carbonate"),
+    "e171": ("Halal", "titanium dioxide"),
+    "e172": ("Halal", "iron oxides"),
+    "e173": ("Halal", "aluminium"),
+    "e174": ("Halal", "silver"),
+    "e175": ("Halal", "gold"),
+    "e180": ("Halal", "litholrubine bk"),
+    # preservatives
+    "e200": ("Halal", "sorbic acid"),
+    "e202": ("Halal", "potassium sorbate"),
+    "e203": ("Halal", "calcium sorbate"),
+    "e210": ("Halal", "benzoic acid"),
+    "e211": ("Halal", "sodium benzoate"),
+    "e212": ("Halal", "potassium benzoate"),
+    "e213": ("Halal", "calcium benzoate"),
+    "e214": ("Halal", "ethyl p hydroxybenzoate"),
+    "e215": ("Halal", "sodium ethyl p hydroxybenzoate"),
+    "e218": ("Halal", "methyl p hydroxybenzoate"),
+    "e219": ("Halal", "sodium methyl p hydroxybenzoate"),
+    "e220": ("Halal", "sulphur dioxide"),
+    "e221": ("Halal", "sodium sulphite"),
+    "e222": ("Halal", "sodium hydrogen sulphite"),
+    "e223": ("Halal", "sodium metabisulphite"),
+    "e224": ("Halal", "potassium metabisulphite"),
+    "e226": ("Halal", "calcium sulphite"),
+    "e227": ("Halal", "calcium hydrogen sulphite"),
+    "e228": ("Halal", "potassium hydrogen sulphite"),
+    "e234": ("Halal", "nisin"),
+    "e235": ("Halal", "natamycin"),
+    "e239": ("Halal", "hexamethylene tetramine"),
+    "e242": ("Halal", "dimethyl dicarbonate"),
+    "e249": ("Halal", "potassium nitrite"),
+    "e250": ("Halal", "sodium nitrite"),
+    "e251": ("Halal", "sodium nitrate"),
+    "e252": ("Halal", "potassium nitrate"),
+    "e260": ("Halal", "acetic acid"),
+    "e261": ("Halal", "potassium acetate"),
+    "e262": ("Halal", "sodium acetates"),
+    "e263": ("Halal", "calcium acetate"),
+    "e270": ("Halal", "lactic acid"),
+    "e280": ("Halal", "propionic acid"),
+    "e281": ("Halal", "sodium propionate"),
+    "e282": ("Halal", "calcium propionate"),
+    "e283": ("Halal", "potassium propionate"),
+    "e284": ("Halal", "boric acid"),
+    "e285": ("Halal", "sodium tetraborate"),
+    "e290": ("Halal", "carbon dioxide"),
+    "e296": ("Halal", "malic acid"),
+    "e297": ("Halal", "fumaric acid"),
+    # antioxidants and acidity regulators
+    "e300": ("Halal", "ascorbic acid"),
+    "e301": ("Halal", "sodium ascorbate"),
+    "e302": ("Halal", "calcium ascorbate"),
+    "e304": ("Questionable", "fatty acid esters of ascorbic acid"),
+    "e306": ("Halal", "tocopherol rich extract"),
+    "e307": ("Halal", "alpha tocopherol"),
+    "e308": ("Halal", "gamma tocopherol"),
+    "e309": ("Halal", "delta tocopherol"),
+    "e310": ("Halal", "propyl gallate"),
+    "e315": ("Halal", "erythorbic acid"),
+    "e316": ("Halal", "sodium erythorbate"),
+    "e319": ("Halal", "tertiary butylhydroquinone"),
+    "e320": ("Halal", "butylated hydroxyanisole"),
+    "e321": ("Halal", "butylated hydroxytoluene"),
+    "e322": ("Halal", "lecithins"),
+    "e325": ("Halal", "sodium lactate"),
+    "e326": ("Halal", "potassium lactate"),
+    "e327": ("Halal", "calcium lactate"),
+    "e330": ("Halal", "citric acid"),
+    "e331": ("Halal", "sodium citrates"),
+    "e332": ("Halal", "potassium citrates"),
+    "e333": ("Halal", "calcium citrates"),
+    "e334": ("Halal", "tartaric acid"),
+    "e335": ("Halal", "sodium tartrates"),
+    "e336": ("Halal", "potassium tartrates"),
+    "e337": ("Halal", "sodium potassium tartrate"),
+    "e338": ("Halal", "phosphoric acid"),
+    "e339": ("Halal", "sodium phosphates"),
+    "e340": ("Halal", "potassium phosphates"),
+    "e341": ("Halal", "calcium phosphates"),
+    "e343": ("Halal", "magnesium phosphates"),
+    "e350": ("Halal", "sodium malates"),
+    "e351": ("Halal", "potassium malate"),
+    "e352": ("Halal", "calcium malates"),
+    "e353": ("Halal", "metatartaric acid"),
+    "e354": ("Halal", "calcium tartrate"),
+    "e355": ("Halal", "adipic acid"),
+    "e356": ("Halal", "sodium adipate"),
+    "e357": ("Halal", "potassium adipate"),
+    "e363": ("Halal", "succinic acid"),
+    "e380": ("Halal", "triammonium citrate"),
+    "e385": ("Halal", "calcium disodium edta"),
+    "e392": ("Halal", "extracts of rosemary"),
+    # thickeners, stabilisers and emulsifiers
+    "e400": ("Halal", "alginic acid"),
+    "e401": ("Halal", "sodium alginate"),
+    "e402": ("Halal", "potassium alginate"),
+    "e403": ("Halal", "ammonium alginate"),
+    "e404": ("Halal", "calcium alginate"),
+    "e405": ("Halal", "propane 1 2 diol alginate"),
+    "e406": ("Halal", "agar"),
+    "e407": ("Halal", "carrageenan"),
+    "e407a": ("Halal", "processed eucheuma seaweed"),
+    "e410": ("Halal", "locust bean gum"),
+    "e412": ("Halal", "guar gum"),
+    "e413": ("Halal", "tragacanth"),
+    "e414": ("Halal", "acacia gum"),
+    "e415": ("Halal", "xanthan gum"),
+    "e416": ("Halal", "karaya gum"),
+    "e417": ("Halal", "tara gum"),
+    "e418": ("Halal", "gellan gum"),
+    "e420": ("Halal", "sorbitol"),
+    "e421": ("Halal", "mannitol"),
+    "e422": ("Questionable", "glycerol"),
+    "e425": ("Halal", "konjac"),
+    "e426": ("Halal", "soybean hemicellulose"),
+    "e427": ("Halal", "cassia gum"),
+    "e430": ("Questionable", "polyoxyethylene 8 stearate"),
+    "e431": ("Questionable", "polyoxyethylene 40 stearate"),
+    "e432": ("Questionable", "polysorbate 20"),
+    "e433": ("Questionable", "polysorbate 80"),
+    "e434": ("Questionable", "polysorbate 40"),
+    "e435": ("Questionable", "polysorbate 60"),
+    "e436": ("Questionable", "polysorbate 65"),
+    "e440": ("Halal", "pectins"),
+    "e441": ("Questionable", "gelatine"),
+    "e442": ("Questionable", "ammonium phosphatides"),
+    "e444": ("Halal", "sucrose acetate isobutyrate"),
+    "e445": ("Halal", "glycerol esters of wood rosins"),
+    "e450": ("Halal", "diphosphates"),
+    "e451": ("Halal", "triphosphates"),
+    "e452": ("Halal", "polyphosphates"),
+    "e459": ("Halal", "beta cyclodextrin"),
+    "e460": ("Halal", "cellulose"),
+    "e461": ("Halal", "methyl cellulose"),
+    "e462": ("Halal", "ethyl cellulose"),
+    "e463": ("Halal", "hydroxypropyl cellulose"),
+    "e464": ("Halal", "hydroxypropyl methyl cellulose"),
+    "e465": ("Halal", "ethyl methyl cellulose"),
+    "e466": ("Halal", "carboxymethyl cellulose"),
+    "e468": ("Halal", "crosslinked sodium carboxymethyl cellulose"),
+    "e469": ("Halal", "enzymatically hydrolysed carboxymethylcellulose"),
+    "e470a": ("Questionable", "sodium, potassium and calcium salts of fatty acids"),
+    "e470b": ("Questionable", "magnesium salts of fatty acids"),
+    "e471": ("Questionable", "mono and diglycerides of fatty acids"),
+    "e472a": ("Questionable", "acetic acid esters of mono and diglycerides"),
+    "e472b": ("Questionable", "lactic acid esters of mono and diglycerides"),
+    "e472c": ("Questionable", "citric acid esters of mono and diglycerides"),
+    "e472d": ("Questionable", "tartaric acid esters of mono and diglycerides"),
+    "e472e": ("Questionable", "diacetyl tartaric acid esters of mono and diglycerides"),
+    "e472f": ("Questionable", "mixed acetic and tartaric acid esters"),
+    "e473": ("Questionable", "sucrose esters of fatty acids"),
+    "e474": ("Questionable", "sucroglycerides"),
+    "e475": ("Questionable", "polyglycerol esters of fatty acids"),
+    "e476": ("Questionable", "polyglycerol polyricinoleate"),
+    "e477": ("Questionable", "propane 1 2 diol esters of fatty acids"),
+    "e478": ("Questionable", "lactylated fatty acid esters"),
+    "e479b": ("Questionable", "thermally oxidised soya bean oil"),
+    "e481": ("Questionable", "sodium stearoyl 2 lactylate"),
+    "e482": ("Questionable", "calcium stearoyl 2 lactylate"),
+    "e483": ("Questionable", "stearyl tartrate"),
+    "e491": ("Questionable", "sorbitan monostearate"),
+    "e492": ("Questionable", "sorbitan tristearate"),
+    "e493": ("Questionable", "sorbitan monolaurate"),
+    "e494": ("Questionable", "sorbitan monooleate"),
+    "e495": ("Questionable", "sorbitan monopalmitate"),
+    # acidity regulators and anti-caking agents
+    "e500": ("Halal", "sodium carbonates"),
+    "e501": ("Halal", "potassium carbonates"),
+    "e503": ("Halal", "ammonium carbonates"),
+    "e504": ("Halal", "magnesium carbonates"),
+    "e507": ("Halal", "hydrochloric acid"),
+    "e508": ("Halal", "potassium chloride"),
+    "e509": ("Halal", "calcium chloride"),
+    "e511": ("Halal", "magnesium chloride"),
+    "e512": ("Halal", "stannous chloride"),
+    "e513": ("Halal", "sulphuric acid"),
+    "e514": ("Halal", "sodium sulphates"),
+    "e515": ("Halal", "potassium sulphates"),
+    "e516": ("Halal", "calcium sulphate"),
+    "e517": ("Halal", "ammonium sulphate"),
+    "e520": ("Halal", "aluminium sulphate"),
+    "e524": ("Halal", "sodium hydroxide"),
+    "e525": ("Halal", "potassium hydroxide"),
+    "e526": ("Halal", "calcium hydroxide"),
+    "e527": ("Halal", "ammonium hydroxide"),
+    "e528": ("Halal", "magnesium hydroxide"),
+    "e529": ("Halal", "calcium oxide"),
+    "e530": ("Halal", "magnesium oxide"),
+    "e535": ("Halal", "sodium ferrocyanide"),
+    "e536": ("Halal", "potassium ferrocyanide"),
+    "e538": ("Halal", "calcium ferrocyanide"),
+    "e541": ("Halal", "sodium aluminium phosphate"),
+    "e542": ("Questionable", "bone phosphate"),
+    "e551": ("Halal", "silicon dioxide"),
+    "e552": ("Halal", "calcium silicate"),
+    "e553a": ("Halal", "magnesium silicate"),
+    "e553b": ("Halal", "talc"),
+    "e554": ("Halal", "sodium aluminium silicate"),
+    "e555": ("Halal", "potassium aluminium silicate"),
+    "e556": ("Halal", "calcium aluminium silicate"),
+    "e558": ("Halal", "bentonite"),
+    "e559": ("Halal", "aluminium silicate"),
+    "e570": ("Questionable", "stearic acid"),
+    "e572": ("Questionable", "magnesium stearate"),
+    "e574": ("Halal", "gluconic acid"),
+    "e575": ("Halal", "glucono delta lactone"),
+    "e576": ("Halal", "sodium gluconate"),
+    "e577": ("Halal", "potassium gluconate"),
+    "e578": ("Halal", "calcium gluconate"),
+    "e579": ("Halal", "ferrous gluconate"),
+    "e585": ("Halal", "ferrous lactate"),
+    # flavour enhancers
+    "e620": ("Halal", "glutamic acid"),
+    "e621": ("Halal", "monosodium glutamate"),
+    "e622": ("Halal", "monopotassium glutamate"),
+    "e623": ("Halal", "calcium diglutamate"),
+    "e624": ("Halal", "monoammonium glutamate"),
+    "e625": ("Halal", "magnesium diglutamate"),
+    "e626": ("Questionable", "guanylic acid"),
+    "e627": ("Questionable", "disodium guanylate"),
+    "e628": ("Questionable", "dipotassium guanylate"),
+    "e629": ("Questionable", "calcium guanylate"),
+    "e630": ("Questionable", "inosinic acid"),
+    "e631": ("Questionable", "disodium inosinate"),
+    "e632": ("Questionable", "dipotassium inosinate"),
+    "e633": ("Questionable", "calcium inosinate"),
+    "e634": ("Questionable", "calcium ribonucleotides"),
+    "e635": ("Questionable", "disodium ribonucleotides"),
+    "e640": ("Halal", "glycine"),
+    "e650": ("Halal", "zinc acetate"),
+    # glazing agents, gases and sweeteners
+    "e900": ("Halal", "dimethyl polysiloxane"),
+    "e901": ("Halal", "beeswax"),
+    "e902": ("Halal", "candelilla wax"),
+    "e903": ("Halal", "carnauba wax"),
+    "e904": ("Questionable", "shellac"),
+    "e905": ("Halal", "microcrystalline wax"),
+    "e907": ("Halal", "hydrogenated poly 1 decene"),
+    "e912": ("Halal", "montan acid esters"),
+    "e914": ("Halal", "oxidised polyethylene wax"),
+    "e920": ("Questionable", "l cysteine"),
+    "e921": ("Questionable", "l cystine"),
+    "e927b": ("Halal", "carbamide"),
+    "e938": ("Halal", "argon"),
+    "e939": ("Halal", "helium"),
+    "e941": ("Halal", "nitrogen"),
+    "e942": ("Halal", "nitrous oxide"),
+    "e943a": ("Halal", "butane"),
+    "e943b": ("Halal", "isobutane"),
+    "e944": ("Halal", "propane"),
+    "e948": ("Halal", "oxygen"),
+    "e949": ("Halal", "hydrogen"),
+    "e950": ("Halal", "acesulfame k"),
+    "e951": ("Halal", "aspartame"),
+    "e952": ("Halal", "cyclamates"),
+    "e953": ("Halal", "isomalt"),
+    "e954": ("Halal", "saccharin"),
+    "e955": ("Halal", "sucralose"),
+    "e957": ("Halal", "thaumatin"),
+    "e959": ("Halal", "neohesperidine dc"),
+    "e960": ("Halal", "steviol glycosides"),
+    "e961": ("Halal", "neotame"),
+    "e962": ("Halal", "aspartame acesulfame salt"),
+    "e964": ("Halal", "polyglycitol syrup"),
+    "e965": ("Halal", "maltitol"),
+    "e966": ("Halal", "lactitol"),
+    "e967": ("Halal", "xylitol"),
+    "e968": ("Halal", "erythritol"),
+    "e969": ("Halal", "advantame"),
+    "e999": ("Halal", "quillaia extract"),
+    # additional chemicals
+    "e1100": ("Questionable", "amylase"),
+    "e1101": ("Questionable", "protease"),
+    "e1102": ("Halal", "glucose oxidase"),
+    "e1103": ("Halal", "invertase"),
+    "e1104": ("Questionable", "lipase"),
+    "e1105": ("Halal", "egg lysozyme"),
+    "e1200": ("Halal", "polydextrose"),
+    "e1201": ("Halal", "polyvinylpyrrolidone"),
+    "e1202": ("Halal", "polyvinylpolypyrrolidone"),
+    "e1203": ("Halal", "polyvinyl alcohol"),
+    "e1204": ("Halal", "pullulan"),
+    "e1404": ("Halal", "oxidised starch"),
+    "e1410": ("Halal", "monostarch phosphate"),
+    "e1412": ("Halal", "distarch phosphate"),
+    "e1413": ("Halal", "phosphated distarch phosphate"),
+    "e1414": ("Halal", "acetylated distarch phosphate"),
+    "e1420": ("Halal", "acetylated starch"),
+    "e1422": ("Halal", "acetylated distarch adipate"),
+    "e1440": ("Halal", "hydroxy propyl starch"),
+    "e1442": ("Halal", "hydroxy propyl distarch phosphate"),
+    "e1450": ("Halal", "starch sodium octenyl succinate"),
+    "e1451": ("Halal", "acetylated oxidised starch"),
+    "e1452": ("Halal", "starch aluminium octenyl succinate"),
+    "e1505": ("Halal", "triethyl citrate"),
+    "e1510": ("Questionable", "ethanol"),
+    "e1517": ("Questionable", "glyceryl diacetate"),
+    "e1518": ("Questionable", "glyceryl triacetate"),
+    "e1519": ("Halal", "benzyl alcohol"),
+    "e1520": ("Halal", "propylene glycol"),
+    "e1521": ("Halal", "polyethylene glycol"),
+}
+# fmt: on
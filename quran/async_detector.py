@@ -0,0 +1,566 @@
+import asyncio
+import contextvars
+import copy
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .backends import Backend, HTTPBackend
+from .batching import ItemTimeoutError
+from .cache import AsyncSingleFlight, VerdictCache
+from .halal_detector import (
+    HALAL_SCORES,
+    PACKED_SYSTEM_PROMPT,
+    SYSTEM_PROMPT,
+    SYSTEM_PROMPT_VERSION,
+    VERDICT_MAX_TOKENS,
+    VERDICT_PROMPT_VERSION,
+    VERDICT_SYSTEM_PROMPT,
+    HalalDetector,
+)
+from .label_parser import parse_label
+from .metrics import Metrics, instrumented
+from .resilience import CircuitBreaker
+from .results import (
+    FoodItemResult,
+    IngredientResult,
+    LabelAnalysis,
+    RecipeAnalysis,
+    Status,
+    VerdictResult,
+)
+from .scheduler import RequestScheduler, current_priority
+from .snapshot import VerdictSnapshot
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@instrumented
+class AsyncHalalDetector:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "openai",
+        cache: Optional[VerdictCache] = None,
+        max_concurrency: int = 50,
+        pool_size: int = 100,
+        timeout: float = 30.0,
+        use_lexicon: bool = True,
+        metrics: Optional[Metrics] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        failure_cache_ttl: float = 10.0,
+        backend: Optional[Backend] = None,
+        snapshot: Union[str, VerdictSnapshot, None] = None,
+        scheduler: Optional[RequestScheduler] = None,
+    ):
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncHalalDetector requires aiohttp: pip install quran[async]"
+            )
+        self._detector = HalalDetector(
+            api_key=api_key,
+            model=model,
+            cache=cache,
+            use_lexicon=use_lexicon,
+            metrics=metrics,
+            circuit_breaker=circuit_breaker,
+            failure_cache_ttl=failure_cache_ttl,
+            backend=backend,
+            snapshot=snapshot,
+            scheduler=scheduler,
+        )
+        self.max_concurrency = max_concurrency
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._session: Optional[Any] = None
+        self._wait_executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight: AsyncSingleFlight[Tuple[Dict, bool]] = AsyncSingleFlight()
+
+    @property
+    def base_url(self) -> str:
+        return self._detector.base_url
+
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        self._detector.base_url = value
+
+    @property
+    def cache(self) -> Optional[VerdictCache]:
+        return self._detector.cache
+
+    @property
+    def metrics(self) -> Metrics:
+        return self._detector.metrics
+
+    async def __aenter__(self) -> "AsyncHalalDetector":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._wait_executor is not None:
+            self._wait_executor.shutdown(wait=False)
+            self._wait_executor = None
+        self._detector.close()
+
+    def _get_session(self) -> Any:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"Content-Type": "application/json"},
+            )
+        return self._session
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _generate_ai_response(
+        self,
+        prompt: str,
+        context: str = "",
+        system_prompt: str = SYSTEM_PROMPT,
+        prompt_version: str = SYSTEM_PROMPT_VERSION,
+        max_tokens: Optional[int] = None,
+    ) -> Dict:
+        cache_key, cached = await self._off_loop(
+            self._cache_lookup, prompt, context, prompt_version
+        )
+        if cached is not None:
+            return cached
+
+        payload = self._detector._build_payload(
+            prompt, context, system_prompt, max_tokens
+        )
+        (ai_response, cacheable), shared = await self._in_flight.do(
+            cache_key, lambda: self._fetch_ai_response(payload)
+        )
+        if shared:
+            self.metrics.inc("coalesced_requests_total")
+            ai_response = copy.deepcopy(ai_response)
+        else:
+            await self._off_loop(self._cache_store, cache_key, ai_response, cacheable)
+        return ai_response
+
+    async def _off_loop(self, func: Callable[..., T], *args: Any) -> T:
+        # The persistent cache does blocking SQLite I/O; memory-only lookups
+        # are cheap enough to stay on the event loop.
+        if self._detector.cache is None:
+            return func(*args)
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(None, context.run, func, *args)
+
+    def _cache_lookup(
+        self, prompt: str, context: str, prompt_version: str
+    ) -> Tuple[str, Optional[Dict]]:
+        cache_key, cached = self._detector._cache_lookup(
+            prompt, context, prompt_version
+        )
+        if cached is None:
+            cached = self._detector._failure_lookup(cache_key)
+        return cache_key, cached
+
+    def _cache_store(self, cache_key: str, ai_response: Dict, cacheable: bool) -> None:
+        self._detector._cache_store(cache_key, ai_response, cacheable)
+        self._detector._failure_store(cache_key, ai_response)
+
+    async def _acquire_slot(self) -> None:
+        scheduler = self._detector.scheduler
+        level = current_priority()
+        if not scheduler.limited:
+            scheduler.acquire(level)
+            return
+
+        # The scheduler is shared with threads using the same detector, so the
+        # blocking wait runs on dedicated threads; the default executor may be
+        # needed by slot holders to finish their requests.
+        if self._wait_executor is None:
+            self._wait_executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="quran-scheduler"
+            )
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._wait_executor, scheduler.acquire, level)
+
+        def release_abandoned(done: "asyncio.Future[float]") -> None:
+            if not done.cancelled() and done.exception() is None:
+                scheduler.release()
+
+        try:
+            waited = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            future.add_done_callback(release_abandoned)
+            raise
+        self._detector._record_wait(level, waited)
+
+    async def _fetch_ai_response(self, payload: Dict) -> Tuple[Dict, bool]:
+        if not self._detector.circuit_breaker.allow():
+            return self._detector._circuit_open_response(), False
+
+        async with self._get_semaphore():
+            await self._acquire_slot()
+            started = time.perf_counter()
+            try:
+                return await asyncio.wait_for(
+                    self._request_ai_response(payload), self.timeout
+                )
+            except asyncio.CancelledError:
+                raise
+            except asyncio.TimeoutError:
+                self._detector._record_request("Timeout", time.perf_counter() - started)
+                self._detector._record_outcome(None)
+                error: Exception = asyncio.TimeoutError(
+                    f"Request timed out after {self.timeout}s"
+                )
+            except Exception as e:
+                self._detector._record_request(
+                    e.__class__.__name__, time.perf_counter() - started, error=e
+                )
+                self._detector._record_outcome(None)
+                error = e
+            finally:
+                self._detector.scheduler.release()
+        return self._detector._network_error_response(error), False
+
+    async def _request_ai_response(self, payload: Dict) -> Tuple[Dict, bool]:
+        backend = self._detector.backend
+        if not isinstance(backend, HTTPBackend):
+            started = time.perf_counter()
+            loop = asyncio.get_running_loop()
+            context = contextvars.copy_context()
+            result = await loop.run_in_executor(
+                None, context.run, backend.complete, payload
+            )
+            return self._detector._backend_response(
+                result,
+                time.perf_counter() - started,
+                self._detector._response_schema(payload),
+            )
+
+        session = self._get_session()
+        started = time.perf_counter()
+        async with session.post(
+            backend.url, json=backend.encode(payload), headers=backend.headers
+        ) as response:
+            body = await response.read()
+            self._detector._record_request(
+                response.status,
+                time.perf_counter() - started,
+                int(response.request_info.headers.get("Content-Length", 0)),
+                len(body),
+            )
+            self._detector._record_outcome(response.status)
+            text = body.decode(response.get_encoding(), errors="replace")
+            if response.status == 200:
+                return self._detector._parse_ai_text(
+                    backend.decode(text), self._detector._response_schema(payload)
+                )
+            return self._detector._http_error_response(response.status), False
+
+    async def detect_ingredient(
+        self, ingredient: str, context: str = ""
+    ) -> IngredientResult:
+        local_response = (
+            self._detector._local_response(ingredient) if not context else None
+        )
+        if local_response is not None:
+            return self._detector._ingredient_result(ingredient, local_response)
+
+        prompt = self._detector._ingredient_prompt(ingredient, context)
+        ai_response = await self._generate_ai_response(prompt, context)
+        return self._detector._ingredient_result(ingredient, ai_response)
+
+    async def detect_food_item(
+        self, food_name: str, preparation_method: str = "", region: str = ""
+    ) -> FoodItemResult:
+        if not preparation_method and not region:
+            local_response = self._detector._local_response(food_name)
+            if local_response is not None:
+                return self._detector._food_item_result(food_name, local_response)
+
+        prompt, context = self._detector._food_item_prompt(
+            food_name, preparation_method, region
+        )
+        ai_response = await self._generate_ai_response(prompt, context)
+        return self._detector._food_item_result(food_name, ai_response)
+
+    async def _gather(
+        self,
+        detect: Callable[[T], Awaitable[R]],
+        items: List[T],
+        on_error: Callable[[T, Dict], R],
+        timeout: Optional[float] = None,
+    ) -> List[R]:
+        async def run(item: T) -> R:
+            if timeout is None:
+                return await detect(item)
+            try:
+                return await asyncio.wait_for(detect(item), timeout)
+            except asyncio.TimeoutError:
+                raise ItemTimeoutError(f"Item timed out after {timeout}s") from None
+
+        outcomes = await asyncio.gather(
+            *(run(item) for item in items), return_exceptions=True
+        )
+        results: List[R] = []
+        for item, outcome in zip(items, outcomes):
+            if isinstance(outcome, Exception):
+                results.append(
+                    on_error(item, self._detector._item_error_response(outcome))
+                )
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results.append(outcome)
+        return results
+
+    async def batch_detect(
+        self,
+        items: List[str],
+        item_type: str = "ingredient",
+        timeout: Optional[float] = None,
+        packed: bool = False,
+    ) -> List[Union[IngredientResult, FoodItemResult]]:
+        if packed and item_type == "ingredient":
+            classified = await self.classify_ingredients(
+                items, timeout=timeout, packed=True
+            )
+            return [classified[item] for item in items]
+        if item_type == "ingredient":
+            return list(
+                await self._gather(
+                    self.detect_ingredient,
+                    items,
+                    self._detector._ingredient_result,
+                    timeout,
+                )
+            )
+        return list(
+            await self._gather(
+                self.detect_food_item, items, self._detector._food_item_result, timeout
+            )
+        )
+
+    async def _request_packed(
+        self, ingredients: List[str], context: str = ""
+    ) -> Tuple[Dict[str, Dict], Optional[Dict]]:
+        payload = self._detector._build_payload(
+            self._detector._packed_prompt(ingredients, context),
+            context,
+            PACKED_SYSTEM_PROMPT,
+        )
+        ai_response, _ = await self._fetch_ai_response(payload)
+        return self._detector._packed_verdicts(ai_response)
+
+    async def _detect_chunk(
+        self, chunk: List[str], context: str = ""
+    ) -> Dict[str, IngredientResult]:
+        verdicts, error_response = await self._request_packed(chunk, context)
+        if error_response is not None:
+            return {
+                i: self._detector._ingredient_result(i, error_response) for i in chunk
+            }
+
+        missing = [i for i in chunk if i.strip().lower() not in verdicts]
+        if 1 < len(missing) < len(chunk):
+            self.metrics.inc("fallbacks_total", kind="packed_retry")
+            retried, _ = await self._request_packed(missing, context)
+            verdicts.update(retried)
+
+        results: Dict[str, IngredientResult] = {}
+        singles = []
+        for ingredient in chunk:
+            verdict = verdicts.get(ingredient.strip().lower())
+            if verdict is None:
+                self.metrics.inc("fallbacks_total", kind="packed_single")
+                singles.append(ingredient)
+                continue
+            results[ingredient] = await self._off_loop(
+                self._detector._store_packed_verdict, ingredient, verdict, context
+            )
+        detected = await asyncio.gather(
+            *(self.detect_ingredient(i, context) for i in singles)
+        )
+        results.update(zip(singles, detected))
+        return {ingredient: results[ingredient] for ingredient in chunk}
+
+    async def _classify_packed(
+        self,
+        ingredients: List[str],
+        context: str = "",
+        chunk_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, IngredientResult]:
+        results, remaining = await self._off_loop(
+            self._detector._packed_local_results, ingredients, context
+        )
+        chunks = self._detector._packed_chunks(remaining, chunk_size)
+
+        def chunk_error(
+            chunk: List[str], response: Dict
+        ) -> Dict[str, IngredientResult]:
+            return {i: self._detector._ingredient_result(i, response) for i in chunk}
+
+        for chunk_results in await self._gather(
+            lambda chunk: self._detect_chunk(chunk, context),
+            chunks,
+            chunk_error,
+            timeout,
+        ):
+            results.update(chunk_results)
+        return results
+
+    async def classify_ingredients(
+        self,
+        ingredients: List[str],
+        context: str = "",
+        timeout: Optional[float] = None,
+        packed: bool = False,
+        chunk_size: Optional[int] = None,
+    ) -> Dict[str, IngredientResult]:
+        unique: Dict[str, str] = {}
+        for ingredient in ingredients:
+            unique.setdefault(ingredient.strip().lower(), ingredient)
+        unique_items = list(unique.values())
+        if packed:
+            packed_results = await self._classify_packed(
+                unique_items, context, chunk_size, timeout
+            )
+            detected = [packed_results[i] for i in unique_items]
+        else:
+            detected = await self._gather(
+                lambda i: self.detect_ingredient(i, context),
+                unique_items,
+                self._detector._ingredient_result,
+                timeout,
+            )
+        by_key = dict(zip(unique.keys(), detected))
+        return {i: by_key[i.strip().lower()] for i in ingredients}
+
+    async def check_ingredients_list(
+        self, ingredients: List[str], packed: bool = False
+    ) -> Dict[str, str]:
+        classified = await self.classify_ingredients(ingredients, packed=packed)
+        return {i: str(result.status) for i, result in classified.items()}
+
+    async def find_haram_ingredients(self, ingredients: List[str]) -> List[str]:
+        classified = await self.classify_ingredients(ingredients)
+        return self._detector._filter_by_status(ingredients, classified, Status.HARAM)
+
+    async def find_questionable_ingredients(self, ingredients: List[str]) -> List[str]:
+        classified = await self.classify_ingredients(ingredients)
+        return self._detector._filter_by_status(
+            ingredients, classified, Status.QUESTIONABLE
+        )
+
+    async def get_safe_ingredients(self, ingredients: List[str]) -> List[str]:
+        classified = await self.classify_ingredients(ingredients)
+        return self._detector._filter_by_status(ingredients, classified, Status.HALAL)
+
+    async def analyze_recipe(
+        self, recipe_name: str, ingredients: List[str], packed: bool = False
+    ) -> RecipeAnalysis:
+        classified = await self.classify_ingredients(ingredients, packed=packed)
+        return self._detector._summarize_recipe(recipe_name, ingredients, classified)
+
+    async def analyze_label(
+        self, label_text: str, product_name: str = "", packed: bool = False
+    ) -> LabelAnalysis:
+        tokens = parse_label(label_text)
+        classified = await self.classify_ingredients(
+            [t.canonical for t in tokens], packed=packed
+        )
+        return self._detector._summarize_label(product_name, tokens, classified)
+
+    async def detect_verdict(self, item: str) -> VerdictResult:
+        local_response = await self._off_loop(self._detector._local_verdict, item)
+        if local_response is not None:
+            return self._detector._verdict_result(item, local_response)
+
+        ai_response = await self._generate_ai_response(
+            self._detector._verdict_prompt(item),
+            "",
+            VERDICT_SYSTEM_PROMPT,
+            VERDICT_PROMPT_VERSION,
+            VERDICT_MAX_TOKENS,
+        )
+        return self._detector._verdict_result(item, ai_response)
+
+    async def quick_check(self, item: str) -> Status:
+        return (await self.detect_verdict(item)).status
+
+    async def is_halal(self, item: str) -> bool:
+        return (await self.quick_check(item)) is Status.HALAL
+
+    async def is_haram(self, item: str) -> bool:
+        return (await self.quick_check(item)) is Status.HARAM
+
+    async def is_questionable(self, item: str) -> bool:
+        return (await self.quick_check(item)) is Status.QUESTIONABLE
+
+    async def get_halal_score(self, item: str) -> int:
+        return HALAL_SCORES.get(await self.quick_check(item), -1)
+
+    async def is_meat_halal(self, meat_type: str) -> bool:
+        if meat_type.lower() in self._detector.get_haram_meat_types():
+            return False
+        elif meat_type.lower() in self._detector.get_halal_meat_types():
+            return True
+        else:
+            return await self.is_halal(meat_type)
+
+    async def get_halal_alternatives(self, haram_item: str) -> List[str]:
+        ai_response = await self._generate_ai_response(
+            self._detector._alternatives_prompt(haram_item)
+        )
+        return self._detector._alternatives_result(ai_response)
+
+    async def verify_certification(
+        self, brand: str, product: str
+    ) -> Dict[str, Union[str, bool, List]]:
+        ai_response = await self._generate_ai_response(
+            self._detector._certification_prompt(brand, product)
+        )
+        return self._detector._certification_result(brand, product, ai_response)
+
+    async def check_restaurant_halal(
+        self, restaurant_name: str, location: str = ""
+    ) -> Dict:
+        ai_response = await self._generate_ai_response(
+            self._detector._restaurant_prompt(restaurant_name, location)
+        )
+        return self._detector._restaurant_result(restaurant_name, location, ai_response)
+
+    async def advanced_ingredient_analysis(
+        self, ingredient: str, source_country: str = "", processing_method: str = ""
+    ) -> Dict:
+        prompt, context = self._detector._advanced_analysis_prompt(
+            ingredient, source_country, processing_method
+        )
+        ai_response = await self._generate_ai_response(prompt, context)
+        return self._detector._advanced_analysis_result(
+            ingredient, source_country, processing_method, ai_response
+        )
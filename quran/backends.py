@@ -0,0 +1,398 @@
+import contextvars
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .transport import HTTPTransport
+
+try:
+    from typing import Protocol
+except ImportError:  # pragma: no cover - Python 3.7
+    Protocol = object  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from .metrics import Metrics
+    from .scheduler import RequestScheduler
+
+POLLINATIONS_URL = "https://text.pollinations.ai/"
+
+
+class BackendResponse(NamedTuple):
+    status: int
+    text: str
+    sent: int = 0
+    received: int = 0
+
+
+class Backend(Protocol):
+    name: str
+
+    def complete(self, payload: Dict[str, Any]) -> BackendResponse: ...
+
+    def close(self) -> None: ...
+
+
+class HTTPBackend:
+    name = "http"
+
+    def __init__(
+        self,
+        url: str,
+        api_key: Optional[str] = None,
+        transport: Optional[HTTPTransport] = None,
+    ):
+        self.url = url
+        self.api_key = api_key
+        self._owns_transport = transport is None
+        self.transport = transport or HTTPTransport()
+
+    @property
+    def metrics(self) -> Optional["Metrics"]:
+        return self.transport.metrics
+
+    @metrics.setter
+    def metrics(self, value: Optional["Metrics"]) -> None:
+        if self.transport.metrics is None:
+            self.transport.metrics = value
+
+    @property
+    def scheduler(self) -> Optional["RequestScheduler"]:
+        return self.transport.scheduler
+
+    @scheduler.setter
+    def scheduler(self, value: Optional["RequestScheduler"]) -> None:
+        if self.transport.scheduler is None:
+            self.transport.scheduler = value
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+
+    def encode(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return payload
+
+    def decode(self, text: str) -> str:
+        return text
+
+    def complete(self, payload: Dict[str, Any]) -> BackendResponse:
+        response = self.transport.post(self.url, self.encode(payload), self.headers)
+        body = response.request.body if response.request is not None else None
+        text = response.text
+        return BackendResponse(
+            response.status_code,
+            self.decode(text) if response.status_code == 200 else text,
+            len(body or b""),
+            len(response.content),
+        )
+
+    def close(self) -> None:
+        if self._owns_transport:
+            self.transport.close()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.url!r})"
+
+
+class PollinationsBackend(HTTPBackend):
+    name = "pollinations"
+
+    def __init__(
+        self,
+        url: str = POLLINATIONS_URL,
+        api_key: Optional[str] = None,
+        transport: Optional[HTTPTransport] = None,
+    ):
+        super().__init__(url, api_key, transport)
+
+
+class OpenAICompatibleBackend(HTTPBackend):
+    name = "openai-compatible"
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434/v1",
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        transport: Optional[HTTPTransport] = None,
+    ):
+        super().__init__(base_url.rstrip("/") + "/chat/completions", api_key, transport)
+        self.model = model
+
+    def encode(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        request = {k: v for k, v in payload.items() if k != "private"}
+        if self.model is not None:
+            request["model"] = self.model
+        request["stream"] = False
+        return request
+
+    def decode(self, text: str) -> str:
+        try:
+            content = json.loads(text)["choices"][0]["message"]["content"]
+        except (ValueError, KeyError, IndexError, TypeError):
+            return text
+        return content if isinstance(content, str) else text
+
+
+StubResponse = Union[str, Dict[str, Any]]
+
+
+class StubBackend:
+    name = "stub"
+
+    def __init__(
+        self,
+        response: Union[
+            StubResponse, Callable[[Dict[str, Any]], StubResponse], None
+        ] = None,
+        latency: float = 0.0,
+        status: int = 200,
+    ):
+        self.response = response
+        self.latency = latency
+        self.status = status
+        self.calls = 0
+        self.payloads: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def complete(self, payload: Dict[str, Any]) -> BackendResponse:
+        with self._lock:
+            self.calls += 1
+            self.payloads.append(payload)
+        if self.latency > 0:
+            time.sleep(self.latency)
+        response = self.response(payload) if callable(self.response) else self.response
+        if response is None:
+            response = self.default_response(payload)
+        text = response if isinstance(response, str) else json.dumps(response)
+        return BackendResponse(
+            self.status, text, len(json.dumps(payload)), len(text.encode("utf-8"))
+        )
+
+    @staticmethod
+    def default_response(payload: Dict[str, Any]) -> Dict[str, Any]:
+        verdict = {
+            "status": "Questionable",
+            "explanation": "Stub backend response",
+            "confidence": "Low",
+            "concerns": [],
+            "recommendations": [],
+            "certification_required": True,
+            "alternatives": [],
+        }
+        prompt = str(payload.get("messages", [{}])[-1].get("content", ""))
+        if "ITEMS:" not in prompt:
+            return verdict
+        try:
+            items = json.loads(prompt.rsplit("ITEMS:", 1)[1])
+        except ValueError:
+            return verdict
+        return {"results": [dict(verdict, ingredient=item) for item in items]}
+
+    def close(self) -> None:
+        pass
+
+
+Outcome = Tuple[Optional[BackendResponse], Optional[BaseException]]
+
+
+class FailoverBackend:
+    name = "failover"
+
+    def __init__(
+        self,
+        backends: Sequence[Backend],
+        hedge_after: Optional[float] = None,
+        max_hedges: int = 32,
+        max_primaries: int = 32,
+    ):
+        if not backends:
+            raise ValueError("FailoverBackend needs at least one backend")
+        self.backends = list(backends)
+        self.hedge_after = hedge_after
+        self.max_hedges = max_hedges
+        self.max_primaries = max_primaries
+        self.failovers = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._metrics: Optional["Metrics"] = None
+        self._scheduler: Optional["RequestScheduler"] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._primary_executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def metrics(self) -> Optional["Metrics"]:
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, value: Optional["Metrics"]) -> None:
+        self._metrics = value
+        for backend in self.backends:
+            if getattr(backend, "metrics", None) is None and hasattr(
+                backend, "metrics"
+            ):
+                setattr(backend, "metrics", value)
+
+    @property
+    def scheduler(self) -> Optional["RequestScheduler"]:
+        return self._scheduler
+
+    @scheduler.setter
+    def scheduler(self, value: Optional["RequestScheduler"]) -> None:
+        self._scheduler = value
+        for backend in self.backends:
+            if getattr(backend, "scheduler", None) is None and hasattr(
+                backend, "scheduler"
+            ):
+                setattr(backend, "scheduler", value)
+
+    def _count(self, name: str, **labels: Any) -> None:
+        if self._metrics is not None:
+            self._metrics.inc(name, **labels)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_hedges, thread_name_prefix="quran-hedge"
+                    )
+        return self._executor
+
+    def _get_primary_executor(self) -> ThreadPoolExecutor:
+        if self._primary_executor is None:
+            with self._lock:
+                if self._primary_executor is None:
+                    self._primary_executor = ThreadPoolExecutor(
+                        max_workers=self.max_primaries,
+                        thread_name_prefix="quran-primary",
+                    )
+        return self._primary_executor
+
+    @staticmethod
+    def _attempt(backend: Backend, payload: Dict[str, Any]) -> Outcome:
+        try:
+            return backend.complete(payload), None
+        except Exception as e:
+            return None, e
+
+    @staticmethod
+    def _ok(outcome: Outcome) -> bool:
+        response = outcome[0]
+        return response is not None and response.status == 200
+
+    def _submit(self, backend: Backend, payload: Dict[str, Any]) -> "Future[Outcome]":
+        context = contextvars.copy_context()
+        return self._get_executor().submit(context.run, self._attempt, backend, payload)
+
+    def _start(
+        self, backend: Backend, payload: Dict[str, Any]
+    ) -> Tuple["Future[Outcome]", threading.Event]:
+        # Primaries have their own pool so they never queue behind hedges, and
+        # the caller starts the hedge clock only once the primary is running,
+        # so hedge_after measures the backend and not the wait for a worker.
+        started = threading.Event()
+        context = contextvars.copy_context()
+
+        def run() -> Outcome:
+            started.set()
+            return context.run(self._attempt, backend, payload)
+
+        return self._get_primary_executor().submit(run), started
+
+    def _hedged(
+        self, primary: Backend, secondary: Backend, payload: Dict[str, Any]
+    ) -> List[Outcome]:
+        first, started = self._start(primary, payload)
+        started.wait()
+        try:
+            outcome = first.result(timeout=self.hedge_after)
+        except FutureTimeoutError:
+            pass
+        else:
+            if self._ok(outcome):
+                return [outcome]
+            self._record_failover(primary)
+            return [outcome, self._attempt(secondary, payload)]
+
+        with self._lock:
+            self.hedged += 1
+        self._count("hedged_requests_total", backend=secondary.name)
+        pending = {first: primary, self._submit(secondary, payload): secondary}
+        outcomes: List[Outcome] = []
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                backend = pending.pop(future)
+                outcome = future.result()
+                if self._ok(outcome):
+                    if backend is secondary:
+                        with self._lock:
+                            self.hedge_wins += 1
+                        self._count("hedge_wins_total", backend=secondary.name)
+                    return outcomes + [outcome]
+                outcomes.append(outcome)
+        return outcomes
+
+    def _record_failover(self, backend: Backend) -> None:
+        with self._lock:
+            self.failovers += 1
+        self._count("backend_failovers_total", backend=backend.name)
+
+    def complete(self, payload: Dict[str, Any]) -> BackendResponse:
+        outcomes: List[Outcome] = []
+        index = 0
+        while index < len(self.backends):
+            backend = self.backends[index]
+            if self.hedge_after is not None and index + 1 < len(self.backends):
+                attempts = self._hedged(backend, self.backends[index + 1], payload)
+                index += 2
+            else:
+                attempts = [self._attempt(backend, payload)]
+                index += 1
+            outcomes.extend(attempts)
+            response = outcomes[-1][0]
+            if response is not None and response.status == 200:
+                return response
+            if index < len(self.backends):
+                self._record_failover(self.backends[index - 1])
+
+        for response, _ in reversed(outcomes):
+            if response is not None:
+                return response
+        error = outcomes[-1][1]
+        assert error is not None
+        raise error
+
+    def close(self) -> None:
+        with self._lock:
+            executors = (self._executor, self._primary_executor)
+            self._executor = self._primary_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False)
+        for backend in self.backends:
+            backend.close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "failovers": self.failovers,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+            }
@@ -0,0 +1,112 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class ItemTimeoutError(Exception):
+    pass
+
+
+def run_parallel(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    on_error: Callable[[T, BaseException], R],
+    max_workers: int = 8,
+    timeout: Optional[float] = None,
+    preserve_order: bool = True,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[Tuple[int, R]]:
+    max_workers = max(1, max_workers)
+    max_in_flight = max(max_workers, max_in_flight or max_workers * 2)
+    started: Dict[int, float] = {}
+    started_lock = threading.Lock()
+
+    def run(index: int, item: T) -> R:
+        with started_lock:
+            started[index] = time.monotonic()
+        return func(item)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    source = enumerate(items)
+    exhausted = False
+    pending: Dict["Future[R]", Tuple[int, T]] = {}
+    ready: Dict[int, R] = {}
+    next_index = 0
+
+    def fill() -> None:
+        nonlocal exhausted
+        while not exhausted and len(pending) < max_in_flight:
+            try:
+                index, item = next(source)
+            except StopIteration:
+                exhausted = True
+                return
+            context = contextvars.copy_context()
+            pending[executor.submit(context.run, run, index, item)] = (index, item)
+
+    def finish(index: int, result: R) -> Iterator[Tuple[int, R]]:
+        nonlocal next_index
+        with started_lock:
+            started.pop(index, None)
+        if not preserve_order:
+            yield index, result
+            return
+        ready[index] = result
+        while next_index in ready:
+            yield next_index, ready.pop(next_index)
+            next_index += 1
+
+    try:
+        fill()
+        while pending:
+            wait_timeout = None
+            if timeout is not None:
+                with started_lock:
+                    deadlines = [
+                        started[i] + timeout
+                        for i, _ in pending.values()
+                        if i in started
+                    ]
+                wait_timeout = (
+                    max(0.0, min(deadlines) - time.monotonic())
+                    if deadlines
+                    else timeout
+                )
+
+            done, _ = wait(
+                list(pending), timeout=wait_timeout, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                index, item = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = on_error(item, e)
+                for emitted in finish(index, result):
+                    yield emitted
+
+            if timeout is not None:
+                now = time.monotonic()
+                for future, (index, item) in list(pending.items()):
+                    with started_lock:
+                        start = started.get(index)
+                    if (
+                        start is not None
+                        and now - start >= timeout
+                        and not future.done()
+                    ):
+                        del pending[future]
+                        error = ItemTimeoutError(f"Item timed out after {timeout}s")
+                        for emitted in finish(index, on_error(item, error)):
+                            yield emitted
+
+            fill()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -0,0 +1,303 @@
+import asyncio
+import contextvars
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+_bypass: "contextvars.ContextVar[bool]" = contextvars.ContextVar(
+    "quran_cache_bypass", default=False
+)
+
+
+def cache_bypassed() -> bool:
+    return _bypass.get()
+
+
+@contextmanager
+def bypass_cache() -> Iterator[None]:
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.split()).lower()
+
+
+def make_cache_key(prompt: str, context: str, model: str, prompt_version: str) -> str:
+    material = json.dumps(
+        [normalize_text(prompt), normalize_text(context), model, prompt_version],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class VerdictCache:
+    def __init__(
+        self,
+        path: str = "halal_verdicts.db",
+        ttl: Optional[float] = 30 * 24 * 3600,
+        max_entries: int = 100000,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid = 0
+        self._approx_count = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS verdicts ("
+                "key TEXT PRIMARY KEY, "
+                "value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, "
+                "expires_at REAL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS verdicts_created ON verdicts (created_at)"
+            )
+            conn.commit()
+            self._approx_count = conn.execute(
+                "SELECT COUNT(*) FROM verdicts"
+            ).fetchone()[0]
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT value, expires_at FROM verdicts WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                conn.execute("DELETE FROM verdicts WHERE key = ?", (key,))
+                conn.commit()
+                self._approx_count -= 1
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self.hits += 1
+        cached: Dict = json.loads(value)
+        return cached
+
+    def set(self, key: str, value: Dict) -> None:
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl is not None else None
+        payload = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO verdicts (key, value, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, payload, now, expires_at),
+            )
+            conn.commit()
+            self.stores += 1
+            self._approx_count += 1
+            if self._approx_count > self.max_entries:
+                self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "DELETE FROM verdicts WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),),
+        )
+        target = max(0, int(self.max_entries * 0.9))
+        cursor = conn.execute(
+            "DELETE FROM verdicts WHERE key IN ("
+            "SELECT key FROM verdicts ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (target,),
+        )
+        conn.commit()
+        self.evictions += max(cursor.rowcount, 0)
+        self._approx_count = conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM verdicts")
+            conn.commit()
+            self._approx_count = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(
+                self._connection()
+                .execute("SELECT COUNT(*) FROM verdicts")
+                .fetchone()[0]
+            )
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class MemoryCache:
+    def __init__(self, max_entries: int = 10000, ttl: Optional[float] = 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: "OrderedDict[str, Tuple[Dict, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # Callers own what they get back; mutating it must not touch the cache
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Dict) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            self.stores += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class _Call(Generic[T]):
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[T]):
+    def __init__(self) -> None:
+        self.coalesced = 0
+        self._calls: Dict[str, _Call[T]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func: Callable[[], T]) -> Tuple[T, bool]:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True  # type: ignore[return-value]
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result, False
+
+
+class AsyncSingleFlight(Generic[T]):
+    def __init__(self) -> None:
+        self.coalesced = 0
+        self._tasks: Dict[str, "asyncio.Future[T]"] = {}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        task = self._tasks.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task), shared
@@ -0,0 +1,184 @@
+import threading
+from collections import Counter
+from typing import Counter as CounterType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union
+
+from .cache import bypass_cache
+from .halal_detector import HalalDetector
+from .results import IngredientResult, RecipeAnalysis, Status
+
+
+def _key(ingredient: str) -> str:
+    return ingredient.strip().lower()
+
+
+class MenuCatalog:
+    def __init__(self, detector: HalalDetector, packed: bool = False):
+        self.detector = detector
+        self.packed = packed
+        self.recomputed = 0
+        self._recipes: Dict[str, Tuple[str, ...]] = {}
+        self._analyses: Dict[str, RecipeAnalysis] = {}
+        self._verdicts: Dict[str, IngredientResult] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._status_counts: CounterType[Status] = Counter()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._recipes)
+
+    def __contains__(self, recipe: str) -> bool:
+        return recipe in self._recipes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._recipes))
+
+    def __getitem__(self, recipe: str) -> RecipeAnalysis:
+        return self._analyses[recipe]
+
+    def get(self, recipe: str) -> Optional[RecipeAnalysis]:
+        return self._analyses.get(recipe)
+
+    def ingredients(self, recipe: str) -> Tuple[str, ...]:
+        return self._recipes[recipe]
+
+    def verdict(self, ingredient: str) -> Optional[IngredientResult]:
+        return self._verdicts.get(_key(ingredient))
+
+    def recipes_with(self, ingredient: str) -> List[str]:
+        with self._lock:
+            return sorted(self._dependents.get(_key(ingredient), ()))
+
+    def recipes_by_status(self, status: Union[Status, str]) -> List[str]:
+        status = Status.parse(status)
+        with self._lock:
+            return [
+                name
+                for name, analysis in self._analyses.items()
+                if analysis.overall_status is status
+            ]
+
+    def _classify(self, ingredients: Iterable[str]) -> Dict[str, IngredientResult]:
+        unique = {_key(i): i.strip() for i in ingredients if i.strip()}
+        if not unique:
+            return {}
+        classified = self.detector.classify_ingredients(
+            list(unique.values()), packed=self.packed
+        )
+        return {key: classified[name] for key, name in unique.items()}
+
+    def _missing(self, recipes: Mapping[str, Iterable[str]]) -> List[str]:
+        with self._lock:
+            return [
+                ingredient
+                for ingredients in recipes.values()
+                for ingredient in ingredients
+                if _key(ingredient) not in self._verdicts
+            ]
+
+    def _recompute(self, recipe: str) -> bool:
+        ingredients = self._recipes[recipe]
+        classified = {i: self._verdicts[_key(i)] for i in ingredients}
+        analysis = self.detector._summarize_recipe(
+            recipe, list(ingredients), classified
+        )
+        previous = self._analyses.get(recipe)
+        self._analyses[recipe] = analysis
+        self.recomputed += 1
+        if previous is not None:
+            self._status_counts[previous.overall_status] -= 1
+        self._status_counts[analysis.overall_status] += 1
+        return (
+            previous is None
+            or previous.overall_status is not analysis.overall_status
+            or previous.halal_percentage != analysis.halal_percentage
+        )
+
+    def _unlink(self, recipe: str) -> None:
+        for ingredient in self._recipes.get(recipe, ()):
+            key = _key(ingredient)
+            dependents = self._dependents.get(key)
+            if dependents is not None:
+                dependents.discard(recipe)
+                if not dependents:
+                    del self._dependents[key]
+
+    def set_recipes(self, recipes: Mapping[str, Iterable[str]]) -> List[str]:
+        edited = {
+            name: tuple(i for i in ingredients if i.strip())
+            for name, ingredients in recipes.items()
+        }
+        verdicts = self._classify(self._missing(edited))
+        changed = []
+        with self._lock:
+            for key, result in verdicts.items():
+                self._verdicts.setdefault(key, result)
+            for name, ingredients in edited.items():
+                if self._recipes.get(name) == ingredients:
+                    continue
+                self._unlink(name)
+                self._recipes[name] = ingredients
+                for ingredient in ingredients:
+                    self._dependents.setdefault(_key(ingredient), set()).add(name)
+                if self._recompute(name):
+                    changed.append(name)
+        return changed
+
+    def set_recipe(self, recipe: str, ingredients: Iterable[str]) -> RecipeAnalysis:
+        self.set_recipes({recipe: ingredients})
+        return self._analyses[recipe]
+
+    def remove_recipe(self, recipe: str) -> None:
+        with self._lock:
+            if recipe not in self._recipes:
+                raise KeyError(recipe)
+            self._unlink(recipe)
+            del self._recipes[recipe]
+            analysis = self._analyses.pop(recipe)
+            self._status_counts[analysis.overall_status] -= 1
+
+    def update_verdicts(
+        self, verdicts: Mapping[str, Union[IngredientResult, Status, str]]
+    ) -> List[str]:
+        affected: Set[str] = set()
+        with self._lock:
+            for ingredient, verdict in verdicts.items():
+                if not isinstance(verdict, IngredientResult):
+                    verdict = IngredientResult.from_response(
+                        ingredient, {"status": Status.parse(verdict)}
+                    )
+                key = _key(ingredient)
+                previous = self._verdicts.get(key)
+                self._verdicts[key] = verdict
+                if previous is None or previous.status is not verdict.status:
+                    affected.update(self._dependents.get(key, ()))
+            return [name for name in sorted(affected) if self._recompute(name)]
+
+    def refresh(self, ingredients: Iterable[str]) -> List[str]:
+        with self._lock:
+            known = [i for i in ingredients if _key(i) in self._dependents]
+        with bypass_cache():
+            verdicts = self._classify(known)
+        return self.update_verdicts(verdicts)
+
+    def retry_errors(self) -> List[str]:
+        with self._lock:
+            failed = [
+                result.ingredient
+                for result in self._verdicts.values()
+                if result.status in (Status.ERROR, Status.UNKNOWN)
+            ]
+        return self.refresh(failed)
+
+    def summary(self) -> Dict[str, Union[int, Dict[str, int]]]:
+        with self._lock:
+            return {
+                "recipes": len(self._recipes),
+                "ingredients": len(self._verdicts),
+                "recomputed": self.recomputed,
+                "by_status": {
+                    str(status): count
+                    for status, count in self._status_counts.items()
+                    if count
+                },
+            }
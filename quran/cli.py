@@ -0,0 +1,559 @@
+import argparse
+import csv
+import io
+import itertools
+import json
+import os
+import sys
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TextIO,
+)
+
+from .backends import StubBackend
+from .batching import run_parallel
+from .cache import VerdictCache
+from .halal_detector import HalalDetector
+from .results import Record, Status
+from .scheduler import RequestScheduler
+from .snapshot import build_snapshot
+
+ITEM_TYPES = ("ingredient", "food", "label")
+FORMATS = ("csv", "jsonl", "text")
+
+
+def detect_format(path: str, explicit: Optional[str] = None) -> str:
+    if explicit:
+        return explicit
+    name = path.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    if name.endswith(".csv") or name.endswith(".tsv"):
+        return "csv"
+    if name.endswith(".jsonl") or name.endswith(".ndjson") or name.endswith(".json"):
+        return "jsonl"
+    return "text"
+
+
+def _open_input(path: str) -> TextIO:
+    if path == "-":
+        return sys.stdin
+    if path.endswith(".gz"):
+        import gzip
+
+        return io.TextIOWrapper(gzip.open(path, "rb"), encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def iter_records(
+    stream: TextIO, fmt: str, column: Optional[str] = None, delimiter: str = ","
+) -> Iterator[str]:
+    if fmt == "csv":
+        reader = csv.DictReader(stream, delimiter=delimiter)
+        field = column
+        for row in reader:
+            if field is None:
+                field = (reader.fieldnames or [""])[0]
+            yield (row.get(field) or "").strip()
+    elif fmt == "jsonl":
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if isinstance(record, dict):
+                yield str(record.get(column or "name") or "").strip()
+            else:
+                yield str(record).strip()
+    else:
+        for line in stream:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def count_records(path: str, fmt: str) -> Optional[int]:
+    if path == "-":
+        return None
+    with _open_input(path) as stream:
+        if fmt == "csv":
+            return max(0, sum(1 for _ in csv.reader(stream)) - 1)
+        return sum(1 for line in stream if line.strip())
+
+
+class Checkpoint:
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state: Dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return state
+
+    def save(self, state: Dict[str, Any]) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+class Progress:
+    def __init__(
+        self,
+        total: Optional[int] = None,
+        done: int = 0,
+        interval: float = 2.0,
+        stream: TextIO = sys.stderr,
+    ):
+        self.total = total
+        self.done = done
+        self.errors = 0
+        self.interval = interval
+        self.stream = stream
+        self._initial = done
+        self._started = time.monotonic()
+        self._last_report = 0.0
+
+    @property
+    def rate(self) -> float:
+        elapsed = time.monotonic() - self._started
+        return (self.done - self._initial) / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        rate = self.rate
+        if self.total is None or rate <= 0:
+            return None
+        return max(0.0, (self.total - self.done) / rate)
+
+    def update(self, count: int = 1, errors: int = 0) -> None:
+        self.done += count
+        self.errors += errors
+        now = time.monotonic()
+        if self.interval > 0 and now - self._last_report >= self.interval:
+            self._last_report = now
+            self.report()
+
+    def report(self, final: bool = False) -> None:
+        total = f"/{self.total:,}" if self.total is not None else ""
+        eta = self.eta
+        line = (
+            f"{self.done:,}{total} rows  {self.rate:,.1f} rows/s  "
+            f"{self.errors:,} errors"
+        )
+        if eta is not None and not final:
+            line += f"  ETA {_format_duration(eta)}"
+        if final:
+            elapsed = time.monotonic() - self._started
+            line += f"  in {_format_duration(elapsed)}"
+        self.stream.write(line + ("\n" if final else "\r"))
+        self.stream.flush()
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:d}:{minutes:02d}:{seconds:02d}"
+
+
+def _is_error(result: Mapping[str, Any]) -> bool:
+    return result.get("status") == Status.ERROR
+
+
+def _as_dict(result: Mapping[str, Any]) -> Dict[str, Any]:
+    return result.to_dict() if isinstance(result, Record) else dict(result)
+
+
+def classify_stream(
+    detector: HalalDetector,
+    items: Iterator[str],
+    item_type: str = "ingredient",
+    context: str = "",
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+    packed: bool = False,
+    batch_size: int = 500,
+) -> Iterator[Mapping[str, Any]]:
+    if packed and item_type == "ingredient":
+        while True:
+            window = list(itertools.islice(items, batch_size))
+            if not window:
+                return
+            classified = detector.classify_ingredients(
+                window, context, max_workers=max_workers, timeout=timeout, packed=True
+            )
+            for item in window:
+                yield classified[item]
+
+    func: Callable[[str], Mapping[str, Any]]
+    shape: Callable[[str, Dict[str, Any]], Mapping[str, Any]]
+    if item_type == "ingredient":
+
+        def func(item: str) -> Mapping[str, Any]:
+            return detector.detect_ingredient(item, context)
+
+        shape = detector._ingredient_result
+    elif item_type == "food":
+        func = detector.detect_food_item
+        shape = detector._food_item_result
+    else:
+        func = detector.analyze_label
+
+        def shape(item: str, error: Dict[str, Any]) -> Dict[str, Any]:
+            return {"label": item, **error}
+
+    for _, result in run_parallel(
+        func,
+        items,
+        on_error=lambda item, e: shape(item, detector._item_error_response(e)),
+        max_workers=max_workers or detector.max_workers,
+        timeout=timeout,
+        preserve_order=True,
+    ):
+        yield result
+
+
+def _delimiter(path: str) -> str:
+    return "\t" if path.lower().endswith((".tsv", ".tsv.gz")) else ","
+
+
+def _build_detector(
+    args: argparse.Namespace,
+    cache: Optional[VerdictCache],
+    snapshot: Optional[str] = None,
+) -> HalalDetector:
+    detector = HalalDetector(
+        model=args.model,
+        cache=cache,
+        max_workers=args.workers,
+        use_lexicon=not args.no_lexicon,
+        snapshot=snapshot,
+        scheduler=RequestScheduler(rate=args.rate_limit),
+        backend=StubBackend() if getattr(args, "stub", False) else None,
+    )
+    if args.base_url:
+        detector.base_url = args.base_url
+    return detector
+
+
+def run_classify(args: argparse.Namespace) -> int:
+    fmt = detect_format(args.input, args.format)
+    checkpoint = Checkpoint(args.checkpoint or f"{args.output}.ckpt")
+    state = None if args.restart else checkpoint.load()
+    if state is not None and state.get("input") != os.path.abspath(args.input):
+        sys.stderr.write(
+            f"Checkpoint {checkpoint.path} belongs to {state.get('input')}; "
+            "use --restart to discard it\n"
+        )
+        return 2
+
+    if state is not None and not os.path.exists(args.output):
+        sys.stderr.write(f"{args.output} is missing; starting from the first row\n")
+        state = None
+    if state is not None and state.get("finished"):
+        sys.stderr.write(
+            f"{args.input} already processed ({state['completed']:,} rows)\n"
+        )
+        return 0
+    skip = int(state["completed"]) if state else 0
+    offset = int(state["output_offset"]) if state else 0
+
+    total = None if args.no_count else count_records(args.input, fmt)
+    cache = None if args.no_cache else VerdictCache(args.cache)
+    detector = _build_detector(args, cache, args.snapshot)
+    progress = Progress(total, skip, args.progress_interval)
+    held: List[bytes] = []
+    held_errors = 0
+    completed = skip
+    exit_code = 0
+
+    with _open_input(args.input) as source, open(
+        args.output, "r+b" if state else "wb"
+    ) as out:
+        out.seek(offset)
+        out.truncate()
+
+        def save(finished: bool = False) -> None:
+            out.flush()
+            os.fsync(out.fileno())
+            checkpoint.save(
+                {
+                    "input": os.path.abspath(args.input),
+                    "output": os.path.abspath(args.output),
+                    "completed": completed,
+                    "output_offset": out.tell(),
+                    "finished": finished,
+                    "updated_at": time.time(),
+                }
+            )
+
+        def release() -> None:
+            nonlocal completed, held_errors
+            for line in held:
+                out.write(line)
+            completed += len(held)
+            progress.update(len(held), held_errors)
+            held.clear()
+            held_errors = 0
+
+        records = iter_records(source, fmt, args.column, _delimiter(args.input))
+        items = itertools.islice(records, skip, None)
+        if args.limit is not None:
+            items = itertools.islice(items, args.limit)
+
+        saved_at = (completed, time.monotonic())
+        clean_run = 0
+        finished = False
+        try:
+            for result in classify_stream(
+                detector,
+                items,
+                args.type,
+                args.context,
+                max_workers=args.workers,
+                timeout=args.timeout,
+                packed=args.packed,
+                batch_size=args.batch_size,
+            ):
+                line = json.dumps(
+                    {"row": completed + len(held), **_as_dict(result)},
+                    ensure_ascii=False,
+                ).encode("utf-8")
+                error = _is_error(result)
+                if args.max_errors and (held or error):
+                    held.append(line + b"\n")
+                    held_errors += error
+                    clean_run = 0 if error else clean_run + 1
+                    if held_errors >= args.max_errors:
+                        sys.stderr.write(
+                            f"\nStopping after {held_errors} errors since row "
+                            f"{completed:,}: {result.get('explanation')}\n"
+                        )
+                        exit_code = 1
+                        break
+                    if clean_run < args.max_errors:
+                        continue
+                    release()
+                else:
+                    out.write(line + b"\n")
+                    completed += 1
+                    progress.update(1, error)
+
+                if (
+                    completed - saved_at[0] >= args.checkpoint_every
+                    or time.monotonic() - saved_at[1] >= args.checkpoint_interval
+                ):
+                    save()
+                    saved_at = (completed, time.monotonic())
+            else:
+                release()
+                finished = args.limit is None
+        except KeyboardInterrupt:
+            sys.stderr.write("\nInterrupted\n")
+            exit_code = 130
+        except Exception as e:
+            sys.stderr.write(
+                f"\nStopped at row {completed + len(held):,}: "
+                f"{e.__class__.__name__}: {e}\n"
+            )
+            exit_code = 1
+        finally:
+            save(finished=finished)
+            detector.close()
+            if cache is not None:
+                cache.close()
+
+    progress.report(final=True)
+    if exit_code:
+        sys.stderr.write(
+            f"Checkpoint saved to {checkpoint.path}; rerun the same command to "
+            f"resume from row {completed:,}\n"
+        )
+    return exit_code
+
+
+def run_snapshot(args: argparse.Namespace) -> int:
+    fmt = detect_format(args.input, args.format)
+    cache = None if args.no_cache else VerdictCache(args.cache)
+    detector = _build_detector(args, cache)
+    started = time.monotonic()
+    try:
+        with _open_input(args.input) as source:
+            items: Iterator[str] = iter_records(
+                source, fmt, args.column, _delimiter(args.input)
+            )
+            if args.limit is not None:
+                items = itertools.islice(items, args.limit)
+            count = build_snapshot(
+                detector,
+                (item for item in items if item),
+                args.output,
+                max_workers=args.workers,
+                timeout=args.timeout,
+            )
+    except KeyboardInterrupt:
+        sys.stderr.write("\nInterrupted; no snapshot written\n")
+        return 130
+    finally:
+        detector.close()
+        if cache is not None:
+            cache.close()
+    elapsed = _format_duration(time.monotonic() - started)
+    sys.stderr.write(f"Wrote {count:,} verdicts to {args.output} in {elapsed}\n")
+    return 0
+
+
+def run_serve(args: argparse.Namespace) -> int:
+    from .server import serve
+
+    cache = None if args.no_cache else VerdictCache(args.cache)
+    detector = _build_detector(args, cache, args.snapshot)
+    try:
+        serve(
+            detector,
+            host=args.host,
+            port=args.port,
+            window=args.batch_window / 1000.0,
+            max_batch=args.max_batch,
+            workers=args.workers,
+        )
+    finally:
+        detector.close()
+        if cache is not None:
+            cache.close()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m quran", description="Halal/haram detection tools"
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    classify = commands.add_parser(
+        "classify",
+        help="classify a CSV/JSONL/text catalog into a JSONL results file",
+    )
+    classify.add_argument("input", help="input file, or - for stdin")
+    classify.add_argument("-o", "--output", required=True, help="JSONL results file")
+    classify.add_argument("--format", choices=FORMATS, help="input format")
+    classify.add_argument(
+        "--column", help="CSV column or JSON field holding the item (default: first)"
+    )
+    classify.add_argument("--type", choices=ITEM_TYPES, default="ingredient")
+    classify.add_argument("--context", default="", help="context for ingredients")
+    classify.add_argument("--model", default="openai")
+    classify.add_argument("--base-url", help="override the AI endpoint URL")
+    classify.add_argument("--workers", type=int, default=8)
+    classify.add_argument(
+        "--rate-limit", type=float, help="maximum upstream requests per second"
+    )
+    classify.add_argument("--timeout", type=float, help="per-item timeout in seconds")
+    classify.add_argument(
+        "--packed", action="store_true", help="classify ingredients in packed chunks"
+    )
+    classify.add_argument("--batch-size", type=int, default=500)
+    classify.add_argument("--limit", type=int, help="process at most N rows")
+    classify.add_argument("--cache", default="halal_verdicts.db")
+    classify.add_argument("--no-cache", action="store_true")
+    classify.add_argument("--no-lexicon", action="store_true")
+    classify.add_argument("--checkpoint", help="checkpoint file (default: OUTPUT.ckpt)")
+    classify.add_argument("--checkpoint-every", type=int, default=1000)
+    classify.add_argument(
+        "--checkpoint-interval",
+        type=float,
+        default=30.0,
+        help="also checkpoint after this many seconds",
+    )
+    classify.add_argument(
+        "--restart", action="store_true", help="ignore any existing checkpoint"
+    )
+    classify.add_argument(
+        "--max-errors",
+        type=int,
+        default=20,
+        help="stop before a stretch of N errors, e.g. an outage or rate limit, "
+        "so a rerun retries it (0 disables)",
+    )
+    classify.add_argument(
+        "--snapshot", help="precomputed verdict snapshot to answer from first"
+    )
+    classify.add_argument("--no-count", action="store_true", help="skip ETA pre-count")
+    classify.add_argument("--progress-interval", type=float, default=2.0)
+    classify.set_defaults(handler=run_classify)
+
+    snapshot = commands.add_parser(
+        "snapshot",
+        help="precompute ingredient verdicts into a memory-mapped snapshot file",
+    )
+    snapshot.add_argument("input", help="ingredient list file, or - for stdin")
+    snapshot.add_argument("-o", "--output", required=True, help="snapshot file")
+    snapshot.add_argument("--format", choices=FORMATS, help="input format")
+    snapshot.add_argument(
+        "--column", help="CSV column or JSON field holding the item (default: first)"
+    )
+    snapshot.add_argument("--model", default="openai")
+    snapshot.add_argument("--base-url", help="override the AI endpoint URL")
+    snapshot.add_argument("--workers", type=int, default=8)
+    snapshot.add_argument(
+        "--rate-limit", type=float, help="maximum upstream requests per second"
+    )
+    snapshot.add_argument("--timeout", type=float, help="per-item timeout in seconds")
+    snapshot.add_argument("--limit", type=int, help="process at most N rows")
+    snapshot.add_argument("--cache", default="halal_verdicts.db")
+    snapshot.add_argument("--no-cache", action="store_true")
+    snapshot.add_argument("--no-lexicon", action="store_true")
+    snapshot.set_defaults(handler=run_snapshot)
+
+    server = commands.add_parser(
+        "serve", help="run a JSON HTTP service that micro-batches lookups"
+    )
+    server.add_argument("--host", default="127.0.0.1")
+    server.add_argument("--port", type=int, default=8000)
+    server.add_argument("--model", default="openai")
+    server.add_argument("--base-url", help="override the AI endpoint URL")
+    server.add_argument(
+        "--stub", action="store_true", help="answer from a local stub backend"
+    )
+    server.add_argument("--workers", type=int, default=8)
+    server.add_argument(
+        "--rate-limit", type=float, help="maximum upstream requests per second"
+    )
+    server.add_argument(
+        "--batch-window",
+        type=float,
+        default=5.0,
+        help="milliseconds to collect single-ingredient requests (default: 5)",
+    )
+    server.add_argument(
+        "--max-batch", type=int, help="ingredients per upstream call (default: 20)"
+    )
+    server.add_argument("--snapshot", help="verdict snapshot file to answer from")
+    server.add_argument("--cache", default="halal_verdicts.db")
+    server.add_argument("--no-cache", action="store_true")
+    server.add_argument("--no-lexicon", action="store_true")
+    server.set_defaults(handler=run_serve)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not getattr(args, "handler", None):
+        parser.print_help()
+        return 2
+    handler: Callable[[argparse.Namespace], int] = args.handler
+    return handler(args)
@@ -1,20 +1,45 @@
-import requests
+import copy
 import json
-from typing import Dict, List, Optional, Union
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-class HalalDetector:
-    def __init__(self, api_key: Optional[str] = None):
-        self.api_key = api_key
-        self.base_url = "https://text.pollinations.ai/"
-        self.halal_keywords = ["halal", "permissible", "allowed", "clean", "pure"]
-        self.haram_keywords = ["haram", "forbidden", "prohibited", "unclean", "impure"]
-        
-    def _clean_response(self, text: str) -> str:
-        return text.replace("Powered by Pollinations.AI", "").replace("Support our mission", "").replace("https://pollinations.ai", "").replace("pollinations.ai", "").replace("pollinations", "").strip()
-    
-    def _generate_ai_response(self, prompt: str, context: str = "") -> Dict:
-        try:
-            system_prompt = """You are a highly knowledgeable Islamic scholar and food safety expert specializing in halal and haram food classification. You have deep understanding of:
+from .backends import Backend, BackendResponse, PollinationsBackend
+from .batching import ItemTimeoutError, run_parallel
+from .cache import (
+    MemoryCache,
+    SingleFlight,
+    VerdictCache,
+    cache_bypassed,
+    make_cache_key,
+)
+from .label_parser import MAY_CONTAIN, LabelToken, parse_label
+from .lexicon import HALAL, IngredientLexicon, get_default_lexicon
+from .metrics import Metrics, current_operation, instrumented
+from .parsing import (
+    DETAILED,
+    PACKED,
+    VERDICT,
+    Schema,
+    SchemaError,
+    extract_json,
+    strip_boilerplate,
+    validate,
+)
+from .resilience import CircuitBreaker
+from .results import (
+    FoodItemResult,
+    IngredientResult,
+    LabelAnalysis,
+    RecipeAnalysis,
+    Status,
+    VerdictResult,
+)
+from .scheduler import Priority, RequestScheduler, current_priority
+from .snapshot import VerdictSnapshot
+from .transport import RETRY_STATUSES, HTTPTransport
+
+SYSTEM_PROMPT_VERSION = "1"
+SYSTEM_PROMPT = """You are a highly knowledgeable Islamic scholar and food safety expert specializing in halal and haram food classification. You have deep understanding of:
 
 1. Islamic dietary laws (Shariah) and their application to modern food production
 2. Food processing methods and their impact on halal status
@@ -43,76 +68,325 @@ REQUIRED JSON FORMAT:
   "alternatives": ["halal alternative 1", "halal alternative 2"]
 }"""
 
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": f"{context}\n\n{prompt}" if context else prompt}
-            ]
-            
-            response = requests.post(
-                self.base_url,
-                headers={"Content-Type": "application/json"},
-                json={
-                    "messages": messages,
-                    "model": "openai",
-                    "private": True
-                },
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                cleaned_text = self._clean_response(response.text)
-                try:
-                    return json.loads(cleaned_text)
-                except json.JSONDecodeError:
-                    return {
-                        "status": "Unknown",
-                        "explanation": cleaned_text,
-                        "confidence": "Low",
-                        "concerns": ["Invalid JSON response"],
-                        "recommendations": ["Verify with Islamic scholar"],
-                        "certification_required": True,
-                        "alternatives": []
-                    }
-            else:
-                return {
-                    "status": "Error",
-                    "explanation": f"HTTP {response.status_code}",
-                    "confidence": "Low",
-                    "concerns": ["API Error"],
-                    "recommendations": ["Check internet connection", "Try again later"],
-                    "certification_required": True,
-                    "alternatives": []
-                }
-                
-        except Exception as e:
+PACKED_PROMPT_VERSION = "packed-1"
+PACKED_SYSTEM_PROMPT = """You are a highly knowledgeable Islamic scholar and food safety expert specializing in halal and haram food classification. You classify lists of ingredients according to Islamic dietary laws, modern food processing practices and established halal certification standards.
+
+CRITICAL INSTRUCTIONS:
+- Always respond with valid JSON format only
+- Return exactly one result for every item you are given, in the same order
+- Copy each item text exactly into the "ingredient" field
+- Use confidence levels based on available information quality
+
+REQUIRED JSON FORMAT:
+{
+  "results": [
+    {
+      "ingredient": "item text exactly as given",
+      "status": "Halal/Haram/Questionable",
+      "explanation": "Short explanation with Islamic reasoning",
+      "confidence": "High/Medium/Low",
+      "concerns": ["specific concern"],
+      "recommendations": ["recommendation"],
+      "certification_required": true/false,
+      "alternatives": ["halal alternative"]
+    }
+  ]
+}"""
+VALID_STATUSES = ("halal", "haram", "questionable")
+
+VERDICT_PROMPT_VERSION = "verdict-1"
+VERDICT_SYSTEM_PROMPT = """Classify the food or ingredient under Islamic dietary law. Reply with one JSON object and nothing else:
+{"status": "Halal/Haram/Questionable", "confidence": "High/Medium/Low"}"""
+VERDICT_MAX_TOKENS = 24
+HALAL_SCORES = {Status.HALAL: 100, Status.QUESTIONABLE: 50, Status.HARAM: 0}
+RESPONSE_SCHEMAS = {
+    SYSTEM_PROMPT: DETAILED,
+    PACKED_SYSTEM_PROMPT: PACKED,
+    VERDICT_SYSTEM_PROMPT: VERDICT,
+}
+
+
+@instrumented
+class HalalDetector:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "openai",
+        cache: Optional[VerdictCache] = None,
+        max_workers: int = 8,
+        transport: Optional[HTTPTransport] = None,
+        use_lexicon: bool = True,
+        chunk_size: int = 20,
+        metrics: Optional[Metrics] = None,
+        memory_cache_size: int = 10000,
+        memory_cache_ttl: Optional[float] = 3600,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        failure_cache_ttl: float = 10.0,
+        backend: Optional[Backend] = None,
+        snapshot: Union[str, VerdictSnapshot, None] = None,
+        scheduler: Optional[RequestScheduler] = None,
+    ):
+        self.api_key = api_key
+        self.model = model
+        self.cache = cache
+        self.memory_cache: Optional[MemoryCache] = (
+            MemoryCache(memory_cache_size, memory_cache_ttl)
+            if memory_cache_size > 0
+            else None
+        )
+        self._in_flight: SingleFlight[Tuple[Dict, bool]] = SingleFlight()
+        self.failure_cache: Optional[MemoryCache] = (
+            MemoryCache(max(1000, memory_cache_size // 10), failure_cache_ttl)
+            if failure_cache_ttl > 0
+            else None
+        )
+        self.max_workers = max_workers
+        self.transport = transport or HTTPTransport(pool_size=max(10, max_workers))
+        self.lexicon: Optional[IngredientLexicon] = (
+            get_default_lexicon() if use_lexicon else None
+        )
+        self.chunk_size = chunk_size
+        self._owns_snapshot = isinstance(snapshot, str)
+        self.snapshot = self._load_snapshot(snapshot)
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.circuit_breaker = (
+            circuit_breaker if circuit_breaker is not None else CircuitBreaker()
+        )
+        if self.circuit_breaker.on_state_change is None:
+            self.circuit_breaker.on_state_change = self._on_circuit_change
+        self.scheduler = scheduler if scheduler is not None else RequestScheduler()
+        if getattr(self.transport, "metrics", None) is None:
+            self.transport.metrics = self.metrics
+        if getattr(self.transport, "scheduler", None) is None:
+            self.transport.scheduler = self.scheduler
+        self.backend: Backend = (
+            backend
+            if backend is not None
+            else PollinationsBackend(api_key=api_key, transport=self.transport)
+        )
+        if (
+            hasattr(self.backend, "metrics")
+            and getattr(self.backend, "metrics") is None
+        ):
+            setattr(self.backend, "metrics", self.metrics)
+        if (
+            hasattr(self.backend, "scheduler")
+            and getattr(self.backend, "scheduler") is None
+        ):
+            setattr(self.backend, "scheduler", self.scheduler)
+        self.halal_keywords = ["halal", "permissible", "allowed", "clean", "pure"]
+        self.haram_keywords = ["haram", "forbidden", "prohibited", "unclean", "impure"]
+        
+    def __enter__(self) -> "HalalDetector":
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+    
+    @property
+    def base_url(self) -> str:
+        return str(getattr(self.backend, "url", ""))
+    
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        self.backend = PollinationsBackend(value, self.api_key, self.transport)
+    
+    def close(self) -> None:
+        self.backend.close()
+        self.transport.close()
+        if self.snapshot is not None and self._owns_snapshot:
+            self.snapshot.close()
+    
+    def _clean_response(self, text: str) -> str:
+        return strip_boilerplate(text)
+    
+    def _cache_lookup(self, prompt: str, context: str, prompt_version: str = SYSTEM_PROMPT_VERSION) -> Tuple[str, Optional[Dict]]:
+        cache_key = make_cache_key(prompt, context, self.model, prompt_version)
+        if cache_bypassed():
+            return cache_key, None
+        if self.memory_cache is not None:
+            cached = self.memory_cache.get(cache_key)
+            if cached is not None:
+                self.metrics.inc("cache_lookups_total", result="memory_hit")
+                return cache_key, cached
+        if self.cache is None:
+            return cache_key, None
+        cached = self.cache.get(cache_key)
+        self.metrics.inc("cache_lookups_total", result="miss" if cached is None else "hit")
+        if cached is not None and self.memory_cache is not None:
+            self.memory_cache.set(cache_key, cached)
+        return cache_key, cached
+    
+    def _cache_store(self, cache_key: Optional[str], ai_response: Dict, cacheable: bool) -> None:
+        if not cacheable or cache_key is None:
+            return
+        if self.memory_cache is not None:
+            self.memory_cache.set(cache_key, ai_response)
+        if self.cache is not None:
+            self.cache.set(cache_key, ai_response)
+    
+    def _build_payload(self, prompt: str, context: str = "", system_prompt: str = SYSTEM_PROMPT, max_tokens: Optional[int] = None) -> Dict:
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": f"{context}\n\n{prompt}" if context else prompt}
+        ]
+        payload = {
+            "messages": messages,
+            "model": self.model,
+            "private": True
+        }
+        if max_tokens is not None:
+            payload["max_tokens"] = max_tokens
+        return payload
+    
+    def _response_schema(self, payload: Dict) -> Schema:
+        return RESPONSE_SCHEMAS.get(payload["messages"][0]["content"], DETAILED)
+    
+    def _parse_ai_text(self, text: str, schema: Schema = DETAILED) -> Tuple[Dict, bool]:
+        started = time.perf_counter()
+        cleaned_text = self._clean_response(text)
+        cleaned = time.perf_counter()
+        self.metrics.observe("request_seconds", cleaned - started, phase="clean")
+        try:
+            parsed = validate(extract_json(cleaned_text, (dict, list) if schema.packed else dict), schema)
+        except ValueError as e:
+            invalid_schema = isinstance(e, SchemaError)
+            self.metrics.observe("request_seconds", time.perf_counter() - cleaned, phase="parse")
+            self.metrics.inc("parse_failures_total", operation=current_operation() or "internal")
+            self.metrics.inc("fallbacks_total", kind="invalid_schema" if invalid_schema else "invalid_json")
             return {
-                "status": "Error",
-                "explanation": str(e),
+                "status": "Unknown",
+                "explanation": cleaned_text,
                 "confidence": "Low",
-                "concerns": ["Network Error"],
-                "recommendations": ["Check internet connection", "Verify API availability"],
+                "concerns": ["Invalid response schema" if invalid_schema else "Invalid JSON response"],
+                "recommendations": ["Verify with Islamic scholar"],
                 "certification_required": True,
                 "alternatives": []
-            }
+            }, False
+        self.metrics.observe("request_seconds", time.perf_counter() - cleaned, phase="parse")
+        return parsed, True
     
-    def detect_ingredient(self, ingredient: str, context: str = "") -> Dict[str, Union[str, bool, List]]:
-        context_info = f"Context: {context}" if context else ""
-        prompt = f"Analyze this ingredient for halal/haram status: '{ingredient}'. {context_info}\n\nConsider:\n1. Source and origin of the ingredient\n2. Processing methods used\n3. Potential cross-contamination risks\n4. Regional halal standards\n5. Modern food production practices\n\nProvide comprehensive analysis with Islamic reasoning."
-        
-        ai_response = self._generate_ai_response(prompt, context)
-        
+    def _http_error_response(self, status_code: int) -> Dict:
+        self.metrics.inc("fallbacks_total", kind="http_error")
         return {
-            "ingredient": ingredient,
-            "status": ai_response.get("status", "Unknown"),
-            "explanation": ai_response.get("explanation", "No explanation provided"),
-            "confidence": ai_response.get("confidence", "Low"),
-            "concerns": ai_response.get("concerns", []),
-            "recommendations": ai_response.get("recommendations", []),
-            "certification_required": ai_response.get("certification_required", False),
-            "alternatives": ai_response.get("alternatives", [])
+            "status": "Error",
+            "explanation": f"HTTP {status_code}",
+            "confidence": "Low",
+            "concerns": ["API Error"],
+            "recommendations": ["Check internet connection", "Try again later"],
+            "certification_required": True,
+            "alternatives": []
+        }
+    
+    def _network_error_response(self, error: BaseException) -> Dict:
+        self.metrics.inc("fallbacks_total", kind="network_error")
+        return {
+            "status": "Error",
+            "explanation": str(error) or error.__class__.__name__,
+            "confidence": "Low",
+            "concerns": ["Network Error"],
+            "recommendations": ["Check internet connection", "Verify API availability"],
+            "certification_required": True,
+            "alternatives": []
+        }
+    
+    def _on_circuit_change(self, previous: str, state: str) -> None:
+        self.metrics.inc("circuit_transitions_total", state=state)
+        self.metrics.emit("circuit", previous=previous, state=state)
+    
+    def _circuit_open_response(self) -> Dict:
+        self.metrics.inc("fallbacks_total", kind="circuit_open")
+        return {
+            "status": "Error",
+            "explanation": f"Upstream unavailable: circuit breaker open, retrying in {self.circuit_breaker.retry_after():.0f}s",
+            "confidence": "Low",
+            "concerns": ["Circuit Open"],
+            "recommendations": ["Try again later"],
+            "certification_required": True,
+            "alternatives": []
         }
     
-    def detect_food_item(self, food_name: str, preparation_method: str = "", region: str = "") -> Dict[str, Union[str, bool, List]]:
+    def _record_outcome(self, status_code: Optional[int]) -> None:
+        if status_code is None or status_code in RETRY_STATUSES:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+    
+    def _failure_lookup(self, cache_key: str) -> Optional[Dict]:
+        failed = self.failure_cache.get(cache_key) if self.failure_cache is not None and not cache_bypassed() else None
+        if failed is not None:
+            self.metrics.inc("fallbacks_total", kind="negative_cache")
+        return failed
+    
+    def _failure_store(self, cache_key: str, ai_response: Dict) -> None:
+        if self.failure_cache is not None and ai_response.get("status") == "Error" and ai_response.get("concerns") != ["Circuit Open"]:
+            self.failure_cache.set(cache_key, ai_response)
+    
+    def _generate_ai_response(self, prompt: str, context: str = "", system_prompt: str = SYSTEM_PROMPT, prompt_version: str = SYSTEM_PROMPT_VERSION, max_tokens: Optional[int] = None) -> Dict:
+        cache_key, cached = self._cache_lookup(prompt, context, prompt_version)
+        if cached is None:
+            cached = self._failure_lookup(cache_key)
+        if cached is not None:
+            return cached
+        
+        (ai_response, cacheable), shared = self._in_flight.do(cache_key, lambda: self._request_ai_response(prompt, context, system_prompt, max_tokens))
+        if shared:
+            self.metrics.inc("coalesced_requests_total")
+            ai_response = copy.deepcopy(ai_response)
+        else:
+            self._cache_store(cache_key, ai_response, cacheable)
+            self._failure_store(cache_key, ai_response)
+        return ai_response
+    
+    def _record_request(self, status: Union[int, str], seconds: float, sent: int = 0, received: int = 0, error: Optional[BaseException] = None) -> None:
+        operation = current_operation() or "internal"
+        self.metrics.inc("requests_total", operation=operation, status=status)
+        self.metrics.observe("request_seconds", seconds, phase="network")
+        self.metrics.observe("operation_request_seconds", seconds, operation=operation)
+        self.metrics.inc("request_bytes_total", sent, direction="sent")
+        self.metrics.inc("request_bytes_total", received, direction="received")
+        self.metrics.emit("request", operation=operation, status=status, seconds=seconds, bytes_sent=sent, bytes_received=received, error=error)
+    
+    def _request_ai_response(self, prompt: str, context: str = "", system_prompt: str = SYSTEM_PROMPT, max_tokens: Optional[int] = None) -> Tuple[Dict, bool]:
+        if not self.circuit_breaker.allow():
+            return self._circuit_open_response(), False
+        
+        level = current_priority()
+        self._record_wait(level, self.scheduler.acquire(level))
+        payload = self._build_payload(prompt, context, system_prompt, max_tokens)
+        started = time.perf_counter()
+        try:
+            response = self.backend.complete(payload)
+        except Exception as e:
+            self._record_request(e.__class__.__name__, time.perf_counter() - started, error=e)
+            self._record_outcome(None)
+            return self._network_error_response(e), False
+        finally:
+            self.scheduler.release()
+        
+        return self._backend_response(response, time.perf_counter() - started, self._response_schema(payload))
+    
+    def _record_wait(self, level: Priority, seconds: float) -> None:
+        if self.scheduler.limited:
+            self.metrics.observe("scheduler_wait_seconds", seconds, priority=level.name.lower())
+    
+    def _backend_response(self, response: BackendResponse, seconds: float, schema: Schema = DETAILED) -> Tuple[Dict, bool]:
+        self._record_request(response.status, seconds, response.sent, response.received)
+        self._record_outcome(response.status)
+        if response.status == 429:
+            self.scheduler.pause()
+        if response.status == 200:
+            return self._parse_ai_text(response.text, schema)
+        return self._http_error_response(response.status), False
+    
+    def _ingredient_prompt(self, ingredient: str, context: str = "") -> str:
+        context_info = f"Context: {context}" if context else ""
+        return f"Analyze this ingredient for halal/haram status: '{ingredient.strip()}'. {context_info}\n\nConsider:\n1. Source and origin of the ingredient\n2. Processing methods used\n3. Potential cross-contamination risks\n4. Regional halal standards\n5. Modern food production practices\n\nProvide comprehensive analysis with Islamic reasoning."
+    
+    def _ingredient_result(self, ingredient: str, ai_response: Dict) -> IngredientResult:
+        return IngredientResult.from_response(ingredient, ai_response)
+    
+    def _food_item_prompt(self, food_name: str, preparation_method: str = "", region: str = "") -> Tuple[str, str]:
         context_parts = []
         if preparation_method:
             context_parts.append(f"Preparation method: {preparation_method}")
@@ -121,35 +395,211 @@ REQUIRED JSON FORMAT:
         context = "; ".join(context_parts)
         
         prompt = f"Analyze this food item for halal/haram status: '{food_name}'.\n\nConsider:\n1. All potential ingredients and additives\n2. Food preparation and cooking methods\n3. Cross-contamination risks\n4. Regional halal standards and practices\n5. Modern food processing techniques\n6. Storage and handling procedures\n\nProvide detailed analysis with specific Islamic reasoning."
+        return prompt, context
+    
+    def _food_item_result(self, food_name: str, ai_response: Dict) -> FoodItemResult:
+        return FoodItemResult.from_response(food_name, ai_response)
+    
+    def _load_snapshot(self, snapshot: Union[str, VerdictSnapshot, None]) -> Optional[VerdictSnapshot]:
+        if snapshot is None:
+            return None
+        if isinstance(snapshot, str):
+            snapshot = VerdictSnapshot(snapshot)
+        if snapshot.model != self.model or snapshot.prompt_version != SYSTEM_PROMPT_VERSION:
+            raise ValueError(f"Snapshot {snapshot.path} was built for model {snapshot.model!r} with prompt version {snapshot.prompt_version!r}")
+        return snapshot
+    
+    def _local_response(self, name: str) -> Optional[Dict]:
+        local_response = self._lexicon_response(name)
+        if local_response is None and self.snapshot is not None and not cache_bypassed():
+            local_response = self.snapshot.get(name)
+            if local_response is not None:
+                self.metrics.inc("snapshot_hits_total")
+        return local_response
+    
+    def _lexicon_response(self, name: str) -> Optional[Dict]:
+        if self.lexicon is None:
+            return None
+        match = self.lexicon.resolve(name)
+        if match is None:
+            return None
+        
+        self.metrics.inc("lexicon_hits_total", status=match.status)
+        terms = ", ".join(match.terms)
+        note = f" ({match.note})" if match.note else ""
+        return {
+            "status": match.status,
+            "explanation": f"Resolved from the built-in ingredient lexicon: {terms}{note} is {match.status.lower()}.",
+            "confidence": "High",
+            "concerns": [] if match.status == HALAL else [f"Contains {terms}"],
+            "recommendations": [] if match.status == HALAL else ["Avoid this item"],
+            "certification_required": False,
+            "alternatives": []
+        }
+    
+    def detect_ingredient(self, ingredient: str, context: str = "") -> IngredientResult:
+        local_response = self._local_response(ingredient) if not context else None
+        if local_response is not None:
+            return self._ingredient_result(ingredient, local_response)
+        
+        ai_response = self._generate_ai_response(self._ingredient_prompt(ingredient, context), context)
+        return self._ingredient_result(ingredient, ai_response)
+    
+    def detect_food_item(self, food_name: str, preparation_method: str = "", region: str = "") -> FoodItemResult:
+        local_response = self._local_response(food_name) if not preparation_method and not region else None
+        if local_response is not None:
+            return self._food_item_result(food_name, local_response)
         
+        prompt, context = self._food_item_prompt(food_name, preparation_method, region)
         ai_response = self._generate_ai_response(prompt, context)
+        return self._food_item_result(food_name, ai_response)
+    
+    def _verdict_prompt(self, item: str) -> str:
+        return f"Item: '{item.strip()}'"
+    
+    def _verdict_result(self, item: str, ai_response: Dict) -> VerdictResult:
+        return VerdictResult.from_response(item, ai_response)
+    
+    def _local_verdict(self, item: str) -> Optional[Dict]:
+        local_response = self._local_response(item)
+        if local_response is None:
+            _, local_response = self._cache_lookup(self._ingredient_prompt(item), "")
+        return local_response
+    
+    def detect_verdict(self, item: str) -> VerdictResult:
+        local_response = self._local_verdict(item)
+        if local_response is not None:
+            return self._verdict_result(item, local_response)
         
-        return {
-            "food_item": food_name,
-            "status": ai_response.get("status", "Unknown"),
-            "explanation": ai_response.get("explanation", "No explanation provided"),
-            "confidence": ai_response.get("confidence", "Low"),
-            "concerns": ai_response.get("concerns", []),
-            "recommendations": ai_response.get("recommendations", []),
-            "certification_required": ai_response.get("certification_required", False),
-            "alternatives": ai_response.get("alternatives", [])
-        }
+        ai_response = self._generate_ai_response(self._verdict_prompt(item), "", VERDICT_SYSTEM_PROMPT, VERDICT_PROMPT_VERSION, VERDICT_MAX_TOKENS)
+        return self._verdict_result(item, ai_response)
+    
+    def _packed_prompt(self, ingredients: List[str], context: str = "") -> str:
+        context_info = f"Context: {context}\n\n" if context else ""
+        return f"Analyze each of these ingredients for halal/haram status. {context_info}Consider source, processing methods, cross-contamination risks and regional halal standards.\n\nITEMS:\n{json.dumps(ingredients, ensure_ascii=False)}"
+    
+    def _request_packed(self, ingredients: List[str], context: str = "") -> Tuple[Dict[str, Dict], Optional[Dict]]:
+        ai_response, _ = self._request_ai_response(self._packed_prompt(ingredients, context), context, PACKED_SYSTEM_PROMPT)
+        return self._packed_verdicts(ai_response)
+    
+    def _packed_verdicts(self, ai_response: Dict) -> Tuple[Dict[str, Dict], Optional[Dict]]:
+        if isinstance(ai_response, dict) and ai_response.get("status") == "Error":
+            return {}, ai_response
+        
+        records: object = ai_response.get("results", ai_response) if isinstance(ai_response, dict) else ai_response
+        if isinstance(records, dict):
+            records = [dict(record, ingredient=name) for name, record in records.items() if isinstance(record, dict)]
+        
+        verdicts: Dict[str, Dict] = {}
+        if isinstance(records, list):
+            for record in records:
+                if not isinstance(record, dict) or not isinstance(record.get("ingredient"), str):
+                    continue
+                if not isinstance(record.get("status"), str) or record["status"].lower() not in VALID_STATUSES:
+                    continue
+                verdicts[record["ingredient"].strip().lower()] = {k: v for k, v in record.items() if k != "ingredient"}
+        return verdicts, None
+    
+    def _detect_chunk(self, chunk: List[str], context: str = "") -> Dict[str, IngredientResult]:
+        verdicts, error_response = self._request_packed(chunk, context)
+        if error_response is not None:
+            return {ingredient: self._ingredient_result(ingredient, error_response) for ingredient in chunk}
+        
+        missing = [ingredient for ingredient in chunk if ingredient.strip().lower() not in verdicts]
+        if 1 < len(missing) < len(chunk):
+            self.metrics.inc("fallbacks_total", kind="packed_retry")
+            retried, _ = self._request_packed(missing, context)
+            verdicts.update(retried)
+        
+        results = {}
+        for ingredient in chunk:
+            verdict = verdicts.get(ingredient.strip().lower())
+            if verdict is None:
+                self.metrics.inc("fallbacks_total", kind="packed_single")
+                results[ingredient] = self.detect_ingredient(ingredient, context)
+                continue
+            results[ingredient] = self._store_packed_verdict(ingredient, verdict, context)
+        return results
     
-    def batch_detect(self, items: List[str], item_type: str = "ingredient") -> List[Dict[str, Union[str, bool, List]]]:
-        results = []
-        for item in items:
-            if item_type == "ingredient":
-                result = self.detect_ingredient(item)
+    def _store_packed_verdict(self, ingredient: str, verdict: Dict, context: str = "") -> IngredientResult:
+        cache_key, _ = self._cache_lookup(self._ingredient_prompt(ingredient, context), context)
+        self._cache_store(cache_key, verdict, True)
+        return self._ingredient_result(ingredient, verdict)
+    
+    def _packed_local_results(self, ingredients: List[str], context: str = "") -> Tuple[Dict[str, IngredientResult], List[str]]:
+        results = {}
+        remaining = []
+        for ingredient in ingredients:
+            local_response = self._local_response(ingredient) if not context else None
+            if local_response is None:
+                _, local_response = self._cache_lookup(self._ingredient_prompt(ingredient, context), context)
+            if local_response is not None:
+                results[ingredient] = self._ingredient_result(ingredient, local_response)
             else:
-                result = self.detect_food_item(item)
-            results.append(result)
+                remaining.append(ingredient)
+        return results, remaining
+    
+    def _packed_chunks(self, ingredients: List[str], chunk_size: Optional[int] = None) -> List[List[str]]:
+        size = max(1, chunk_size or self.chunk_size)
+        return [ingredients[i:i + size] for i in range(0, len(ingredients), size)]
+    
+    def _classify_packed(self, ingredients: List[str], context: str = "", chunk_size: Optional[int] = None, max_workers: Optional[int] = None, timeout: Optional[float] = None) -> Dict[str, IngredientResult]:
+        results, remaining = self._packed_local_results(ingredients, context)
+        chunks = self._packed_chunks(remaining, chunk_size)
+        for _, chunk_results in run_parallel(
+            lambda chunk: self._detect_chunk(chunk, context),
+            chunks,
+            on_error=lambda chunk, error: {ingredient: self._ingredient_result(ingredient, self._item_error_response(error)) for ingredient in chunk},
+            max_workers=max_workers or self.max_workers,
+            timeout=timeout,
+            preserve_order=False
+        ):
+            results.update(chunk_results)
         return results
     
+    def _item_error_response(self, error: BaseException) -> Dict:
+        self.metrics.inc("fallbacks_total", kind="timeout" if isinstance(error, ItemTimeoutError) else "processing_error")
+        return {
+            "status": "Error",
+            "explanation": str(error) or error.__class__.__name__,
+            "confidence": "Low",
+            "concerns": ["Timeout" if isinstance(error, ItemTimeoutError) else "Processing Error"],
+            "recommendations": ["Try again later"],
+            "certification_required": True,
+            "alternatives": []
+        }
+    
+    def iter_batch_detect(self, items: Iterable[str], item_type: str = "ingredient", max_workers: Optional[int] = None, timeout: Optional[float] = None, preserve_order: bool = False) -> Iterator[Union[IngredientResult, FoodItemResult]]:
+        if item_type == "ingredient":
+            detect: Callable[[str], Union[IngredientResult, FoodItemResult]] = self.detect_ingredient
+            shape: Callable[[str, Dict], Union[IngredientResult, FoodItemResult]] = self._ingredient_result
+        else:
+            detect = self.detect_food_item
+            shape = self._food_item_result
+        
+        for _, result in run_parallel(
+            detect,
+            items,
+            on_error=lambda item, error: shape(item, self._item_error_response(error)),
+            max_workers=max_workers or self.max_workers,
+            timeout=timeout,
+            preserve_order=preserve_order
+        ):
+            yield result
+    
+    def batch_detect(self, items: List[str], item_type: str = "ingredient", max_workers: Optional[int] = None, timeout: Optional[float] = None, packed: bool = False) -> List[Union[IngredientResult, FoodItemResult]]:
+        if packed and item_type == "ingredient":
+            classified = self.classify_ingredients(items, max_workers=max_workers, timeout=timeout, packed=True)
+            return [classified[item] for item in items]
+        return list(self.iter_batch_detect(items, item_type, max_workers, timeout, preserve_order=True))
+    
+    def _alternatives_prompt(self, haram_item: str) -> str:
+        return f"Provide 3-5 halal alternatives for this haram/questionable item: '{haram_item}'. Respond with JSON: {{'alternatives': ['alternative1', 'alternative2', 'alternative3', 'alternative4', 'alternative5']}}"
+    
     def get_halal_alternatives(self, haram_item: str) -> List[str]:
-        prompt = f"Provide 3-5 halal alternatives for this haram/questionable item: '{haram_item}'. Respond with JSON: {{'alternatives': ['alternative1', 'alternative2', 'alternative3', 'alternative4', 'alternative5']}}"
-        
-        ai_response = self._generate_ai_response(prompt)
-        
+        return self._alternatives_result(self._generate_ai_response(self._alternatives_prompt(haram_item)))
+    
+    def _alternatives_result(self, ai_response: Dict) -> List[str]:
         if isinstance(ai_response, dict) and "alternatives" in ai_response:
             return ai_response["alternatives"][:5]
         
@@ -163,11 +613,13 @@ REQUIRED JSON FORMAT:
         
         return alternatives[:5]
     
+    def _certification_prompt(self, brand: str, product: str) -> str:
+        return f"Check if '{brand}' brand's '{product}' has halal certification. Respond with JSON: {{'has_certification': true/false, 'certifying_body': 'body name', 'reliability': 'High/Medium/Low', 'details': 'detailed information'}}"
+    
     def verify_certification(self, brand: str, product: str) -> Dict[str, Union[str, bool, List]]:
-        prompt = f"Check if '{brand}' brand's '{product}' has halal certification. Respond with JSON: {{'has_certification': true/false, 'certifying_body': 'body name', 'reliability': 'High/Medium/Low', 'details': 'detailed information'}}"
-        
-        ai_response = self._generate_ai_response(prompt)
-        
+        return self._certification_result(brand, product, self._generate_ai_response(self._certification_prompt(brand, product)))
+    
+    def _certification_result(self, brand: str, product: str, ai_response: Dict) -> Dict[str, Union[str, bool, List]]:
         return {
             "brand": brand,
             "product": product,
@@ -178,80 +630,88 @@ REQUIRED JSON FORMAT:
         }
     
     def is_halal(self, item: str) -> bool:
-        result = self.detect_ingredient(item)
-        return result["status"].lower() == "halal"
+        return self.detect_verdict(item).status is Status.HALAL
     
     def is_haram(self, item: str) -> bool:
-        result = self.detect_ingredient(item)
-        return result["status"].lower() == "haram"
+        return self.detect_verdict(item).status is Status.HARAM
     
     def is_questionable(self, item: str) -> bool:
-        result = self.detect_ingredient(item)
-        return result["status"].lower() == "questionable"
+        return self.detect_verdict(item).status is Status.QUESTIONABLE
     
-    def quick_check(self, item: str) -> str:
-        result = self.detect_ingredient(item)
-        return result["status"]
+    def quick_check(self, item: str) -> Status:
+        return self.detect_verdict(item).status
     
     def get_halal_score(self, item: str) -> int:
-        result = self.detect_ingredient(item)
-        if result["status"].lower() == "halal":
-            return 100
-        elif result["status"].lower() == "questionable":
-            return 50
-        elif result["status"].lower() == "haram":
-            return 0
-        else:
-            return -1
+        return HALAL_SCORES.get(self.detect_verdict(item).status, -1)
     
-    def check_ingredients_list(self, ingredients: List[str]) -> Dict[str, str]:
-        results = {}
+    def classify_ingredients(self, ingredients: List[str], context: str = "", max_workers: Optional[int] = None, timeout: Optional[float] = None, packed: bool = False, chunk_size: Optional[int] = None) -> Dict[str, IngredientResult]:
+        unique: Dict[str, str] = {}
         for ingredient in ingredients:
-            result = self.detect_ingredient(ingredient)
-            results[ingredient] = result["status"]
-        return results
+            unique.setdefault(ingredient.strip().lower(), ingredient)
+        
+        unique_items = list(unique.values())
+        unique_results: Dict[str, IngredientResult] = {}
+        if packed:
+            for ingredient, result in self._classify_packed(unique_items, context, chunk_size, max_workers, timeout).items():
+                unique_results[ingredient.strip().lower()] = result
+        else:
+            for index, result in run_parallel(
+                lambda ingredient: self.detect_ingredient(ingredient, context),
+                unique_items,
+                on_error=lambda ingredient, error: self._ingredient_result(ingredient, self._item_error_response(error)),
+                max_workers=max_workers or self.max_workers,
+                timeout=timeout,
+                preserve_order=False
+            ):
+                unique_results[unique_items[index].strip().lower()] = result
+        
+        return {ingredient: unique_results[ingredient.strip().lower()] for ingredient in ingredients}
+    
+    def _filter_by_status(self, ingredients: List[str], classified: Dict[str, IngredientResult], status: Status) -> List[str]:
+        return [ingredient for ingredient in ingredients if classified[ingredient].status is status]
+    
+    def _recipe_fields(self, recipe_name: str, ingredients: List[str], classified: Dict[str, IngredientResult]) -> Tuple:
+        haram_ingredients = tuple(self._filter_by_status(ingredients, classified, Status.HARAM))
+        questionable_ingredients = tuple(self._filter_by_status(ingredients, classified, Status.QUESTIONABLE))
+        safe_ingredients = tuple(self._filter_by_status(ingredients, classified, Status.HALAL))
+        
+        overall_status = Status.HALAL
+        if haram_ingredients:
+            overall_status = Status.HARAM
+        elif questionable_ingredients:
+            overall_status = Status.QUESTIONABLE
+        
+        halal_percentage = (len(safe_ingredients) / len(ingredients)) * 100 if ingredients else 0
+        return recipe_name, overall_status, safe_ingredients, questionable_ingredients, haram_ingredients, len(ingredients), halal_percentage
+    
+    def _summarize_recipe(self, recipe_name: str, ingredients: List[str], classified: Dict[str, IngredientResult]) -> RecipeAnalysis:
+        return RecipeAnalysis(*self._recipe_fields(recipe_name, ingredients, classified))
+    
+    def check_ingredients_list(self, ingredients: List[str], packed: bool = False) -> Dict[str, str]:
+        classified = self.classify_ingredients(ingredients, packed=packed)
+        return {ingredient: str(result.status) for ingredient, result in classified.items()}
     
     def find_haram_ingredients(self, ingredients: List[str]) -> List[str]:
-        haram_list = []
-        for ingredient in ingredients:
-            if self.is_haram(ingredient):
-                haram_list.append(ingredient)
-        return haram_list
+        return self._filter_by_status(ingredients, self.classify_ingredients(ingredients), Status.HARAM)
     
     def find_questionable_ingredients(self, ingredients: List[str]) -> List[str]:
-        questionable_list = []
-        for ingredient in ingredients:
-            if self.is_questionable(ingredient):
-                questionable_list.append(ingredient)
-        return questionable_list
+        return self._filter_by_status(ingredients, self.classify_ingredients(ingredients), Status.QUESTIONABLE)
     
     def get_safe_ingredients(self, ingredients: List[str]) -> List[str]:
-        safe_list = []
-        for ingredient in ingredients:
-            if self.is_halal(ingredient):
-                safe_list.append(ingredient)
-        return safe_list
+        return self._filter_by_status(ingredients, self.classify_ingredients(ingredients), Status.HALAL)
     
-    def analyze_recipe(self, recipe_name: str, ingredients: List[str]) -> Dict:
-        haram_ingredients = self.find_haram_ingredients(ingredients)
-        questionable_ingredients = self.find_questionable_ingredients(ingredients)
-        safe_ingredients = self.get_safe_ingredients(ingredients)
-        
-        overall_status = "Halal"
-        if haram_ingredients:
-            overall_status = "Haram"
-        elif questionable_ingredients:
-            overall_status = "Questionable"
-        
-        return {
-            "recipe": recipe_name,
-            "overall_status": overall_status,
-            "safe_ingredients": safe_ingredients,
-            "questionable_ingredients": questionable_ingredients,
-            "haram_ingredients": haram_ingredients,
-            "total_ingredients": len(ingredients),
-            "halal_percentage": (len(safe_ingredients) / len(ingredients)) * 100 if ingredients else 0
-        }
+    def analyze_recipe(self, recipe_name: str, ingredients: List[str], packed: bool = False) -> RecipeAnalysis:
+        return self._summarize_recipe(recipe_name, ingredients, self.classify_ingredients(ingredients, packed=packed))
+    
+    def _summarize_label(self, product_name: str, tokens: List[LabelToken], classified: Dict[str, IngredientResult]) -> LabelAnalysis:
+        ingredients = [token.canonical for token in tokens if token.clause != MAY_CONTAIN]
+        may_contain = {token.canonical: classified[token.canonical].status for token in tokens if token.clause == MAY_CONTAIN}
+        return LabelAnalysis(*self._recipe_fields(product_name, ingredients, classified), may_contain=may_contain, tokens=tuple(tokens))
+    
+    def analyze_label(self, label_text: str, product_name: str = "", packed: bool = False) -> LabelAnalysis:
+        tokens = parse_label(label_text)
+        classified = self.classify_ingredients([token.canonical for token in tokens], packed=packed)
+        return self._summarize_label(product_name, tokens, classified)
     
     def get_halal_certified_brands(self, category: str = "food") -> List[str]:
         prompt = f"List 10 halal certified brands in {category} category. Respond with JSON: {{'brands': ['brand1', 'brand2', 'brand3', 'brand4', 'brand5', 'brand6', 'brand7', 'brand8', 'brand9', 'brand10']}}"
@@ -263,11 +723,13 @@ REQUIRED JSON FORMAT:
         
         return []
     
+    def _restaurant_prompt(self, restaurant_name: str, location: str = "") -> str:
+        return f"Check if '{restaurant_name}' restaurant{f' in {location}' if location else ''} is halal certified. Respond with JSON: {{'is_halal': true/false, 'certification_body': 'body name', 'last_verified': 'date', 'notes': 'additional info'}}"
+    
     def check_restaurant_halal(self, restaurant_name: str, location: str = "") -> Dict:
-        prompt = f"Check if '{restaurant_name}' restaurant{f' in {location}' if location else ''} is halal certified. Respond with JSON: {{'is_halal': true/false, 'certification_body': 'body name', 'last_verified': 'date', 'notes': 'additional info'}}"
-        
-        ai_response = self._generate_ai_response(prompt)
-        
+        return self._restaurant_result(restaurant_name, location, self._generate_ai_response(self._restaurant_prompt(restaurant_name, location)))
+    
+    def _restaurant_result(self, restaurant_name: str, location: str, ai_response: Dict) -> Dict:
         return {
             "restaurant": restaurant_name,
             "location": location,
@@ -308,12 +770,15 @@ REQUIRED JSON FORMAT:
             "details": ai_response.get("details", ai_response.get("explanation", "No validation details"))
         }
     
-    def advanced_ingredient_analysis(self, ingredient: str, source_country: str = "", processing_method: str = "") -> Dict:
+    def _advanced_analysis_prompt(self, ingredient: str, source_country: str = "", processing_method: str = "") -> Tuple[str, str]:
         context = f"Source country: {source_country}; Processing method: {processing_method}" if source_country or processing_method else ""
-        prompt = f"Perform advanced halal analysis for ingredient: '{ingredient}'.\n\nAnalyze:\n1. Ingredient composition and molecular structure\n2. Manufacturing processes and chemical treatments\n3. Potential haram derivatives or by-products\n4. Cross-contamination risks in production\n5. Storage and transportation considerations\n6. Regional halal certification standards\n7. Alternative halal sources and suppliers\n\nProvide comprehensive technical analysis."
-        
-        ai_response = self._generate_ai_response(prompt, context)
-        
+        return f"Perform advanced halal analysis for ingredient: '{ingredient}'.\n\nAnalyze:\n1. Ingredient composition and molecular structure\n2. Manufacturing processes and chemical treatments\n3. Potential haram derivatives or by-products\n4. Cross-contamination risks in production\n5. Storage and transportation considerations\n6. Regional halal certification standards\n7. Alternative halal sources and suppliers\n\nProvide comprehensive technical analysis.", context
+    
+    def advanced_ingredient_analysis(self, ingredient: str, source_country: str = "", processing_method: str = "") -> Dict:
+        prompt, context = self._advanced_analysis_prompt(ingredient, source_country, processing_method)
+        return self._advanced_analysis_result(ingredient, source_country, processing_method, self._generate_ai_response(prompt, context))
+    
+    def _advanced_analysis_result(self, ingredient: str, source_country: str, processing_method: str, ai_response: Dict) -> Dict:
         return {
             "ingredient": ingredient,
             "source_country": source_country,
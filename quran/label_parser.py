@@ -0,0 +1,336 @@
+import re
+from functools import lru_cache
+from typing import List, NamedTuple, Set, Tuple
+
+from .lexicon import normalize_ingredient
+
+INGREDIENTS = "ingredients"
+CONTAINS = "contains"
+MAY_CONTAIN = "may_contain"
+
+_EVENT_RE = re.compile(r"[()\[\]{},;]|\.(?!\d)")
+_PERCENT_RE = re.compile(r"\d+(?:[.,]\d+)?\s*%")
+_AND_RE = re.compile(r"\s+(?:and|&)\s+|\s*&\s*")
+_CLAUSE_RE = re.compile(
+    r"\s*(?:"
+    r"(?P<ingredients>ingredients?(?:\s+list)?|contains\s+(?:less\s+than\s+)?"
+    r"\d+(?:[.,]\d+)?\s*%\s+(?:or\s+less\s+)?of(?:\s+each\s+of)?"
+    r"(?:\s+the\s+following)?)"
+    r"|(?P<may_contain>may\s+(?:also\s+)?contains?(?:\s+traces?\s+of)?"
+    r"|(?:produced|made|manufactured)\s+in\s+a\s+(?:factory|facility)\s+"
+    r"(?:that\s+)?(?:also\s+)?(?:handles|processes|uses)"
+    r"|traces?\s+of)"
+    r"|(?P<contains>contains|allergens?|allergy\s+advice)"
+    r")\s*:?\s*",
+    re.IGNORECASE,
+)
+_FUNCTIONAL_CLASSES = frozenset(
+    normalize_ingredient(name)
+    for name in (
+        "emulsifier",
+        "emulsifiers",
+        "stabiliser",
+        "stabilisers",
+        "stabilizer",
+        "stabilizers",
+        "thickener",
+        "thickeners",
+        "thickening agent",
+        "preservative",
+        "preservatives",
+        "colour",
+        "colours",
+        "color",
+        "colors",
+        "colouring",
+        "coloring",
+        "antioxidant",
+        "antioxidants",
+        "acidity regulator",
+        "acidity regulators",
+        "acid",
+        "acids",
+        "raising agent",
+        "raising agents",
+        "leavening",
+        "leavening agents",
+        "sweetener",
+        "sweeteners",
+        "flavour enhancer",
+        "flavour enhancers",
+        "flavor enhancer",
+        "flavor enhancers",
+        "gelling agent",
+        "gelling agents",
+        "humectant",
+        "humectants",
+        "firming agent",
+        "glazing agent",
+        "glazing agents",
+        "anti caking agent",
+        "anti caking agents",
+        "anticaking agent",
+        "bulking agent",
+        "flour treatment agent",
+        "modified starch",
+        "vitamins",
+        "minerals",
+        "vitamins and minerals",
+        "spices",
+        "herbs",
+        "seasoning",
+        "spice blend",
+    )
+)
+_GENERIC_HEADS = {
+    normalize_ingredient(name): noun
+    for name, noun in (
+        ("vegetable oil", "oil"),
+        ("vegetable oils", "oil"),
+        ("vegetable fat", "fat"),
+        ("vegetable fats", "fat"),
+        ("plant oil", "oil"),
+        ("oil", "oil"),
+        ("oils", "oil"),
+        ("fat", "fat"),
+        ("fats", "fat"),
+        ("modified starch", "starch"),
+        ("starch", "starch"),
+        ("flour", "flour"),
+    )
+}
+_TRIM_CHARS = frozenset(" \t\r\n*-:•·")
+_SOURCE_QUALIFIERS = frozenset(
+    (
+        "beef",
+        "bovine",
+        "pork",
+        "porcine",
+        "pig",
+        "fish",
+        "chicken",
+        "poultry",
+        "halal",
+        "vegetable",
+        "plant",
+        "animal",
+        "soy",
+        "soya",
+        "sunflower",
+        "rapeseed",
+        "palm",
+        "lamb",
+        "mutton",
+        "goat",
+        "turkey",
+        "microbial",
+        "synthetic",
+        "non animal",
+    )
+)
+
+
+class LabelToken(NamedTuple):
+    canonical: str
+    text: str
+    start: int
+    end: int
+    clause: str = INGREDIENTS
+    group: str = ""
+
+
+class _Item:
+    __slots__ = ("start", "end", "pieces", "groups", "sentence_end")
+
+    def __init__(self, start: int):
+        self.start = start
+        self.end = start
+        self.pieces: List[Tuple[int, int]] = []
+        self.groups: List[List["_Item"]] = []
+        self.sentence_end = False
+
+
+def _build_tree(text: str) -> List[_Item]:
+    root: List[_Item] = []
+    stack: List[Tuple[List[_Item], _Item]] = []
+    group = root
+    item = _Item(0)
+    cursor = 0
+    for match in _EVENT_RE.finditer(text):
+        position, after = match.span()
+        char = text[position]
+        if char in "([{":
+            item.pieces.append((cursor, position))
+            child_group: List[_Item] = []
+            item.groups.append(child_group)
+            stack.append((group, item))
+            group = child_group
+            item = _Item(after)
+        elif char in ")]}":
+            if not stack:
+                continue
+            item.pieces.append((cursor, position))
+            item.end = position
+            group.append(item)
+            group, item = stack.pop()
+        else:
+            item.pieces.append((cursor, position))
+            item.end = position
+            item.sentence_end = char == "."
+            group.append(item)
+            item = _Item(after)
+        cursor = after
+
+    item.pieces.append((cursor, len(text)))
+    item.end = len(text)
+    item.sentence_end = True
+    group.append(item)
+    while stack:
+        group, item = stack.pop()
+        item.end = len(text)
+        item.sentence_end = True
+        group.append(item)
+    return root
+
+
+@lru_cache(maxsize=65536)
+def _clean_head(text: str) -> str:
+    if "%" in text:
+        text = _PERCENT_RE.sub(" ", text)
+    if ":" in text:
+        text = text.rsplit(":", 1)[1]
+    text = " ".join(text.split()).strip(" .*-")
+    if text[:4].lower() == "and ":
+        text = text[4:]
+    return text
+
+
+class _LabelParser:
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens: List[LabelToken] = []
+        self.seen: Set[str] = set()
+
+    def _span(self, start: int, end: int) -> Tuple[int, int]:
+        text = self.text
+        while start < end and text[start] in _TRIM_CHARS:
+            start += 1
+        while end > start and text[end - 1] in _TRIM_CHARS:
+            end -= 1
+        return start, end
+
+    def walk(
+        self, items: List[_Item], clause: str, group: str = "", suffix: str = ""
+    ) -> None:
+        current = clause
+        for item in items:
+            start, end = self._span(item.start, item.end)
+            if start < end:
+                head_start = start
+                pieces = item.pieces
+                if len(pieces) == 1:
+                    head = self.text[pieces[0][0] : pieces[0][1]]
+                else:
+                    head = "".join(self.text[s:e] for s, e in pieces)
+                match = _CLAUSE_RE.match(head)
+                if match is not None and match.lastgroup:
+                    current = match.lastgroup
+                    head = head[match.end() :]
+                    if item.pieces:
+                        head_start, _ = self._span(item.pieces[0][0] + match.end(), end)
+                    start = head_start
+                if current != INGREDIENTS and not group and not item.groups:
+                    self._allergens(head_start, end, current)
+                else:
+                    self._item(item, head, start, end, current, group, suffix)
+            if item.sentence_end:
+                current = clause
+
+    def _allergens(self, start: int, end: int, clause: str) -> None:
+        position = start
+        for match in _AND_RE.finditer(self.text, start, end):
+            self._emit_text(position, match.start(), clause)
+            position = match.end()
+        self._emit_text(position, end, clause)
+
+    def _emit_text(self, start: int, end: int, clause: str) -> None:
+        start, end = self._span(start, end)
+        head = _clean_head(self.text[start:end])
+        self._emit(normalize_ingredient(head), head, start, end, clause, "")
+
+    def _item(
+        self,
+        item: _Item,
+        head: str,
+        start: int,
+        end: int,
+        clause: str,
+        group: str,
+        suffix: str,
+    ) -> None:
+        head = _clean_head(head)
+        canonical_head = normalize_ingredient(head)
+        if not item.groups:
+            self._emit(canonical_head, head, start, end, clause, group, suffix)
+            return
+
+        inner = [
+            g
+            for g in item.groups
+            if any(_clean_head(self.text[i.start : i.end]) for i in g)
+        ]
+        if not inner:
+            self._emit(canonical_head, head, start, end, clause, group, suffix)
+            return
+
+        if len(inner) == 1 and len(inner[0]) == 1 and not inner[0][0].groups:
+            child = inner[0][0]
+            qualifier = normalize_ingredient(
+                _clean_head(self.text[child.start : child.end])
+            )
+            if qualifier.startswith("from "):
+                qualifier = qualifier[5:]
+            if qualifier in _SOURCE_QUALIFIERS and canonical_head:
+                self._emit(
+                    f"{qualifier} {canonical_head}",
+                    self.text[start:end],
+                    start,
+                    end,
+                    clause,
+                    group,
+                )
+                return
+
+        noun = _GENERIC_HEADS.get(canonical_head, "")
+        if canonical_head not in _FUNCTIONAL_CLASSES and not noun:
+            self._emit(canonical_head, head, start, end, clause, group, suffix)
+        for child_items in inner:
+            self.walk(child_items, clause, canonical_head or group, noun)
+
+    def _emit(
+        self,
+        canonical: str,
+        text: str,
+        start: int,
+        end: int,
+        clause: str,
+        group: str,
+        suffix: str = "",
+    ) -> None:
+        if suffix and canonical and " " not in canonical and canonical != suffix:
+            canonical = f"{canonical} {suffix}"
+        if not canonical or canonical in self.seen:
+            return
+        self.seen.add(canonical)
+        self.tokens.append(LabelToken(canonical, text, start, end, clause, group))
+
+
+@lru_cache(maxsize=8192)
+def _parse(text: str, clause: str) -> Tuple[LabelToken, ...]:
+    parser = _LabelParser(text)
+    parser.walk(_build_tree(text), clause)
+    return tuple(parser.tokens)
+
+
+def parse_label(text: str, clause: str = INGREDIENTS) -> List[LabelToken]:
+    return list(_parse(text, clause))
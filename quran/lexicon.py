@@ -0,0 +1,240 @@
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from . import _lexicon_data
+
+_E_NUMBER_RE = re.compile(r"\b(?:e|ins)\s*-?\s*(\d{3,4})\s*([a-z])?(?![a-z0-9])")
+_PUNCTUATION_RE = re.compile(r"[^\w\s'&]+")
+_SPELLING = {
+    "flavour": "flavor",
+    "flavours": "flavors",
+    "flavouring": "flavor",
+    "flavourings": "flavor",
+    "flavoring": "flavor",
+    "flavorings": "flavor",
+    "colour": "color",
+    "colours": "colors",
+    "colouring": "coloring",
+    "yoghurt": "yogurt",
+    "chilli": "chili",
+    "gelatine": "gelatin",
+    "sulphite": "sulfite",
+    "sulphate": "sulfate",
+    "fibre": "fiber",
+}
+_SINGULAR_KEEP = ("ss", "us", "is", "ous")
+_SINGULAR_EXCEPTIONS = frozenset(("molasses", "series", "species", "brussels"))
+
+HALAL = "Halal"
+HARAM = "Haram"
+QUESTIONABLE = "Questionable"
+_SEVERITY = {HALAL: 0, QUESTIONABLE: 1, HARAM: 2}
+
+
+def singularize(token: str) -> str:
+    if (
+        len(token) <= 3
+        or token.endswith(_SINGULAR_KEEP)
+        or token in _SINGULAR_EXCEPTIONS
+    ):
+        return token
+    if token.endswith("ies"):
+        return token[:-3] + "y"
+    if token.endswith(("oes", "ches", "shes", "xes", "sses")):
+        return token[:-2]
+    if token.endswith("s"):
+        return token[:-1]
+    return token
+
+
+@lru_cache(maxsize=65536)
+def normalize_ingredient(text: str) -> str:
+    text = text.lower().replace("-", " ").replace("_", " ")
+    text = _E_NUMBER_RE.sub(r"e\1\2", text)
+    text = _PUNCTUATION_RE.sub(" ", text)
+    tokens = []
+    for token in text.split():
+        token = token.strip("'")
+        if token:
+            tokens.append(singularize(_SPELLING.get(token, token)))
+    return " ".join(tokens)
+
+
+class LexiconEntry(NamedTuple):
+    term: str
+    status: str
+    note: str = ""
+
+
+class LexiconMatch(NamedTuple):
+    status: str
+    terms: Tuple[str, ...]
+    exact: bool
+    note: str = ""
+
+
+class _TokenAutomaton:
+    def __init__(self) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, LexiconEntry]]] = [[]]
+
+    def add(self, tokens: Tuple[str, ...], entry: LexiconEntry) -> None:
+        node = 0
+        for token in tokens:
+            next_node = self._goto[node].get(token)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][token] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append((len(tokens), entry))
+
+    def build(self) -> None:
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for token, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = (
+                    self._output[child] + self._output[self._fail[child]]
+                )
+
+    def search(self, tokens: List[str]) -> List[Tuple[int, int, LexiconEntry]]:
+        matches = []
+        node = 0
+        for position, token in enumerate(tokens):
+            while node and token not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(token, 0)
+            for length, entry in self._output[node]:
+                matches.append((position - length + 1, position + 1, entry))
+        return matches
+
+
+class IngredientLexicon:
+    def __init__(
+        self,
+        halal_terms: Iterable[str] = (),
+        haram_terms: Iterable[str] = (),
+        questionable_terms: Iterable[str] = (),
+        e_numbers: Optional[Dict[str, Tuple[str, str]]] = None,
+        modifier_words: Iterable[str] = (),
+        substitute_words: Iterable[str] = (),
+    ):
+        self._exact: Dict[str, LexiconEntry] = {}
+        self._automaton = _TokenAutomaton()
+        self._modifiers: Set[str] = {normalize_ingredient(w) for w in modifier_words}
+        self._substitutes: Set[str] = {
+            normalize_ingredient(w) for w in substitute_words
+        }
+        for status, terms in (
+            (HALAL, halal_terms),
+            (HARAM, haram_terms),
+            (QUESTIONABLE, questionable_terms),
+        ):
+            for term in terms:
+                self.add(term, status)
+        for code, (status, name) in (e_numbers or {}).items():
+            self.add(code, status, name)
+            self.add(name, status, code.upper())
+        self._automaton.build()
+
+    def add(self, term: str, status: str, note: str = "") -> None:
+        key = normalize_ingredient(term)
+        if not key:
+            return
+        existing = self._exact.get(key)
+        if existing is not None and _SEVERITY[existing.status] >= _SEVERITY[status]:
+            return
+        entry = LexiconEntry(term, status, note)
+        self._exact[key] = entry
+        self._automaton.add(tuple(key.split()), entry)
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_ingredient(name) in self._exact
+
+    def lookup(self, name: str) -> Optional[LexiconMatch]:
+        key = normalize_ingredient(name)
+        entry = self._exact.get(key)
+        if entry is not None:
+            return LexiconMatch(entry.status, (entry.term,), True, entry.note)
+        tokens = key.split()
+        if not tokens:
+            return None
+
+        kept: List[Tuple[int, int, LexiconEntry]] = []
+        for start, end, entry in sorted(
+            self._automaton.search(tokens),
+            key=lambda m: (m[0] - m[1], -_SEVERITY[m[2].status]),
+        ):
+            if any(s <= start and end <= e for s, e, _ in kept):
+                continue
+            if entry.status == HARAM and end < len(tokens) and tokens[end] == "free":
+                continue
+            if entry.status == HARAM and start > 0 and tokens[start - 1] == "non":
+                continue
+            kept.append((start, end, entry))
+        if not kept:
+            return None
+
+        worst = max(kept, key=lambda m: _SEVERITY[m[2].status])[2].status
+        if worst != QUESTIONABLE:
+            # Only a Haram term itself explains a token of a Haram verdict, so
+            # "beef prosciutto" or "bourbon biscuit" are left to the AI.
+            covered: Set[int] = set()
+            for start, end, entry in kept:
+                if entry.status == worst:
+                    covered.update(range(start, end))
+            for position, token in enumerate(tokens):
+                if position in covered:
+                    continue
+                if token not in self._modifiers or (
+                    worst == HARAM and token in self._substitutes
+                ):
+                    return None
+        terms = tuple(
+            e.term for s, _, e in sorted(kept, key=lambda m: m[0]) if e.status == worst
+        )
+        notes = [e.note for _, _, e in kept if e.status == worst and e.note]
+        return LexiconMatch(worst, terms, False, "; ".join(notes))
+
+    def resolve(self, name: str) -> Optional[LexiconMatch]:
+        match = self.lookup(name)
+        if match is None or match.status == QUESTIONABLE:
+            return None
+        return match
+
+
+_default_lexicon: Optional[IngredientLexicon] = None
+_default_lock = threading.Lock()
+
+
+def get_default_lexicon() -> IngredientLexicon:
+    global _default_lexicon
+    if _default_lexicon is None:
+        with _default_lock:
+            if _default_lexicon is None:
+                _default_lexicon = IngredientLexicon(
+                    halal_terms=_lexicon_data.HALAL_TERMS,
+                    haram_terms=_lexicon_data.HARAM_TERMS,
+                    questionable_terms=_lexicon_data.QUESTIONABLE_TERMS,
+                    e_numbers=_lexicon_data.E_NUMBERS,
+                    modifier_words=_lexicon_data.MODIFIER_WORDS,
+                    substitute_words=_lexicon_data.SUBSTITUTE_WORDS,
+                )
+    return _default_lexicon
@@ -0,0 +1,332 @@
+import asyncio
+import bisect
+import contextvars
+import inspect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+Hook = Callable[[str, Dict[str, Any]], None]
+C = TypeVar("C", bound=type)
+
+_operation: "contextvars.ContextVar[Optional[str]]" = contextvars.ContextVar(
+    "quran_operation", default=None
+)
+
+
+def current_operation() -> Optional[str]:
+    return _operation.get()
+
+
+@contextmanager
+def operation(name: str) -> Iterator[None]:
+    token = _operation.set(name) if _operation.get() is None else None
+    try:
+        yield
+    finally:
+        if token is not None:
+            _operation.reset(token)
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    if len(labels) == 1:
+        for key, value in labels.items():
+            return ((key, str(value)),)
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+class _Histogram:
+    __slots__ = ("bounds", "counts", "count", "sum", "max")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        lower = 0.0
+        for index, count in enumerate(self.counts):
+            upper = self.bounds[index] if index < len(self.bounds) else self.max
+            if count and seen + count >= target:
+                return min(self.max, lower + (upper - lower) * (target - seen) / count)
+            seen += count
+            lower = upper
+        return self.max
+
+
+class Metrics:
+    def __init__(
+        self,
+        enabled: bool = True,
+        prefix: str = "quran",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.enabled = enabled
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        self.hook_errors = 0
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], _Histogram] = {}
+        self._hooks: List[Hook] = []
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        if not self.enabled:
+            return
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        if not self.enabled:
+            return
+        key = (name, _labels(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str, **labels: Any) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def add_hook(self, hook: Hook) -> None:
+        with self._lock:
+            self._hooks.append(hook)
+
+    def remove_hook(self, hook: Hook) -> None:
+        with self._lock:
+            if hook in self._hooks:
+                self._hooks.remove(hook)
+
+    def emit(self, event: str, **fields: Any) -> None:
+        if not self.enabled or not self._hooks:
+            return
+        for hook in list(self._hooks):
+            try:
+                hook(event, fields)
+            except Exception:
+                self.hook_errors += 1
+
+    def counter(self, name: str, **labels: Any) -> float:
+        with self._lock:
+            if labels:
+                return self._counters.get((name, _labels(labels)), 0.0)
+            return sum(v for (n, _), v in self._counters.items() if n == name)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self.hook_errors = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = [
+                (
+                    key,
+                    h.count,
+                    h.sum,
+                    h.max,
+                    list(h.counts),
+                    h.quantile(0.5),
+                    h.quantile(0.95),
+                    h.quantile(0.99),
+                )
+                for key, h in sorted(self._histograms.items(), key=lambda kv: kv[0])
+            ]
+
+        snapshot: Dict[str, Any] = {"counters": {}, "histograms": {}}
+        for (name, labels), value in counters:
+            snapshot["counters"].setdefault(name, []).append(
+                {"labels": dict(labels), "value": value}
+            )
+        for (name, labels), count, total, maximum, counts, p50, p95, p99 in histograms:
+            snapshot["histograms"].setdefault(name, []).append(
+                {
+                    "labels": dict(labels),
+                    "count": count,
+                    "sum": total,
+                    "mean": total / count if count else 0.0,
+                    "max": maximum,
+                    "p50": p50,
+                    "p95": p95,
+                    "p99": p99,
+                    "buckets": {
+                        str(bound): n for bound, n in zip(self.buckets, counts)
+                    },
+                }
+            )
+        snapshot["hook_errors"] = self.hook_errors
+        return snapshot
+
+    def to_json(self, **kwargs: Any) -> str:
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def to_prometheus(self) -> str:
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = [
+                (key, h.count, h.sum, list(h.counts))
+                for key, h in sorted(self._histograms.items(), key=lambda kv: kv[0])
+            ]
+
+        lines: List[str] = []
+        typed = set()
+        for (name, labels), value in counters:
+            metric = f"{self.prefix}_{name}"
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{_format_labels(labels)} {value:g}")
+        for (name, labels), count, total, counts in histograms:
+            metric = f"{self.prefix}_{name}"
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                le = _format_labels(labels, ("le", f"{bound:g}"))
+                lines.append(f"{metric}_bucket{le} {cumulative}")
+            inf = _format_labels(labels, ("le", "+Inf"))
+            lines.append(f"{metric}_bucket{inf} {count}")
+            lines.append(f"{metric}_sum{_format_labels(labels)} {total:.6f}")
+            lines.append(f"{metric}_count{_format_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def _instrument(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    if inspect.isgeneratorfunction(func):
+
+        @wraps(func)
+        def generator_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            metrics: Metrics = self.metrics
+            started = time.perf_counter()
+            iterator = func(self, *args, **kwargs)
+            try:
+                while True:
+                    with operation(name):
+                        try:
+                            item = next(iterator)
+                        except StopIteration:
+                            return
+                    yield item
+            finally:
+                metrics.observe(
+                    "method_seconds", time.perf_counter() - started, method=name
+                )
+
+        return generator_wrapper
+
+    if asyncio.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            metrics: Metrics = self.metrics
+            started = time.perf_counter()
+            try:
+                with operation(name):
+                    return await func(self, *args, **kwargs)
+            except Exception:
+                metrics.inc("method_exceptions_total", method=name)
+                raise
+            finally:
+                metrics.observe(
+                    "method_seconds", time.perf_counter() - started, method=name
+                )
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        metrics: Metrics = self.metrics
+        if not metrics.enabled:
+            # Still tag the operation: scheduling priority is derived from it
+            with operation(name):
+                return func(self, *args, **kwargs)
+        token = _operation.set(name) if _operation.get() is None else None
+        started = time.perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+        except Exception:
+            metrics.inc("method_exceptions_total", method=name)
+            raise
+        finally:
+            metrics.observe(
+                "method_seconds", time.perf_counter() - started, method=name
+            )
+            if token is not None:
+                _operation.reset(token)
+
+    return wrapper
+
+
+def instrumented(cls: C) -> C:
+    for name, value in list(vars(cls).items()):
+        if name.startswith("_") or name == "close" or not inspect.isfunction(value):
+            continue
+        setattr(cls, name, _instrument(name, value))
+    return cls
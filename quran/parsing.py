@@ -0,0 +1,217 @@
+import ast
+import json
+import re
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Tuple, Union
+
+from .results import Confidence, Status
+
+_BOILERPLATE_RE = re.compile(
+    r"Powered by Pollinations\.AI|Support our mission"
+    r"|(?:https://)?pollinations(?:\.ai)?"
+)
+_OPENERS = {"{": "}", "[": "]"}
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_PYTHON_LITERALS = {"true": "True", "false": "False", "null": "None"}
+_LITERAL_RE = re.compile(r"\b(true|false|null)\b")
+_decoder = json.JSONDecoder()
+
+_TRUE = frozenset(("true", "yes", "y", "1"))
+_FALSE = frozenset(("false", "no", "n", "0", "none", ""))
+BOOLEAN_FIELDS = ("certification_required", "has_certification", "is_halal", "is_valid")
+LIST_FIELDS = ("concerns", "recommendations", "alternatives")
+CONFIDENCE_FIELDS = ("confidence", "reliability")
+FIELD_ALIASES = {
+    "verdict": "status",
+    "halal_status": "status",
+    "classification": "status",
+    "reason": "explanation",
+    "reasoning": "explanation",
+}
+VALID_VERDICTS = (Status.HALAL, Status.HARAM, Status.QUESTIONABLE)
+
+
+class Schema(NamedTuple):
+    name: str
+    requires_status: bool = False
+    packed: bool = False
+
+
+DETAILED = Schema("detailed")
+VERDICT = Schema("verdict", requires_status=True)
+PACKED = Schema("packed", packed=True)
+
+
+class SchemaError(ValueError):
+    pass
+
+
+def strip_boilerplate(text: str) -> str:
+    return _BOILERPLATE_RE.sub("", text).strip()
+
+
+def _balanced_end(text: str, start: int) -> Optional[int]:
+    stack = [_OPENERS[text[start]]]
+    quote = ""
+    index = start + 1
+    length = len(text)
+    while index < length:
+        char = text[index]
+        if quote:
+            if char == "\\":
+                index += 1
+            elif char == quote:
+                quote = ""
+        elif char == '"' or char == "'":
+            quote = char
+        elif char in _OPENERS:
+            stack.append(_OPENERS[char])
+        elif char == "}" or char == "]":
+            if char != stack.pop():
+                return None
+            if not stack:
+                return index + 1
+        index += 1
+    return None
+
+
+def _lenient_loads(span: str) -> Any:
+    repaired = _TRAILING_COMMA_RE.sub(r"\1", span)
+    try:
+        return json.loads(repaired)
+    except ValueError:
+        pass
+    literal = _LITERAL_RE.sub(lambda m: _PYTHON_LITERALS[m.group(1)], repaired)
+    try:
+        return ast.literal_eval(literal)
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        raise ValueError("no JSON value found") from None
+
+
+def _candidates(text: str) -> Iterator[Any]:
+    index = 0
+    while True:
+        starts = [p for p in (text.find("{", index), text.find("[", index)) if p >= 0]
+        if not starts:
+            return
+        start = min(starts)
+        try:
+            yield _decoder.raw_decode(text, start)[0]
+        except ValueError:
+            end = _balanced_end(text, start)
+            if end is None:
+                # Truncated: anything nested after this point is a fragment
+                return
+            try:
+                yield _lenient_loads(text[start:end])
+            except ValueError:
+                index = end
+                continue
+        index = start + 1
+
+
+def extract_json(text: str, expect: Union[type, Tuple[type, ...]] = dict) -> Any:
+    first: Any = None
+    for value in _candidates(text):
+        if isinstance(value, expect):
+            return value
+        if first is None and isinstance(value, (dict, list)):
+            first = value
+    if first is None:
+        raise ValueError("no JSON value found")
+    return first
+
+
+def _boolean(value: Any) -> Any:
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        return bool(value)
+    return value
+
+
+def _status(value: Any) -> Any:
+    status = Status.parse(value)
+    if status is Status.UNKNOWN and isinstance(value, str):
+        words = re.findall(r"[a-z]+", value.lower())
+        status = Status.parse(words[0]) if words else status
+    return status.value if status is not Status.UNKNOWN else value
+
+
+def coerce_verdict(data: Dict[str, Any]) -> Dict[str, Any]:
+    record: Dict[str, Any] = {}
+    aliased: Dict[str, Any] = {}
+    for key, value in data.items():
+        name = key.strip().lower().replace(" ", "_") if isinstance(key, str) else key
+        if name in FIELD_ALIASES:
+            aliased.setdefault(FIELD_ALIASES[name], value)
+        else:
+            record[name] = value
+    for name, value in aliased.items():
+        record.setdefault(name, value)
+    if "status" in record:
+        record["status"] = _status(record["status"])
+    for field in CONFIDENCE_FIELDS:
+        value = record.get(field)
+        if isinstance(value, str):
+            confidence = Confidence.parse(value)
+            if confidence is not Confidence.LOW or value.strip().lower() == "low":
+                record[field] = confidence.value
+    for field in BOOLEAN_FIELDS:
+        if field in record:
+            record[field] = _boolean(record[field])
+    for field in LIST_FIELDS:
+        value = record.get(field)
+        if isinstance(value, str):
+            record[field] = [value] if value.strip() else []
+        elif value is None and field in record:
+            record[field] = []
+    return record
+
+
+def _has_status(value: Any) -> bool:
+    return isinstance(value, dict) and any(
+        isinstance(key, str)
+        and FIELD_ALIASES.get(key.strip().lower(), key.strip().lower()) == "status"
+        for key in value
+    )
+
+
+def _unwrap(value: Any) -> Any:
+    # Only verdicts are unwrapped; other single-key objects such as
+    # {"guidelines": {...}} are what their callers asked for.
+    candidate = value
+    if isinstance(candidate, list) and len(candidate) == 1:
+        candidate = candidate[0]
+    if isinstance(candidate, dict) and len(candidate) == 1:
+        inner = next(iter(candidate.values()))
+        if _has_status(inner):
+            candidate = inner
+    return candidate if _has_status(candidate) else value
+
+
+def validate(value: Any, schema: Schema) -> Dict[str, Any]:
+    if schema.packed:
+        if isinstance(value, list):
+            value = {"results": value}
+        if not isinstance(value, dict):
+            raise SchemaError("expected a JSON object with a results list")
+        packed: Dict[str, Any] = dict(value)
+        results = packed.get("results")
+        if isinstance(results, list):
+            packed["results"] = [
+                coerce_verdict(r) if isinstance(r, dict) else r for r in results
+            ]
+        return packed
+
+    value = _unwrap(value)
+    if not isinstance(value, dict):
+        raise SchemaError(f"expected a JSON object, got {type(value).__name__}")
+    record = coerce_verdict(value)
+    status = record.get("status")
+    if schema.requires_status and Status.parse(status) not in VALID_VERDICTS:
+        raise SchemaError(f"invalid status {status!r}")
+    return record
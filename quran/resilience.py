@@ -0,0 +1,124 @@
+import threading
+import time
+from typing import Callable, Dict, Optional, Union
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+StateListener = Callable[[str, str], None]
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[StateListener] = None,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self.on_state_change = on_state_change
+        self.failures = 0
+        self.rejected = 0
+        self.times_opened = 0
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_threshold > 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and self._remaining() <= 0:
+                return HALF_OPEN
+            return self._state
+
+    def retry_after(self) -> float:
+        with self._lock:
+            return max(0.0, self._remaining()) if self._state == OPEN else 0.0
+
+    def _remaining(self) -> float:
+        return self._opened_at + self.recovery_timeout - time.monotonic()
+
+    def _transition(self, state: str) -> Optional[str]:
+        previous = self._state
+        if previous == state:
+            return None
+        self._state = state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+            self.times_opened += 1
+        if state == HALF_OPEN:
+            self._probes = 0
+        return previous
+
+    def _notify(self, previous: Optional[str], state: str) -> None:
+        if previous is not None and self.on_state_change is not None:
+            self.on_state_change(previous, state)
+
+    def allow(self) -> bool:
+        if not self.enabled:
+            return True
+        previous = None
+        with self._lock:
+            if self._state == OPEN:
+                if self._remaining() > 0:
+                    self.rejected += 1
+                    return False
+                previous = self._transition(HALF_OPEN)
+            if self._state == HALF_OPEN:
+                now = time.monotonic()
+                if now - self._probe_started >= self.recovery_timeout:
+                    self._probes = 0
+                if self._probes >= self.half_open_max_calls:
+                    self.rejected += 1
+                    allowed = False
+                else:
+                    self._probes += 1
+                    self._probe_started = now
+                    allowed = True
+            else:
+                allowed = True
+        self._notify(previous, HALF_OPEN)
+        return allowed
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            previous = self._transition(CLOSED)
+        self._notify(previous, CLOSED)
+
+    def record_failure(self) -> None:
+        if not self.enabled:
+            return
+        previous = None
+        with self._lock:
+            self.failures += 1
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self.failures >= self.failure_threshold
+            ):
+                previous = self._transition(OPEN)
+        self._notify(previous, OPEN)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.failures = 0
+            previous = self._transition(CLOSED)
+        self._notify(previous, CLOSED)
+
+    def stats(self) -> Dict[str, Union[str, int, float]]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "times_opened": self.times_opened,
+            "retry_after": round(self.retry_after(), 3),
+        }
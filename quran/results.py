@@ -0,0 +1,244 @@
+from collections.abc import Mapping
+from enum import Enum
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .label_parser import LabelToken
+
+
+class Status(str, Enum):
+    HALAL = "Halal"
+    HARAM = "Haram"
+    QUESTIONABLE = "Questionable"
+    UNKNOWN = "Unknown"
+    ERROR = "Error"
+
+    def __str__(self) -> str:
+        return self.value
+
+    @classmethod
+    def parse(cls, value: Any) -> "Status":
+        if isinstance(value, Status):
+            return value
+        if not isinstance(value, str):
+            return cls.UNKNOWN
+        return _STATUS_ALIASES.get(value.strip().lower(), cls.UNKNOWN)
+
+
+class Confidence(str, Enum):
+    HIGH = "High"
+    MEDIUM = "Medium"
+    LOW = "Low"
+
+    def __str__(self) -> str:
+        return self.value
+
+    @classmethod
+    def parse(cls, value: Any) -> "Confidence":
+        if isinstance(value, Confidence):
+            return value
+        if not isinstance(value, str):
+            return cls.LOW
+        return _CONFIDENCE_ALIASES.get(value.strip().lower(), cls.LOW)
+
+
+_STATUS_ALIASES: Dict[str, Status] = {
+    **{status.value.lower(): status for status in Status},
+    "permissible": Status.HALAL,
+    "mushbooh": Status.QUESTIONABLE,
+    "doubtful": Status.QUESTIONABLE,
+    "forbidden": Status.HARAM,
+}
+_CONFIDENCE_ALIASES: Dict[str, Confidence] = {
+    **{confidence.value.lower(): confidence for confidence in Confidence},
+    "moderate": Confidence.MEDIUM,
+}
+
+
+def _strings(value: Any) -> Tuple[str, ...]:
+    if isinstance(value, (list, tuple)):
+        return tuple(str(item) for item in value) if value else ()
+    if isinstance(value, str) and value:
+        return (value,)
+    return ()
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, LabelToken):
+        return value._asdict()
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    return value
+
+
+class Record(Mapping):
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Duplicate ingredients share one record, so fields are write-once.
+        if hasattr(self, name):
+            raise AttributeError(f"{self.__class__.__name__} is immutable")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {field: _plain(getattr(self, field)) for field in self._fields}
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{f}={getattr(self, f)!r}" for f in self._fields)
+        return f"{self.__class__.__name__}({fields})"
+
+
+class _Verdict(Record):
+    __slots__ = (
+        "status",
+        "explanation",
+        "confidence",
+        "concerns",
+        "recommendations",
+        "certification_required",
+        "alternatives",
+    )
+
+    def __init__(
+        self,
+        status: Status,
+        explanation: str,
+        confidence: Confidence,
+        concerns: Tuple[str, ...] = (),
+        recommendations: Tuple[str, ...] = (),
+        certification_required: bool = False,
+        alternatives: Tuple[str, ...] = (),
+    ):
+        self.status = status
+        self.explanation = explanation
+        self.confidence = confidence
+        self.concerns = concerns
+        self.recommendations = recommendations
+        self.certification_required = certification_required
+        self.alternatives = alternatives
+
+    @staticmethod
+    def _parse(response: Dict[str, Any]) -> Tuple[Any, ...]:
+        return (
+            Status.parse(response.get("status")),
+            str(response.get("explanation", "No explanation provided")),
+            Confidence.parse(response.get("confidence")),
+            _strings(response.get("concerns")),
+            _strings(response.get("recommendations")),
+            bool(response.get("certification_required", False)),
+            _strings(response.get("alternatives")),
+        )
+
+
+class IngredientResult(_Verdict):
+    __slots__ = ("ingredient",)
+    _fields = ("ingredient",) + _Verdict.__slots__
+
+    def __init__(self, ingredient: str, *args: Any, **kwargs: Any):
+        self.ingredient = ingredient
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def from_response(
+        cls, ingredient: str, response: Dict[str, Any]
+    ) -> "IngredientResult":
+        return cls(ingredient, *cls._parse(response))
+
+
+class FoodItemResult(_Verdict):
+    __slots__ = ("food_item",)
+    _fields = ("food_item",) + _Verdict.__slots__
+
+    def __init__(self, food_item: str, *args: Any, **kwargs: Any):
+        self.food_item = food_item
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def from_response(
+        cls, food_item: str, response: Dict[str, Any]
+    ) -> "FoodItemResult":
+        return cls(food_item, *cls._parse(response))
+
+
+class VerdictResult(Record):
+    __slots__ = ("item", "status", "confidence")
+    _fields = __slots__
+
+    def __init__(self, item: str, status: Status, confidence: Confidence):
+        self.item = item
+        self.status = status
+        self.confidence = confidence
+
+    @classmethod
+    def from_response(cls, item: str, response: Dict[str, Any]) -> "VerdictResult":
+        return cls(
+            item,
+            Status.parse(response.get("status")),
+            Confidence.parse(response.get("confidence")),
+        )
+
+
+class RecipeAnalysis(Record):
+    __slots__ = (
+        "recipe",
+        "overall_status",
+        "safe_ingredients",
+        "questionable_ingredients",
+        "haram_ingredients",
+        "total_ingredients",
+        "halal_percentage",
+    )
+    _fields: Tuple[str, ...] = __slots__
+
+    def __init__(
+        self,
+        recipe: str,
+        overall_status: Status,
+        safe_ingredients: Tuple[str, ...],
+        questionable_ingredients: Tuple[str, ...],
+        haram_ingredients: Tuple[str, ...],
+        total_ingredients: int,
+        halal_percentage: float,
+    ):
+        self.recipe = recipe
+        self.overall_status = overall_status
+        self.safe_ingredients = safe_ingredients
+        self.questionable_ingredients = questionable_ingredients
+        self.haram_ingredients = haram_ingredients
+        self.total_ingredients = total_ingredients
+        self.halal_percentage = halal_percentage
+
+
+class LabelAnalysis(RecipeAnalysis):
+    __slots__ = ("may_contain", "tokens")
+    _fields = RecipeAnalysis._fields + __slots__
+
+    def __init__(
+        self,
+        *args: Any,
+        may_contain: Optional[Dict[str, Status]] = None,
+        tokens: Tuple[LabelToken, ...] = (),
+    ):
+        super().__init__(*args)
+        self.may_contain = may_contain if may_contain is not None else {}
+        self.tokens = tokens
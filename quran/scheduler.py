@@ -0,0 +1,182 @@
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from .metrics import current_operation
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    BULK = 1
+
+
+BULK_OPERATIONS = frozenset(
+    (
+        "batch_detect",
+        "iter_batch_detect",
+        "classify_ingredients",
+        "check_ingredients_list",
+        "find_haram_ingredients",
+        "find_questionable_ingredients",
+        "get_safe_ingredients",
+        "detect_food_additives",
+    )
+)
+
+_priority: "contextvars.ContextVar[Optional[Priority]]" = contextvars.ContextVar(
+    "quran_priority", default=None
+)
+
+
+def current_priority() -> Priority:
+    explicit = _priority.get()
+    if explicit is not None:
+        return explicit
+    if current_operation() in BULK_OPERATIONS:
+        return Priority.BULK
+    return Priority.INTERACTIVE
+
+
+@contextmanager
+def priority(level: Union[Priority, str]) -> Iterator[None]:
+    if isinstance(level, str):
+        level = Priority[level.upper()]
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1.0, burst if burst is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def delay(self, now: float) -> float:
+        self._refill(now)
+        return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+
+    def take(self) -> None:
+        self._tokens -= 1
+
+    def drain(self, now: float) -> None:
+        self._refill(now)
+        self._tokens = min(self._tokens, 0.0)
+
+
+class RequestScheduler:
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        penalty: float = 1.0,
+    ):
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.max_concurrency = max_concurrency
+        self.penalty = penalty
+        self.active = 0
+        self.granted: Dict[Priority, int] = {p: 0 for p in Priority}
+        self._waiters: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+
+    @property
+    def limited(self) -> bool:
+        return self.bucket is not None or self.max_concurrency is not None
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def _delay(self, now: float) -> Optional[float]:
+        if self.max_concurrency is not None and self.active >= self.max_concurrency:
+            return None
+        delay = self._paused_until - now
+        if self.bucket is not None:
+            delay = max(delay, self.bucket.delay(now))
+        return max(0.0, delay)
+
+    def acquire(self, level: Optional[Priority] = None) -> float:
+        if level is None:
+            level = current_priority()
+        if not self.limited:
+            self.granted[level] += 1
+            return 0.0
+
+        started = time.monotonic()
+        entry = (int(level), next(self._sequence))
+        with self._cond:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    delay = None
+                    if self._waiters[0] == entry:
+                        delay = self._delay(time.monotonic())
+                        if delay == 0:
+                            break
+                    self._cond.wait(delay)
+            except BaseException:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+                raise
+            heapq.heappop(self._waiters)
+            if self.bucket is not None:
+                self.bucket.take()
+            self.active += 1
+            self.granted[level] += 1
+            self._cond.notify_all()
+        return time.monotonic() - started
+
+    def release(self) -> None:
+        if not self.limited:
+            return
+        with self._cond:
+            self.active -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, level: Optional[Priority] = None) -> Iterator[float]:
+        waited = self.acquire(level)
+        try:
+            yield waited
+        finally:
+            self.release()
+
+    def pause(self, seconds: Optional[float] = None) -> None:
+        if seconds is None:
+            seconds = self.penalty
+        if not self.limited or seconds <= 0:
+            return
+        with self._cond:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + seconds)
+            if self.bucket is not None:
+                self.bucket.drain(now)
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Union[int, Dict[str, int]]]:
+        with self._cond:
+            return {
+                "active": self.active,
+                "queued": len(self._waiters),
+                "granted": {p.name.lower(): n for p, n in self.granted.items()},
+            }
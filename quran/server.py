@@ -0,0 +1,211 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from .halal_detector import HalalDetector
+from .results import IngredientResult
+from .scheduler import Priority, priority
+
+try:
+    from aiohttp import web
+except ImportError:  # pragma: no cover
+    web = None  # type: ignore[assignment]
+
+MAX_BATCH_ITEMS = 1000
+
+T = TypeVar("T")
+Waiter = Tuple[str, "asyncio.Future[IngredientResult]"]
+
+
+class MicroBatcher:
+    def __init__(
+        self,
+        detector: HalalDetector,
+        executor: ThreadPoolExecutor,
+        window: float = 0.005,
+        max_batch: Optional[int] = None,
+    ):
+        self.detector = detector
+        self.executor = executor
+        self.window = window
+        self.max_batch = max_batch or detector.chunk_size
+        self._pending: Dict[str, List[Waiter]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+
+    async def submit(self, ingredient: str, context: str = "") -> IngredientResult:
+        local_response = (
+            self.detector._local_response(ingredient) if not context else None
+        )
+        if local_response is not None:
+            return self.detector._ingredient_result(ingredient, local_response)
+
+        loop = asyncio.get_event_loop()
+        future: "asyncio.Future[IngredientResult]" = loop.create_future()
+        pending = self._pending.setdefault(context, [])
+        pending.append((ingredient, future))
+        if len(pending) >= self.max_batch:
+            self._flush(context)
+        elif len(pending) == 1:
+            self._timers[context] = loop.call_later(self.window, self._flush, context)
+        return await future
+
+    def _flush(self, context: str) -> None:
+        timer = self._timers.pop(context, None)
+        if timer is not None:
+            timer.cancel()
+        pending = self._pending.pop(context, [])
+        if pending:
+            asyncio.ensure_future(self._run(pending, context))
+
+    def _classify(
+        self, ingredients: List[str], context: str
+    ) -> Dict[str, IngredientResult]:
+        self.detector.metrics.inc("server_batches_total")
+        self.detector.metrics.inc("server_batched_items_total", len(ingredients))
+        with priority(Priority.INTERACTIVE):
+            return self.detector.classify_ingredients(
+                ingredients, context, packed=len(ingredients) > 1
+            )
+
+    async def _run(self, pending: List[Waiter], context: str) -> None:
+        loop = asyncio.get_event_loop()
+        try:
+            classified = await loop.run_in_executor(
+                self.executor, self._classify, [name for name, _ in pending], context
+            )
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for name, future in pending:
+            if not future.done():
+                future.set_result(classified[name])
+
+
+def _bad_request(message: str) -> Exception:
+    return web.HTTPBadRequest(
+        text=json.dumps({"error": message}), content_type="application/json"
+    )
+
+
+def _string(body: Dict[str, Any], field: str, required: bool = True) -> str:
+    value = body.get(field, "")
+    if not isinstance(value, str) or (required and not value.strip()):
+        raise _bad_request(f"'{field}' must be a non-empty string")
+    return value
+
+
+def _strings(body: Dict[str, Any], field: str) -> List[str]:
+    value = body.get(field)
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        raise _bad_request(f"'{field}' must be a list of strings")
+    if len(value) > MAX_BATCH_ITEMS:
+        raise _bad_request(f"'{field}' has more than {MAX_BATCH_ITEMS} items")
+    return value
+
+
+class HalalService:
+    def __init__(
+        self,
+        detector: HalalDetector,
+        window: float = 0.005,
+        max_batch: Optional[int] = None,
+        workers: Optional[int] = None,
+    ):
+        if web is None:
+            raise ImportError(
+                "The HTTP server requires aiohttp: pip install quran[async]"
+            )
+        self.detector = detector
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers or detector.max_workers,
+            thread_name_prefix="quran-serve",
+        )
+        self.batcher = MicroBatcher(detector, self.executor, window, max_batch)
+
+    def app(self) -> "web.Application":
+        app = web.Application()
+        app.router.add_get("/health", self.health)
+        app.router.add_get("/metrics", self.metrics)
+        app.router.add_post("/v1/ingredient", self.ingredient)
+        app.router.add_post("/v1/food", self.food_item)
+        app.router.add_post("/v1/recipe", self.recipe)
+        app.router.add_post("/v1/batch", self.batch)
+        app.on_cleanup.append(self._cleanup)
+        return app
+
+    async def _cleanup(self, app: "web.Application") -> None:
+        self.executor.shutdown(wait=False)
+
+    async def _body(self, request: "web.Request") -> Dict[str, Any]:
+        try:
+            body = await request.json()
+        except ValueError:
+            raise _bad_request("request body must be JSON")
+        if not isinstance(body, dict):
+            raise _bad_request("request body must be a JSON object")
+        return body
+
+    async def _call(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def health(self, request: "web.Request") -> "web.Response":
+        return web.json_response(
+            {"status": "ok", "circuit": self.detector.circuit_breaker.state}
+        )
+
+    async def metrics(self, request: "web.Request") -> "web.Response":
+        return web.Response(text=self.detector.metrics.to_prometheus())
+
+    async def ingredient(self, request: "web.Request") -> "web.Response":
+        body = await self._body(request)
+        result = await self.batcher.submit(
+            _string(body, "ingredient"), _string(body, "context", required=False)
+        )
+        return web.json_response(result.to_dict())
+
+    async def food_item(self, request: "web.Request") -> "web.Response":
+        body = await self._body(request)
+        result = await self._call(
+            self.detector.detect_food_item,
+            _string(body, "food_item"),
+            _string(body, "preparation_method", required=False),
+            _string(body, "region", required=False),
+        )
+        return web.json_response(result.to_dict())
+
+    async def recipe(self, request: "web.Request") -> "web.Response":
+        body = await self._body(request)
+        recipe, ingredients = _string(body, "recipe"), _strings(body, "ingredients")
+        result = await self._call(
+            lambda: self.detector.analyze_recipe(recipe, ingredients, packed=True)
+        )
+        return web.json_response(result.to_dict())
+
+    async def batch(self, request: "web.Request") -> "web.Response":
+        body = await self._body(request)
+        items = _strings(body, "items")
+        item_type = body.get("type", "ingredient")
+        if item_type not in ("ingredient", "food"):
+            raise _bad_request("'type' must be 'ingredient' or 'food'")
+        results = await self._call(
+            lambda: self.detector.batch_detect(
+                items, item_type, packed=item_type == "ingredient"
+            )
+        )
+        return web.json_response({"results": [r.to_dict() for r in results]})
+
+
+def serve(
+    detector: HalalDetector,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    window: float = 0.005,
+    max_batch: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> None:
+    service = HalalService(detector, window, max_batch, workers)
+    web.run_app(service.app(), host=host, port=port)
@@ -0,0 +1,234 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Set, Tuple
+
+from .lexicon import normalize_ingredient
+from .results import Status
+
+if TYPE_CHECKING:
+    from .halal_detector import HalalDetector
+
+MAGIC = b"QRNSNAP\x00"
+FORMAT_VERSION = 1
+
+# magic, format version, metadata length, entry count, slot count,
+# metadata offset, index offset
+_HEADER = struct.Struct("<8sIIQQQQ")
+_SLOT = struct.Struct("<QQ")
+_RECORD = struct.Struct("<HI")
+_SKIPPED = (Status.ERROR, Status.UNKNOWN)
+
+
+def _is_empty(value: Any) -> bool:
+    # Omitted from records; results fall back to the same defaults when
+    # reading. Checked by type because 0 == False but is a real value.
+    if value is None or value is False:
+        return True
+    return isinstance(value, (str, list, tuple)) and not value
+
+
+def _hash(key: bytes) -> int:
+    value = int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+    return value or 1
+
+
+def _slot_count(entries: int) -> int:
+    slots = 8
+    while slots < entries * 2:
+        slots *= 2
+    return slots
+
+
+def write_snapshot(
+    path: str,
+    entries: Iterable[Tuple[str, Dict[str, Any]]],
+    model: str,
+    prompt_version: str,
+    **metadata: Any,
+) -> int:
+    seen: Set[int] = set()
+    hashes = array("Q")
+    offsets = array("Q")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"\x00" * _HEADER.size)
+        for name, response in entries:
+            encoded_key = normalize_ingredient(name).encode("utf-8")
+            key_hash = _hash(encoded_key)
+            if not encoded_key or len(encoded_key) > 0xFFFF or key_hash in seen:
+                continue
+            seen.add(key_hash)
+            value = json.dumps(
+                {k: v for k, v in response.items() if not _is_empty(v)},
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+            hashes.append(key_hash)
+            offsets.append(f.tell())
+            f.write(_RECORD.pack(len(encoded_key), len(value)))
+            f.write(encoded_key)
+            f.write(value)
+
+        count = len(hashes)
+        meta = json.dumps(
+            {
+                "model": model,
+                "prompt_version": prompt_version,
+                "created_at": time.time(),
+                "entries": count,
+                **metadata,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        meta_offset = f.tell()
+        f.write(meta)
+        f.write(b"\x00" * (-f.tell() % 8))
+
+        slots = _slot_count(count)
+        mask = slots - 1
+        table = array("Q", bytes(slots * _SLOT.size))
+        for key_hash, offset in zip(hashes, offsets):
+            slot = key_hash & mask
+            while table[2 * slot]:
+                slot = (slot + 1) & mask
+            table[2 * slot] = key_hash
+            table[2 * slot + 1] = offset
+        if sys.byteorder == "big":
+            table.byteswap()
+        index_offset = f.tell()
+        table.tofile(f)
+
+        f.seek(0)
+        f.write(
+            _HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                len(meta),
+                count,
+                slots,
+                meta_offset,
+                index_offset,
+            )
+        )
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return count
+
+
+class VerdictSnapshot:
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (
+                magic,
+                version,
+                meta_length,
+                self._count,
+                self._slots,
+                meta_offset,
+                self._index_offset,
+            ) = _HEADER.unpack_from(self._mmap, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a verdict snapshot")
+            if version != FORMAT_VERSION:
+                raise ValueError(
+                    f"{path} has snapshot format {version}, expected {FORMAT_VERSION}"
+                )
+            self.meta: Dict[str, Any] = json.loads(
+                self._mmap[meta_offset : meta_offset + meta_length]
+            )
+        except Exception:
+            self._mmap.close()
+            raise
+        self._mask = self._slots - 1
+
+    @property
+    def model(self) -> str:
+        return str(self.meta.get("model", ""))
+
+    @property
+    def prompt_version(self) -> str:
+        return str(self.meta.get("prompt_version", ""))
+
+    def __len__(self) -> int:
+        return int(self._count)
+
+    def __contains__(self, name: str) -> bool:
+        return self._find(name) is not None
+
+    def _find(self, name: str) -> Optional[Tuple[int, int]]:
+        key = normalize_ingredient(name).encode("utf-8")
+        if not key or not self._count:
+            return None
+        key_hash = _hash(key)
+        slot = key_hash & self._mask
+        buffer = self._mmap
+        index = self._index_offset
+        while True:
+            stored, offset = _SLOT.unpack_from(buffer, index + slot * _SLOT.size)
+            if not stored:
+                return None
+            if stored == key_hash:
+                key_length, value_length = _RECORD.unpack_from(buffer, offset)
+                start = offset + _RECORD.size
+                if buffer[start : start + key_length] == key:
+                    return start + key_length, value_length
+            slot = (slot + 1) & self._mask
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        found = self._find(name)
+        if found is None:
+            return None
+        start, length = found
+        value: Dict[str, Any] = json.loads(self._mmap[start : start + length])
+        return value
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self) -> "VerdictSnapshot":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"VerdictSnapshot({self.path!r}, entries={self._count})"
+
+
+def build_snapshot(
+    detector: "HalalDetector",
+    ingredients: Iterable[str],
+    path: str,
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> int:
+    from . import __version__
+    from .halal_detector import SYSTEM_PROMPT_VERSION
+
+    def entries() -> Iterable[Tuple[str, Dict[str, Any]]]:
+        for result in detector.iter_batch_detect(
+            ingredients, max_workers=max_workers, timeout=timeout
+        ):
+            if result.status in _SKIPPED:
+                continue
+            response = result.to_dict()
+            name = response.pop("ingredient")
+            yield name, response
+
+    return write_snapshot(
+        path,
+        entries(),
+        detector.model,
+        SYSTEM_PROMPT_VERSION,
+        quran_version=__version__,
+    )
@@ -0,0 +1,140 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    from .metrics import Metrics
+    from .scheduler import RequestScheduler
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class HTTPTransport:
+    def __init__(
+        self,
+        pool_size: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 30.0,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        retry_statuses: Tuple[int, ...] = RETRY_STATUSES,
+    ):
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retry_statuses = retry_statuses
+        self.retries = 0
+        self.metrics: Optional["Metrics"] = None
+        self.scheduler: Optional["RequestScheduler"] = None
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_size, pool_maxsize=self.pool_size
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    session.headers.update({"Content-Type": "application/json"})
+                    self._session = session
+        return self._session
+
+    def post(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        attempt = 0
+        while True:
+            try:
+                response = self.session.post(
+                    url,
+                    json=payload,
+                    headers=headers,
+                    timeout=(self.connect_timeout, self.read_timeout),
+                )
+            except requests.ConnectionError as e:
+                # Includes ConnectTimeout. A ReadTimeout is not retried: the
+                # server may already be processing the POST.
+                if attempt >= self.max_retries:
+                    raise
+                self._count_retry(e.__class__.__name__)
+                self._wait(self._backoff(attempt))
+            else:
+                if (
+                    response.status_code not in self.retry_statuses
+                    or attempt >= self.max_retries
+                ):
+                    return response
+                delay = self._retry_after(response)
+                response.close()
+                self._count_retry(str(response.status_code))
+                self._wait(
+                    delay if delay is not None else self._backoff(attempt),
+                    throttled=response.status_code == 429,
+                )
+            attempt += 1
+            self.retries += 1
+
+    def _count_retry(self, reason: str) -> None:
+        if self.metrics is not None:
+            self.metrics.inc("retries_total", reason=reason)
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_factor * 2**attempt)
+        )
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        header = response.headers.get("Retry-After")
+        if not header:
+            return None
+        try:
+            delay = float(header)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(header)
+            except (TypeError, ValueError):
+                return None
+            delay = retry_at.timestamp() - time.time()
+        return min(self.backoff_max, max(0.0, delay))
+
+    def _wait(self, seconds: float, throttled: bool = False) -> None:
+        scheduler = self.scheduler
+        if scheduler is None or not scheduler.limited:
+            self._sleep(seconds)
+            return
+        # A retry is a new request: give the slot back and queue for another
+        # one (and another rate-limit token) instead of retrying inside it.
+        scheduler.release()
+        try:
+            if throttled:
+                scheduler.pause(seconds)
+            else:
+                self._sleep(seconds)
+        finally:
+            scheduler.acquire()
+
+    def _sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
@@ -12,7 +12,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="",
-    packages=find_packages(),
+    packages=find_packages(exclude=("benchmarks", "benchmarks.*")),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -26,10 +26,18 @@ setup(
         "Programming Language :: Python :: 3.11",
     ],
     python_requires=">=3.7",
+    entry_points={
+        "console_scripts": [
+            "halal-check=quran.cli:main",
+        ],
+    },
     install_requires=[
         "requests>=2.25.0",
     ],
     extras_require={
+        "async": [
+            "aiohttp>=3.7",
+        ],
         "dev": [
             "pytest>=6.0",
             "black>=21.0",
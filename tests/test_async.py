@@ -0,0 +1,225 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from quran import (  # noqa: E402
+    AsyncHalalDetector,
+    HalalDetector,
+    StubBackend,
+    VerdictCache,
+)
+from quran.halal_detector import (  # noqa: E402
+    VERDICT_MAX_TOKENS,
+    VERDICT_SYSTEM_PROMPT,
+)
+
+
+def test_concurrent_identical_lookups_share_one_request():
+    backend = StubBackend(latency=0.1)
+
+    async def main():
+        async with AsyncHalalDetector(backend=backend, use_lexicon=False) as detector:
+            return await asyncio.gather(
+                *(detector.detect_ingredient("zorbo") for _ in range(10))
+            )
+
+    results = asyncio.run(main())
+
+    assert backend.calls == 1
+    assert {result.status for result in results} == {"Questionable"}
+
+
+def test_close_closes_the_backend():
+    closed = []
+    backend = StubBackend()
+    backend.close = lambda: closed.append(True)
+
+    async def main():
+        async with AsyncHalalDetector(backend=backend) as detector:
+            await detector.detect_ingredient("zorbo")
+
+    asyncio.run(main())
+
+    assert closed == [True]
+
+
+def test_persistent_cache_is_used_off_the_event_loop(tmp_path):
+    loop_threads = set()
+
+    class RecordingCache(VerdictCache):
+        def get(self, key):
+            loop_threads.add(threading.get_ident())
+            return super().get(key)
+
+        def set(self, key, value):
+            loop_threads.add(threading.get_ident())
+            super().set(key, value)
+
+    cache = RecordingCache(str(tmp_path / "verdicts.db"))
+    backend = StubBackend()
+
+    async def main():
+        async with AsyncHalalDetector(
+            backend=backend, cache=cache, use_lexicon=False
+        ) as detector:
+            await detector.detect_ingredient("zorbo")
+            await detector.detect_ingredient("zorbo")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(main())
+    cache.close()
+
+    assert loop_threads and loop_thread not in loop_threads
+    assert backend.calls == 1
+
+
+def test_quick_check_uses_the_compact_verdict_prompt():
+    payloads = []
+
+    def respond(payload):
+        payloads.append(payload)
+        return {"status": "Haram"}
+
+    backend = StubBackend(respond)
+
+    async def main():
+        async with AsyncHalalDetector(backend=backend, use_lexicon=False) as detector:
+            first = await detector.quick_check("zorbo")
+            second = await detector.detect_verdict("Zorbo")
+            return first, second
+
+    status, verdict = asyncio.run(main())
+
+    assert status == "Haram"
+    assert verdict.status == "Haram"
+    assert backend.calls == 1
+    assert payloads[0]["max_tokens"] == VERDICT_MAX_TOKENS == 24
+    assert payloads[0]["messages"][0]["content"] == VERDICT_SYSTEM_PROMPT
+
+
+def test_detect_verdict_reads_the_persistent_cache_off_the_event_loop(tmp_path):
+    lookup_threads = set()
+
+    class RecordingCache(VerdictCache):
+        def get(self, key):
+            lookup_threads.add(threading.get_ident())
+            return super().get(key)
+
+    cache = RecordingCache(str(tmp_path / "verdicts.db"))
+    backend = StubBackend({"status": "Halal"})
+    HalalDetector(backend=backend, cache=cache, use_lexicon=False).detect_ingredient(
+        "zorbo"
+    )
+    lookup_threads.clear()
+
+    async def main():
+        async with AsyncHalalDetector(
+            backend=backend, cache=cache, use_lexicon=False
+        ) as detector:
+            verdict = await detector.detect_verdict("zorbo")
+        return threading.get_ident(), verdict
+
+    loop_thread, verdict = asyncio.run(main())
+    cache.close()
+
+    assert verdict.status == "Halal"
+    assert backend.calls == 1
+    assert lookup_threads and loop_thread not in lookup_threads
+
+
+def test_batch_detect_keeps_results_when_one_item_fails():
+    async def main():
+        async with AsyncHalalDetector(
+            backend=StubBackend(), use_lexicon=False
+        ) as detector:
+            detect = detector.detect_ingredient
+
+            async def flaky(ingredient, context=""):
+                if ingredient == "quux":
+                    raise RuntimeError("boom")
+                return await detect(ingredient, context)
+
+            detector.detect_ingredient = flaky
+            return await detector.batch_detect(["zorbo", "quux", "frob"])
+
+    results = asyncio.run(main())
+
+    assert [r.ingredient for r in results] == ["zorbo", "quux", "frob"]
+    assert [r.status for r in results] == ["Questionable", "Error", "Questionable"]
+    assert results[1].concerns == ("Processing Error",)
+
+
+def test_batch_detect_times_out_slow_items():
+    async def main():
+        async with AsyncHalalDetector(
+            backend=StubBackend(latency=0.5), use_lexicon=False
+        ) as detector:
+            return await detector.batch_detect(["zorbo"], timeout=0.05)
+
+    (result,) = asyncio.run(main())
+
+    assert result.status == "Error"
+    assert result.concerns == ("Timeout",)
+
+
+def test_packed_mode_sends_one_request_per_chunk():
+    def respond(payload):
+        prompt = payload["messages"][-1]["content"]
+        items = json.loads(prompt.rsplit("ITEMS:", 1)[1])
+        return {"results": [{"ingredient": i, "status": "Haram"} for i in items]}
+
+    backend = StubBackend(respond)
+
+    async def main():
+        async with AsyncHalalDetector(backend=backend) as detector:
+            recipe = await detector.analyze_recipe(
+                "stew", ["pork", "zorbo", "quux", "Zorbo"], packed=True
+            )
+            repeat = await detector.detect_ingredient("quux")
+            return recipe, repeat
+
+    recipe, repeat = asyncio.run(main())
+
+    assert backend.calls == 1
+    assert json.loads(
+        backend.payloads[0]["messages"][-1]["content"].rsplit("ITEMS:", 1)[1]
+    ) == ["zorbo", "quux"]
+    assert recipe.haram_ingredients == ("pork", "zorbo", "quux", "Zorbo")
+    assert repeat.status == "Haram"
+
+
+def test_sync_helpers_are_mirrored():
+    def respond(payload):
+        prompt = payload["messages"][-1]["content"]
+        if "alternatives" in prompt:
+            return {"alternatives": ["a", "b", "c", "d", "e", "f"]}
+        if "certification" in prompt and "brand" in prompt:
+            return {"has_certification": True, "certifying_body": "HFA"}
+        if "restaurant" in prompt:
+            return {"is_halal": True, "notes": "verified"}
+        return {"status": "Halal", "technical_details": "plant based"}
+
+    async def main():
+        async with AsyncHalalDetector(
+            backend=StubBackend(respond), use_lexicon=False
+        ) as detector:
+            return await asyncio.gather(
+                detector.get_halal_alternatives("pork"),
+                detector.verify_certification("Acme", "Nuggets"),
+                detector.check_restaurant_halal("Grill", "Leeds"),
+                detector.advanced_ingredient_analysis("zorbo", "UK"),
+            )
+
+    alternatives, certification, restaurant, analysis = asyncio.run(main())
+
+    assert alternatives == ["a", "b", "c", "d", "e"]
+    assert certification["has_certification"] is True
+    assert certification["certifying_body"] == "HFA"
+    assert restaurant["location"] == "Leeds"
+    assert restaurant["notes"] == "verified"
+    assert analysis["source_country"] == "UK"
+    assert analysis["technical_details"] == "plant based"
@@ -0,0 +1,95 @@
+import threading
+import time
+
+from quran import FailoverBackend, HalalDetector, StubBackend
+
+PAYLOAD = {"messages": [{"role": "system", "content": ""}, {"role": "user"}]}
+
+
+class _Broken:
+    name = "broken"
+
+    def __init__(self):
+        self.calls = 0
+
+    def complete(self, payload):
+        self.calls += 1
+        raise ConnectionError("down")
+
+    def close(self):
+        pass
+
+
+def test_stub_backend_records_calls():
+    backend = StubBackend({"status": "Halal"})
+    detector = HalalDetector(backend=backend, use_lexicon=False)
+
+    assert detector.detect_ingredient("zorbo").status == "Halal"
+    assert backend.calls == 1
+    assert "zorbo" in backend.payloads[0]["messages"][-1]["content"]
+
+
+def test_failover_moves_to_the_next_backend():
+    broken, server_error, healthy = _Broken(), StubBackend(status=503), StubBackend()
+    backend = FailoverBackend([broken, server_error, healthy])
+
+    assert backend.complete(PAYLOAD).status == 200
+    assert (broken.calls, server_error.calls, healthy.calls) == (1, 1, 1)
+    assert backend.failovers == 2
+
+
+def test_hedge_answers_for_a_slow_primary():
+    slow, fast = StubBackend(latency=0.5), StubBackend()
+    backend = FailoverBackend([slow, fast], hedge_after=0.05)
+
+    started = time.perf_counter()
+    assert backend.complete(PAYLOAD).status == 200
+
+    assert time.perf_counter() - started < 0.4
+    assert (backend.hedged, backend.hedge_wins) == (1, 1)
+
+
+def test_busy_hedge_pool_does_not_delay_the_primary():
+    primary = StubBackend(latency=0.01)
+    backend = FailoverBackend([primary, StubBackend()], hedge_after=0.1, max_hedges=1)
+    backend._get_executor().submit(time.sleep, 0.3)
+
+    backend.complete(PAYLOAD)
+
+    assert backend.hedged == 0
+
+
+def test_primaries_run_on_a_bounded_pool():
+    names = set()
+
+    def respond(payload):
+        names.add(threading.current_thread().name)
+        time.sleep(0.05)
+        return {"status": "Halal"}
+
+    backend = FailoverBackend(
+        [StubBackend(respond), StubBackend()], hedge_after=1.0, max_primaries=2
+    )
+    threads = [
+        threading.Thread(target=backend.complete, args=(PAYLOAD,)) for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(names) == 2
+    assert all(name.startswith("quran-primary") for name in names)
+
+
+def test_queued_primary_is_not_hedged_early():
+    primary = StubBackend(latency=0.01)
+    backend = FailoverBackend(
+        [primary, StubBackend()], hedge_after=0.1, max_primaries=1
+    )
+    backend._get_primary_executor().submit(time.sleep, 0.3)
+
+    backend.complete(PAYLOAD)
+
+    assert backend.hedged == 0
+    assert primary.calls == 1
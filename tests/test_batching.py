@@ -0,0 +1,118 @@
+import contextvars
+import threading
+import time
+
+from quran import HalalDetector, StubBackend
+from quran.batching import ItemTimeoutError, run_parallel
+
+request_id: "contextvars.ContextVar[str]" = contextvars.ContextVar(
+    "request_id", default="unset"
+)
+
+
+def _errors(item, error):
+    return f"error: {type(error).__name__}"
+
+
+def test_results_keep_input_order():
+    def slow_first(n):
+        time.sleep(0.05 if n == 0 else 0.0)
+        return n * 10
+
+    results = list(run_parallel(slow_first, range(6), _errors, max_workers=4))
+
+    assert results == [(i, i * 10) for i in range(6)]
+
+
+def test_unordered_results_stream_as_they_finish():
+    def slow_first(n):
+        time.sleep(0.1 if n == 0 else 0.0)
+        return n
+
+    indexes = [
+        index
+        for index, _ in run_parallel(
+            slow_first, range(4), _errors, max_workers=4, preserve_order=False
+        )
+    ]
+
+    assert sorted(indexes) == [0, 1, 2, 3]
+    assert indexes[-1] == 0
+
+
+def test_ordered_results_are_yielded_incrementally():
+    release = threading.Event()
+    seen = []
+
+    def blocked_last(n):
+        if n == 3:
+            release.wait(1)
+        return n
+
+    for index, _ in run_parallel(blocked_last, range(4), _errors, max_workers=4):
+        seen.append(index)
+        if index == 2:
+            assert not release.is_set()
+            release.set()
+
+    assert seen == [0, 1, 2, 3]
+
+
+def test_failures_become_error_records():
+    def fail_odd(n):
+        if n % 2:
+            raise ValueError(n)
+        return "ok"
+
+    results = [r for _, r in run_parallel(fail_odd, range(4), _errors)]
+
+    assert results == ["ok", "error: ValueError", "ok", "error: ValueError"]
+
+
+def test_slow_items_time_out_without_aborting_the_batch():
+    def hang_on_one(n):
+        time.sleep(1.0 if n == 1 else 0.0)
+        return "ok"
+
+    started = time.monotonic()
+    results = [
+        r
+        for _, r in run_parallel(
+            hang_on_one, range(3), _errors, max_workers=3, timeout=0.1
+        )
+    ]
+
+    assert results == ["ok", f"error: {ItemTimeoutError.__name__}", "ok"]
+    assert time.monotonic() - started < 0.5
+
+
+def test_context_is_propagated_to_workers():
+    token = request_id.set("abc")
+    try:
+        results = [
+            r for _, r in run_parallel(lambda n: request_id.get(), range(3), _errors)
+        ]
+    finally:
+        request_id.reset(token)
+
+    assert results == ["abc", "abc", "abc"]
+
+
+def test_batch_detect_returns_error_records_for_timeouts():
+    backend = StubBackend(latency=0.5)
+    detector = HalalDetector(backend=backend, use_lexicon=False)
+
+    results = detector.batch_detect(["pork", "zorbo"], timeout=0.1)
+
+    assert [r.ingredient for r in results] == ["pork", "zorbo"]
+    assert [r.status for r in results] == ["Error", "Error"]
+
+
+def test_iter_batch_detect_yields_every_item():
+    detector = HalalDetector(backend=StubBackend())
+    items = ["pork", "zorbo", "chicken", "quux"]
+
+    results = list(detector.iter_batch_detect(items, preserve_order=True))
+
+    assert [r.ingredient for r in results] == items
+    assert [r.status for r in results[:3]] == ["Haram", "Questionable", "Halal"]
@@ -0,0 +1,163 @@
+import threading
+import time
+
+import pytest
+
+from quran import HalalDetector, MemoryCache, StubBackend, VerdictCache
+from quran.cache import make_cache_key
+
+
+@pytest.fixture
+def verdict_cache(tmp_path):
+    cache = VerdictCache(str(tmp_path / "verdicts.db"))
+    yield cache
+    cache.close()
+
+
+def _detector(backend, **kwargs):
+    kwargs.setdefault("use_lexicon", False)
+    return HalalDetector(backend=backend, **kwargs)
+
+
+def test_cache_key_ignores_case_and_whitespace():
+    key = make_cache_key("Is  GELATIN halal?", "", "openai", "v1")
+
+    assert key == make_cache_key("is gelatin halal?\n", "", "openai", "v1")
+    assert key != make_cache_key("is gelatin halal?", "", "mistral", "v1")
+    assert key != make_cache_key("is gelatin halal?", "", "openai", "v2")
+
+
+def test_verdict_cache_round_trip(verdict_cache):
+    verdict_cache.set("key", {"status": "Haram"})
+    verdict_cache.close()
+
+    reopened = VerdictCache(verdict_cache.path)
+    try:
+        assert reopened.get("key") == {"status": "Haram"}
+        assert reopened.get("missing") is None
+    finally:
+        reopened.close()
+
+
+def test_verdict_cache_expires_entries(verdict_cache):
+    verdict_cache.ttl = 0.01
+    verdict_cache.set("key", {"status": "Haram"})
+    time.sleep(0.02)
+
+    assert verdict_cache.get("key") is None
+
+
+def test_verdict_cache_evicts_oldest_entries(verdict_cache):
+    verdict_cache.max_entries = 10
+    for index in range(11):
+        verdict_cache.set(f"key {index}", {"n": index})
+        time.sleep(0.001)
+
+    assert len(verdict_cache) == 9
+    assert verdict_cache.get("key 0") is None
+    assert verdict_cache.get("key 10") == {"n": 10}
+
+
+def test_verdicts_survive_a_new_detector(verdict_cache):
+    backend = StubBackend({"status": "Halal"})
+    _detector(backend, cache=verdict_cache).detect_ingredient("zorbo")
+
+    restarted = _detector(backend, cache=verdict_cache, memory_cache_size=0)
+
+    assert restarted.detect_ingredient("Zorbo").status == "Halal"
+    assert backend.calls == 1
+    assert verdict_cache.stats()["hits"] == 1
+
+
+def test_errors_are_not_cached(verdict_cache):
+    backend = StubBackend(status=500)
+    detector = _detector(backend, cache=verdict_cache, failure_cache_ttl=0)
+
+    detector.detect_ingredient("zorbo extract")
+    detector.detect_ingredient("zorbo extract")
+
+    assert backend.calls == 2
+    assert len(verdict_cache) == 0
+
+
+def test_memory_cache_round_trip():
+    cache = MemoryCache(max_entries=10, ttl=None)
+    cache.set("key", {"status": "Halal", "concerns": ["none"]})
+
+    assert cache.get("key") == {"status": "Halal", "concerns": ["none"]}
+    assert cache.get("missing") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_memory_cache_expires_entries():
+    cache = MemoryCache(ttl=0.01)
+    cache.set("key", {"status": "Halal"})
+    time.sleep(0.02)
+
+    assert cache.get("key") is None
+    assert cache.expirations == 1
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_entries=2, ttl=None)
+    cache.set("a", {"n": 1})
+    cache.set("b", {"n": 2})
+    cache.get("a")
+    cache.set("c", {"n": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"n": 1}
+    assert cache.evictions == 1
+
+
+def test_memory_cache_values_are_not_shared():
+    cache = MemoryCache()
+    value = {"concerns": ["a"]}
+    cache.set("key", value)
+    value["concerns"].append("changed before get")
+    cache.get("key")["concerns"].append("changed after get")
+
+    assert cache.get("key") == {"concerns": ["a"]}
+
+
+def test_detector_serves_repeat_lookups_from_memory():
+    backend = StubBackend()
+    detector = _detector(backend)
+
+    first = detector.detect_ingredient("zorbo extract")
+    second = detector.detect_ingredient("zorbo extract")
+
+    assert backend.calls == 1
+    assert second.status == first.status
+
+
+def test_detector_cached_results_cannot_be_poisoned():
+    backend = StubBackend({"brands": ["A", "B"], "status": "Halal"})
+    detector = _detector(backend)
+
+    detector.get_halal_certified_brands("meat").append("poison")
+
+    assert detector.get_halal_certified_brands("meat") == ["A", "B"]
+    assert backend.calls == 1
+
+
+def test_concurrent_identical_lookups_share_one_request():
+    backend = StubBackend(latency=0.2)
+    detector = _detector(backend)
+    barrier = threading.Barrier(8)
+    results = []
+
+    def lookup():
+        barrier.wait()
+        results.append(detector.detect_ingredient("zorbo extract"))
+
+    threads = [threading.Thread(target=lookup) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert backend.calls == 1
+    assert len(results) == 8
+    assert detector.metrics.counter("coalesced_requests_total") == 7
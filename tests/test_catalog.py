@@ -0,0 +1,61 @@
+from quran import HalalDetector, MenuCatalog, StubBackend, VerdictCache, bypass_cache
+
+
+def _catalog(verdicts):
+    backend = StubBackend(lambda payload: {"status": verdicts["status"]})
+    return MenuCatalog(HalalDetector(backend=backend, use_lexicon=False)), backend
+
+
+def test_only_new_ingredients_are_classified():
+    catalog, backend = _catalog({"status": "Halal"})
+
+    catalog.set_recipe("stew", ["zorbo", "quux"])
+    catalog.set_recipe("soup", ["zorbo", "frob"])
+
+    assert backend.calls == 3
+    assert catalog.recipes_with("zorbo") == ["soup", "stew"]
+
+
+def test_refresh_picks_up_upstream_changes():
+    verdicts = {"status": "Halal"}
+    catalog, backend = _catalog(verdicts)
+    catalog.set_recipes({"stew": ["zorbo", "quux"], "salad": ["quux"]})
+
+    verdicts["status"] = "Haram"
+    changed = catalog.refresh(["zorbo"])
+
+    assert changed == ["stew"]
+    assert catalog.get("stew").overall_status == "Haram"
+    assert catalog.get("salad").overall_status == "Halal"
+    assert backend.calls == 3
+
+
+def test_retry_errors_retries_only_failed_ingredients():
+    verdicts = {"status": "Halal"}
+    catalog, backend = _catalog(verdicts)
+    backend.status = 500
+    catalog.set_recipe("stew", ["zorbo"])
+    assert catalog.verdict("zorbo").status == "Error"
+
+    backend.status = 200
+    changed = catalog.retry_errors()
+
+    assert changed == ["stew"]
+    assert catalog.verdict("zorbo").status == "Halal"
+
+
+def test_bypass_cache_goes_upstream_and_stores_fresh_verdict(tmp_path):
+    verdicts = iter(["Halal", "Haram"])
+    backend = StubBackend(lambda payload: {"status": next(verdicts)})
+    cache = VerdictCache(str(tmp_path / "verdicts.db"))
+    detector = HalalDetector(backend=backend, cache=cache, use_lexicon=False)
+    try:
+        assert detector.detect_ingredient("zorbo").status == "Halal"
+
+        with bypass_cache():
+            assert detector.detect_ingredient("zorbo").status == "Haram"
+
+        assert detector.detect_ingredient("zorbo").status == "Haram"
+        assert backend.calls == 2
+    finally:
+        cache.close()
@@ -0,0 +1,63 @@
+from quran import HalalDetector, StubBackend
+
+VERDICTS = {"zorbo": "Halal", "quux": "Haram", "frob": "Questionable"}
+
+
+def _backend():
+    def respond(payload):
+        prompt = payload["messages"][-1]["content"]
+        for name, status in VERDICTS.items():
+            if f"'{name}'" in prompt.lower():
+                return {"status": status}
+        return {"status": "Unknown"}
+
+    return StubBackend(respond)
+
+
+def _detector(backend, **kwargs):
+    return HalalDetector(
+        backend=backend, use_lexicon=False, memory_cache_size=0, **kwargs
+    )
+
+
+def test_classify_ingredients_deduplicates_case_insensitively():
+    backend = _backend()
+    detector = _detector(backend)
+
+    classified = detector.classify_ingredients(["Zorbo", "zorbo ", "ZORBO", "quux"])
+
+    assert backend.calls == 2
+    assert list(classified) == ["Zorbo", "zorbo ", "ZORBO", "quux"]
+    assert classified["ZORBO"].status == "Halal"
+
+
+def test_analyze_recipe_classifies_each_ingredient_once():
+    backend = _backend()
+    detector = _detector(backend)
+
+    recipe = detector.analyze_recipe("stew", ["zorbo", "quux", "frob", "Zorbo"])
+
+    assert backend.calls == 3
+    assert recipe.overall_status == "Haram"
+    assert recipe.safe_ingredients == ("zorbo", "Zorbo")
+    assert recipe.questionable_ingredients == ("frob",)
+    assert recipe.haram_ingredients == ("quux",)
+    assert recipe.total_ingredients == 4
+    assert recipe.halal_percentage == 50
+
+
+def test_list_helpers_filter_by_status():
+    detector = _detector(_backend())
+    ingredients = ["zorbo", "quux", "frob"]
+
+    assert detector.find_haram_ingredients(ingredients) == ["quux"]
+    assert detector.find_questionable_ingredients(ingredients) == ["frob"]
+    assert detector.get_safe_ingredients(ingredients) == ["zorbo"]
+    assert detector.check_ingredients_list(ingredients) == VERDICTS
+
+
+def test_empty_recipe():
+    recipe = _detector(_backend()).analyze_recipe("water", [])
+
+    assert recipe.overall_status == "Halal"
+    assert recipe.halal_percentage == 0
@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from quran import HalalDetector, StubBackend, cli
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    backend = StubBackend()
+
+    def build_detector(args, cache, snapshot=None):
+        return HalalDetector(backend=backend, cache=cache, max_workers=2)
+
+    monkeypatch.setattr(cli, "_build_detector", build_detector)
+    return backend
+
+
+def _classify(tmp_path, *extra):
+    return cli.main(
+        [
+            "classify",
+            str(tmp_path / "items.jsonl"),
+            "-o",
+            str(tmp_path / "out.jsonl"),
+            "--no-cache",
+            "--no-count",
+            "--checkpoint-every",
+            "1",
+            "--progress-interval",
+            "0",
+            *extra,
+        ]
+    )
+
+
+def _rows(tmp_path):
+    with open(tmp_path / "out.jsonl") as f:
+        return [json.loads(line) for line in f]
+
+
+def _checkpoint(tmp_path):
+    with open(tmp_path / "out.jsonl.ckpt") as f:
+        return json.load(f)
+
+
+def test_classify_writes_one_row_per_item(tmp_path, backend):
+    (tmp_path / "items.jsonl").write_text('"zorbo"\n"pork"\n"quux"\n')
+
+    assert _classify(tmp_path) == 0
+
+    rows = _rows(tmp_path)
+    assert [row["row"] for row in rows] == [0, 1, 2]
+    assert rows[1]["status"] == "Haram"
+    assert _checkpoint(tmp_path)["finished"] is True
+
+
+def test_crash_leaves_a_resumable_checkpoint(tmp_path, backend):
+    items = tmp_path / "items.jsonl"
+    items.write_text('"zorbo"\n"pork"\n{broken\n"quux"\n')
+
+    assert _classify(tmp_path) == 1
+    state = _checkpoint(tmp_path)
+    assert state["finished"] is False
+    assert state["completed"] <= 2
+
+    items.write_text('"zorbo"\n"pork"\n"frob"\n"quux"\n')
+    assert _classify(tmp_path) == 0
+
+    rows = _rows(tmp_path)
+    assert [row["row"] for row in rows] == [0, 1, 2, 3]
+    assert [row["ingredient"] for row in rows] == ["zorbo", "pork", "frob", "quux"]
+    assert _checkpoint(tmp_path)["finished"] is True
+
+
+def test_finished_run_is_not_repeated(tmp_path, backend):
+    (tmp_path / "items.jsonl").write_text('"zorbo"\n')
+    _classify(tmp_path)
+    calls = backend.calls
+
+    assert _classify(tmp_path) == 0
+    assert backend.calls == calls
+
+
+def test_limited_run_is_not_marked_finished(tmp_path, backend):
+    (tmp_path / "items.jsonl").write_text('"zorbo"\n"quux"\n')
+
+    assert _classify(tmp_path, "--limit", "1") == 0
+    assert _checkpoint(tmp_path)["finished"] is False
@@ -0,0 +1,126 @@
+from quran.label_parser import (
+    CONTAINS,
+    INGREDIENTS,
+    MAY_CONTAIN,
+    LabelToken,
+    _parse,
+    parse_label,
+)
+
+BISCUIT = (
+    "INGREDIENTS: Wheat Flour (Wheat Flour, Calcium Carbonate, Iron, Niacin, "
+    "Thiamin), Sugar, Vegetable Oils (Palm, Rapeseed), Whey Powder (Milk), "
+    "Raising Agents (E500, E450), Salt. Contains: Milk, Wheat. "
+    "May contain traces of Nuts and Sesame."
+)
+CHOCOLATE = (
+    "Milk Chocolate 45% (sugar, cocoa butter, whole milk powder, cocoa mass, "
+    "emulsifier: soya lecithin; flavouring), glucose syrup, palm fat, "
+    "humectant (glycerol), stabiliser (E420)."
+)
+
+
+def _canonical(tokens):
+    return [token.canonical for token in tokens]
+
+
+def test_functional_classes_group_their_members():
+    tokens = parse_label(
+        "Sugar, Emulsifiers (E471, Soy Lecithin), Gelatin (Bovine), Flavouring"
+    )
+
+    assert tokens == [
+        LabelToken("sugar", "Sugar", 0, 5),
+        LabelToken("e471", "E471", 20, 24, group="emulsifier"),
+        LabelToken("soy lecithin", "Soy Lecithin", 26, 38, group="emulsifier"),
+        LabelToken("bovine gelatin", "Gelatin (Bovine)", 41, 57),
+        LabelToken("flavor", "Flavouring", 59, 69),
+    ]
+
+
+def test_nested_brackets_keep_the_compound_ingredient():
+    tokens = parse_label(
+        "Cheese 10% (Milk, Salt, Rennet [Animal]), Vegetable Oil (Sunflower, Palm)"
+    )
+
+    assert _canonical(tokens) == [
+        "cheese",
+        "milk",
+        "salt",
+        "animal rennet",
+        "sunflower oil",
+        "palm oil",
+    ]
+    assert {token.group for token in tokens[1:4]} == {"cheese"}
+    assert tokens[3].text == "Rennet [Animal]"
+
+
+def test_percentages_are_stripped_from_names():
+    tokens = parse_label(CHOCOLATE)
+
+    assert tokens[0] == LabelToken("milk chocolate", "Milk Chocolate", 0, 110)
+    assert _canonical(tokens[1:7]) == [
+        "sugar",
+        "cocoa butter",
+        "whole milk powder",
+        "cocoa mass",
+        "soya lecithin",
+        "flavor",
+    ]
+    assert _canonical(parse_label("Water, Chicken (12%)")) == ["water", "chicken"]
+
+
+def test_contains_and_may_contain_clauses():
+    tokens = parse_label(BISCUIT)
+    clauses = {token.canonical: token.clause for token in tokens}
+
+    assert clauses["wheat flour"] == INGREDIENTS
+    assert clauses["salt"] == INGREDIENTS
+    assert clauses["wheat"] == CONTAINS
+    assert clauses["nut"] == MAY_CONTAIN
+    assert clauses["sesame"] == MAY_CONTAIN
+    assert _canonical(tokens).count("milk") == 1
+
+
+def test_factory_statements_are_may_contain():
+    tokens = parse_label(
+        "Water, Sugar; Made in a factory that also handles peanuts and tree nuts."
+    )
+
+    assert [(t.canonical, t.clause) for t in tokens] == [
+        ("water", INGREDIENTS),
+        ("sugar", INGREDIENTS),
+        ("peanut", MAY_CONTAIN),
+        ("tree nut", MAY_CONTAIN),
+    ]
+
+
+def test_e_numbers_are_normalised():
+    tokens = parse_label(
+        "Contains less than 2% of the following: salt, E-322, e 150d, Stabiliser "
+        "(E420)"
+    )
+
+    assert _canonical(tokens) == ["salt", "e322", "e150d", "e420"]
+    assert [token.text for token in tokens] == ["salt", "E-322", "e 150d", "E420"]
+
+
+def test_spans_point_back_into_the_label():
+    for label in (BISCUIT, CHOCOLATE):
+        for token in parse_label(label):
+            assert token.text in label[token.start : token.end]
+
+    flour = parse_label(BISCUIT)[0]
+    assert BISCUIT[flour.start : flour.end].endswith("Thiamin)")
+
+
+def test_repeat_labels_are_served_from_the_cache():
+    _parse.cache_clear()
+
+    first = parse_label(BISCUIT)
+    first.clear()
+    second = parse_label(BISCUIT)
+
+    assert _parse.cache_info().hits == 1
+    assert second == parse_label(BISCUIT)
+    assert second
@@ -0,0 +1,60 @@
+import pytest
+
+from quran import HalalDetector, StubBackend
+from quran.lexicon import HALAL, HARAM, QUESTIONABLE, get_default_lexicon
+
+
+@pytest.fixture(scope="module")
+def lexicon():
+    return get_default_lexicon()
+
+
+@pytest.mark.parametrize(
+    "name, status",
+    [
+        ("pork", HARAM),
+        ("Lard", HARAM),
+        ("chicken", HALAL),
+        ("chicken breast", HALAL),
+        ("gelatin", QUESTIONABLE),
+        ("E120", QUESTIONABLE),
+        ("e471", QUESTIONABLE),
+    ],
+)
+def test_known_terms(lexicon, name, status):
+    assert lexicon.lookup(name).status == status
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "vegan bacon",
+        "halal pepperoni",
+        "pork-free sausage",
+        "non alcoholic beer",
+        "beef prosciutto",
+        "bourbon biscuit",
+        "pork and zorbo",
+    ],
+)
+def test_partial_haram_matches_are_left_to_the_model(lexicon, name):
+    assert lexicon.resolve(name) is None
+
+
+def test_spelling_variants_agree(lexicon):
+    variants = ["rum flavour", "rum flavor", "rum flavouring", "rum flavorings"]
+
+    assert {lexicon.lookup(name).status for name in variants} == {QUESTIONABLE}
+
+
+def test_unknown_ingredients_are_not_matched(lexicon):
+    assert lexicon.lookup("zorbo") is None
+
+
+def test_detector_answers_lexicon_terms_locally():
+    backend = StubBackend()
+    detector = HalalDetector(backend=backend)
+
+    assert detector.detect_ingredient("pork").status == "Haram"
+    assert detector.detect_ingredient("vegan bacon").status == "Questionable"
+    assert backend.calls == 1
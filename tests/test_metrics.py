@@ -0,0 +1,136 @@
+import json
+
+import pytest
+
+from quran import HalalDetector, Metrics, StubBackend
+from quran.metrics import current_operation, instrumented
+
+
+def _detector(backend, **kwargs):
+    return HalalDetector(backend=backend, use_lexicon=False, **kwargs)
+
+
+def test_counters_accumulate_per_label_set():
+    metrics = Metrics()
+    metrics.inc("lookups_total", result="hit")
+    metrics.inc("lookups_total", 2, result="hit")
+    metrics.inc("lookups_total", result="miss")
+
+    assert metrics.counter("lookups_total", result="hit") == 3
+    assert metrics.counter("lookups_total", result="miss") == 1
+    assert metrics.counter("lookups_total") == 4
+    assert metrics.counter("missing_total") == 0
+
+
+def test_histograms_accumulate_and_estimate_quantiles():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.05, 0.5, 2.0):
+        metrics.observe("call_seconds", seconds)
+
+    (histogram,) = metrics.snapshot()["histograms"]["call_seconds"]
+
+    assert histogram["count"] == 4
+    assert histogram["sum"] == pytest.approx(2.6)
+    assert histogram["max"] == 2.0
+    assert histogram["buckets"] == {"0.1": 2, "1.0": 1}
+    assert histogram["p50"] <= 0.1
+    assert 1.0 <= histogram["p99"] <= 2.0
+
+
+def test_disabled_metrics_record_nothing():
+    metrics = Metrics(enabled=False)
+    metrics.inc("lookups_total")
+    metrics.observe("call_seconds", 1.0)
+
+    assert metrics.snapshot() == {"counters": {}, "histograms": {}, "hook_errors": 0}
+
+
+def test_prometheus_export():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    metrics.inc("requests_total", operation="detect_ingredient", status=200)
+    metrics.observe("request_seconds", 0.5, phase="network")
+
+    lines = metrics.to_prometheus().splitlines()
+
+    assert "# TYPE quran_requests_total counter" in lines
+    assert 'quran_requests_total{operation="detect_ingredient",status="200"} 1' in lines
+    assert "# TYPE quran_request_seconds histogram" in lines
+    assert 'quran_request_seconds_bucket{phase="network",le="0.1"} 0' in lines
+    assert 'quran_request_seconds_bucket{phase="network",le="1"} 1' in lines
+    assert 'quran_request_seconds_bucket{phase="network",le="+Inf"} 1' in lines
+    assert 'quran_request_seconds_count{phase="network"} 1' in lines
+
+
+def test_json_export():
+    metrics = Metrics()
+    metrics.inc("lookups_total", result="hit")
+
+    exported = json.loads(metrics.to_json())
+
+    assert exported["counters"]["lookups_total"] == [
+        {"labels": {"result": "hit"}, "value": 1.0}
+    ]
+
+
+def test_hooks_receive_events_and_errors_are_counted():
+    metrics = Metrics()
+    events = []
+
+    def broken(event, fields):
+        raise RuntimeError(event)
+
+    metrics.add_hook(lambda event, fields: events.append((event, fields)))
+    metrics.add_hook(broken)
+    metrics.emit("circuit", previous="closed", state="open")
+    metrics.remove_hook(broken)
+    metrics.emit("circuit", previous="open", state="half_open")
+
+    assert events == [
+        ("circuit", {"previous": "closed", "state": "open"}),
+        ("circuit", {"previous": "open", "state": "half_open"}),
+    ]
+    assert metrics.hook_errors == 1
+
+
+def test_detector_requests_are_tagged_with_the_public_operation():
+    metrics = Metrics()
+    requests = []
+    metrics.add_hook(lambda event, fields: requests.append(fields))
+    detector = _detector(StubBackend(), metrics=metrics)
+
+    detector.detect_ingredient("zorbo")
+    detector.analyze_recipe("stew", ["quux"])
+
+    assert [fields["operation"] for fields in requests] == [
+        "detect_ingredient",
+        "analyze_recipe",
+    ]
+    assert metrics.counter("requests_total", operation="analyze_recipe", status=200)
+    method_seconds = metrics.snapshot()["histograms"]["method_seconds"]
+    methods = {entry["labels"]["method"] for entry in method_seconds}
+    assert {"detect_ingredient", "analyze_recipe", "classify_ingredients"} <= methods
+
+
+def test_instrumented_counts_exceptions_and_tags_the_operation():
+    @instrumented
+    class Service:
+        def __init__(self):
+            self.metrics = Metrics()
+
+        def lookup(self):
+            return current_operation()
+
+        def fail(self):
+            raise ValueError("boom")
+
+        def _private(self):
+            return current_operation()
+
+    service = Service()
+
+    assert service.lookup() == "lookup"
+    assert service._private() is None
+    with pytest.raises(ValueError):
+        service.fail()
+    assert service.metrics.counter("method_exceptions_total", method="fail") == 1
+    assert current_operation() is None
@@ -0,0 +1,115 @@
+import json
+
+from quran import HalalDetector, StubBackend
+
+SINGLE = {"status": "Halal", "explanation": "single"}
+
+
+class PackedBackend(StubBackend):
+    def __init__(self, answer):
+        super().__init__(self.respond)
+        self.answer = answer
+        self.packed = []
+        self.singles = []
+
+    def respond(self, payload):
+        prompt = payload["messages"][-1]["content"]
+        if "ITEMS:" not in prompt:
+            self.singles.append(prompt)
+            return SINGLE
+        items = json.loads(prompt.rsplit("ITEMS:", 1)[1])
+        self.packed.append(items)
+        return {"results": self.answer(items, len(self.packed))}
+
+
+def _detector(backend, **kwargs):
+    kwargs.setdefault("use_lexicon", False)
+    return HalalDetector(backend=backend, chunk_size=4, max_workers=1, **kwargs)
+
+
+def _verdict(item, status="Haram"):
+    return {"ingredient": item, "status": status, "explanation": "packed"}
+
+
+def test_chunk_is_classified_in_one_request():
+    backend = PackedBackend(lambda items, n: [_verdict(i) for i in items])
+    detector = _detector(backend)
+
+    classified = detector.classify_ingredients(["a", "b", "c", "d"], packed=True)
+
+    assert backend.packed == [["a", "b", "c", "d"]]
+    assert {r.status for r in classified.values()} == {"Haram"}
+
+
+def test_missing_items_are_repacked():
+    backend = PackedBackend(lambda items, n: [_verdict(i) for i in items[: 2 * n]])
+    detector = _detector(backend)
+
+    classified = detector.classify_ingredients(["a", "b", "c", "d"], packed=True)
+
+    assert backend.packed == [["a", "b", "c", "d"], ["c", "d"]]
+    assert backend.singles == []
+    assert {r.status for r in classified.values()} == {"Haram"}
+
+
+def test_single_missing_item_falls_back_to_detect_ingredient():
+    backend = PackedBackend(lambda items, n: [_verdict(i) for i in items[:3]])
+    detector = _detector(backend)
+
+    classified = detector.classify_ingredients(["a", "b", "c", "d"], packed=True)
+
+    assert backend.packed == [["a", "b", "c", "d"]]
+    assert len(backend.singles) == 1
+    assert classified["d"].explanation == "single"
+
+
+def test_empty_chunk_answer_falls_back_to_single_requests():
+    backend = PackedBackend(lambda items, n: [])
+    detector = _detector(backend)
+
+    classified = detector.classify_ingredients(["a", "b", "c", "d"], packed=True)
+
+    assert len(backend.packed) == 1
+    assert len(backend.singles) == 4
+    assert {r.explanation for r in classified.values()} == {"single"}
+
+
+def test_invalid_statuses_are_dropped():
+    backend = PackedBackend(
+        lambda items, n: [_verdict("a", "maybe"), _verdict("b"), _verdict("c")]
+    )
+    detector = _detector(backend)
+
+    classified = detector.classify_ingredients(["a", "b", "c"], packed=True)
+
+    assert classified["a"].explanation == "single"
+    assert classified["b"].status == "Haram"
+
+
+def test_packed_verdicts_are_cached_per_item():
+    backend = PackedBackend(lambda items, n: [_verdict(i) for i in items])
+    detector = _detector(backend)
+    detector.classify_ingredients(["a", "b"], packed=True)
+
+    assert detector.detect_ingredient("a").status == "Haram"
+    assert detector.classify_ingredients(["b", "a"], packed=True)["b"].status == "Haram"
+    assert backend.calls == 1
+
+
+def test_lexicon_hits_are_not_sent():
+    backend = PackedBackend(lambda items, n: [_verdict(i) for i in items])
+    detector = _detector(backend, use_lexicon=True)
+
+    classified = detector.classify_ingredients(["pork", "zorbo"], packed=True)
+
+    assert backend.calls == 1
+    assert classified["pork"].status == "Haram"
+    assert backend.packed == [["zorbo"]]
+
+
+def test_upstream_error_marks_the_whole_chunk():
+    detector = _detector(StubBackend(status=503), failure_cache_ttl=0)
+
+    classified = detector.classify_ingredients(["a", "b"], packed=True)
+
+    assert {r.status for r in classified.values()} == {"Error"}
@@ -0,0 +1,114 @@
+import pytest
+
+from quran import HalalDetector, StubBackend
+from quran.parsing import (
+    DETAILED,
+    PACKED,
+    VERDICT,
+    SchemaError,
+    extract_json,
+    strip_boilerplate,
+    validate,
+)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"status": "Halal"}',
+        'Sure! Here is the analysis:\n```json\n{"status": "Halal"}\n```',
+        "{'status': 'Halal',}",
+        '{"status": "Halal", "certification_required": true,}',
+        'Note {not json} then {"status": "Halal"}',
+    ],
+)
+def test_extract_json_from_noisy_text(text):
+    assert extract_json(text)["status"] == "Halal"
+
+
+def test_extract_json_ignores_fragments_of_truncated_output():
+    with pytest.raises(ValueError):
+        extract_json('{"status": "Halal", "details": {"source": "plant"')
+
+
+def test_extract_json_without_json_raises():
+    with pytest.raises(ValueError):
+        extract_json("I cannot help with that.")
+
+
+def test_strip_boilerplate():
+    text = '{"status": "Halal"}\n\nPowered by Pollinations.AI'
+
+    assert strip_boilerplate(text) == '{"status": "Halal"}'
+
+
+def test_validate_coerces_aliases_and_types():
+    record = validate(
+        {
+            "Verdict": "haram - contains pork",
+            "reason": "pork",
+            "confidence": "HIGH",
+            "certification_required": "yes",
+            "concerns": "pork",
+        },
+        DETAILED,
+    )
+
+    assert record["status"] == "Haram"
+    assert record["explanation"] == "pork"
+    assert record["confidence"] == "High"
+    assert record["certification_required"] is True
+    assert record["concerns"] == ["pork"]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"result": {"status": "Halal"}},
+        [{"status": "Halal"}],
+        [{"analysis": {"verdict": "Halal"}}],
+    ],
+)
+def test_validate_unwraps_wrapped_verdicts(value):
+    assert validate(value, DETAILED)["status"] == "Halal"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"guidelines": {"general_principles": ["avoid pork"]}},
+        {"individual_analysis": {"pork": "Haram"}},
+        {"menu_analysis": {"items": []}},
+    ],
+)
+def test_validate_keeps_single_key_objects_without_a_verdict(value):
+    assert validate(value, DETAILED) == value
+
+
+def test_verdict_schema_requires_a_status():
+    with pytest.raises(SchemaError):
+        validate({"explanation": "no verdict"}, VERDICT)
+    with pytest.raises(SchemaError):
+        validate({"status": "maybe"}, VERDICT)
+
+
+def test_packed_schema_accepts_bare_lists():
+    packed = validate([{"ingredient": "pork", "verdict": "Haram"}], PACKED)
+
+    assert packed["results"][0]["status"] == "Haram"
+
+
+def test_detector_returns_guidelines_unchanged():
+    guidelines = {"guidelines": {"general_principles": ["avoid pork"]}}
+    detector = HalalDetector(backend=StubBackend(guidelines))
+
+    assert detector.get_halal_guidelines()["guidelines"] == guidelines["guidelines"]
+
+
+def test_invalid_response_schema_falls_back_to_an_error_verdict():
+    detector = HalalDetector(backend=StubBackend(["not", "a", "verdict"]))
+
+    result = detector.quick_check("zorbo")
+
+    assert result is not None
+    assert detector.metrics.counter("fallbacks_total", kind="invalid_schema") == 1
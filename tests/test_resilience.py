@@ -0,0 +1,111 @@
+import time
+
+from quran import CircuitBreaker, HalalDetector, StubBackend
+from quran.resilience import CLOSED, HALF_OPEN, OPEN
+
+
+def _detector(backend, **kwargs):
+    kwargs.setdefault("use_lexicon", False)
+    kwargs.setdefault("memory_cache_size", 0)
+    return HalalDetector(backend=backend, **kwargs)
+
+
+def test_breaker_opens_probes_and_closes():
+    changes = []
+    breaker = CircuitBreaker(
+        failure_threshold=2,
+        recovery_timeout=0.05,
+        on_state_change=lambda old, new: changes.append((old, new)),
+    )
+
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_success()
+
+    assert breaker.state == CLOSED
+    assert changes == [(CLOSED, OPEN), (OPEN, HALF_OPEN), (HALF_OPEN, CLOSED)]
+    assert breaker.stats()["rejected"] == 2
+
+
+def test_failed_probe_reopens_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert breaker.times_opened == 2
+    assert breaker.retry_after() > 0
+
+
+def test_open_circuit_fails_fast_without_calling_upstream():
+    backend = StubBackend(status=503)
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    detector = _detector(backend, circuit_breaker=breaker, failure_cache_ttl=0)
+
+    detector.detect_ingredient("zorbo")
+    detector.detect_ingredient("quux")
+    result = detector.detect_ingredient("frob")
+
+    assert backend.calls == 2
+    assert result.status == "Error"
+    assert result.concerns == ("Circuit Open",)
+    assert detector.metrics.counter("fallbacks_total", kind="circuit_open") == 1
+
+
+def test_probe_after_recovery_timeout_closes_the_circuit():
+    backend = StubBackend({"status": "Halal"}, status=503)
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    detector = _detector(backend, circuit_breaker=breaker, failure_cache_ttl=0)
+    detector.detect_ingredient("zorbo")
+    assert breaker.state == OPEN
+
+    backend.status = 200
+    time.sleep(0.06)
+
+    assert detector.detect_ingredient("zorbo").status == "Halal"
+    assert breaker.state == CLOSED
+    assert detector.detect_ingredient("quux").status == "Halal"
+
+
+def test_failures_are_negatively_cached_for_the_ttl():
+    backend = StubBackend({"status": "Halal"}, status=400)
+    detector = _detector(backend, failure_cache_ttl=0.05)
+
+    first = detector.detect_ingredient("zorbo")
+    second = detector.detect_ingredient("zorbo")
+
+    assert first.status == second.status == "Error"
+    assert backend.calls == 1
+    assert detector.metrics.counter("fallbacks_total", kind="negative_cache") == 1
+
+    backend.status = 200
+    time.sleep(0.06)
+
+    assert detector.detect_ingredient("zorbo").status == "Halal"
+    assert backend.calls == 2
+
+
+def test_circuit_open_errors_are_not_negatively_cached():
+    backend = StubBackend({"status": "Halal"}, status=503)
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    detector = _detector(backend, circuit_breaker=breaker)
+    detector.detect_ingredient("zorbo")
+
+    assert detector.detect_ingredient("quux").concerns == ("Circuit Open",)
+
+    backend.status = 200
+    time.sleep(0.06)
+
+    assert detector.detect_ingredient("quux").status == "Halal"
@@ -0,0 +1,109 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from quran import (
+    Confidence,
+    HalalDetector,
+    IngredientResult,
+    Status,
+    StubBackend,
+    VerdictResult,
+)
+
+RESPONSE = {
+    "status": "haram",
+    "explanation": "Derived from pork",
+    "confidence": "high",
+    "concerns": ["Pork"],
+    "recommendations": "Avoid",
+    "certification_required": 1,
+}
+
+
+def test_from_response_coerces_fields():
+    result = IngredientResult.from_response("gelatin", RESPONSE)
+
+    assert result.status is Status.HARAM
+    assert result.confidence is Confidence.HIGH
+    assert result.concerns == ("Pork",)
+    assert result.recommendations == ("Avoid",)
+    assert result.certification_required is True
+    assert result.alternatives == ()
+
+
+def test_unknown_values_fall_back():
+    result = VerdictResult.from_response("zorbo", {"status": 3, "confidence": "?"})
+
+    assert result.status is Status.UNKNOWN
+    assert result.confidence is Confidence.LOW
+    assert Status.parse("Mushbooh") is Status.QUESTIONABLE
+
+
+def test_enums_compare_as_strings():
+    result = IngredientResult.from_response("gelatin", RESPONSE)
+
+    assert result.status == "Haram"
+    assert result.confidence == "High"
+    assert str(result.status) == "Haram"
+    assert f"{result.confidence}" == "High"
+    assert {"Haram": 1}[result.status] == 1
+
+
+def test_records_behave_like_mappings():
+    result = IngredientResult.from_response("gelatin", RESPONSE)
+
+    assert result["status"] == "Haram"
+    assert result.get("explanation") == "Derived from pork"
+    assert result.get("missing", "default") == "default"
+    assert "concerns" in result
+    assert "missing" not in result
+    assert list(result)[:2] == ["ingredient", "status"]
+    assert len(result) == 8
+    assert dict(result)["ingredient"] == "gelatin"
+    with pytest.raises(KeyError):
+        result["missing"]
+
+
+def test_to_dict_is_json_ready():
+    result = IngredientResult.from_response("gelatin", RESPONSE)
+
+    plain = result.to_dict()
+
+    assert plain["status"] == "Haram"
+    assert type(plain["status"]) is str
+    assert plain["concerns"] == ["Pork"]
+    assert json.loads(json.dumps(plain)) == plain
+
+
+def test_records_are_immutable():
+    result = VerdictResult("zorbo", Status.HALAL, Confidence.HIGH)
+
+    with pytest.raises(AttributeError):
+        result.status = Status.HARAM
+    with pytest.raises(AttributeError):
+        del result.item
+    with pytest.raises(AttributeError):
+        result.extra = 1
+
+    assert result.status is Status.HALAL
+
+
+def test_records_survive_copy_and_pickle():
+    result = IngredientResult.from_response("gelatin", RESPONSE)
+
+    assert copy.deepcopy(result) == result
+    assert pickle.loads(pickle.dumps(result)).to_dict() == result.to_dict()
+
+
+def test_duplicates_share_an_immutable_record():
+    detector = HalalDetector(backend=StubBackend(), use_lexicon=False)
+
+    classified = detector.classify_ingredients(["Zorbo", "zorbo"])
+
+    assert classified["Zorbo"] is classified["zorbo"]
+    with pytest.raises(AttributeError):
+        classified["Zorbo"].status = Status.HALAL
+    assert classified["zorbo"].status == "Questionable"
@@ -0,0 +1,106 @@
+import threading
+import time
+
+from quran import (
+    HalalDetector,
+    Metrics,
+    Priority,
+    RequestScheduler,
+    StubBackend,
+    priority,
+)
+from quran.scheduler import current_priority
+
+
+def _detector(scheduler, **kwargs):
+    return HalalDetector(
+        backend=StubBackend(),
+        use_lexicon=False,
+        memory_cache_size=0,
+        scheduler=scheduler,
+        **kwargs,
+    )
+
+
+def test_bulk_methods_run_at_bulk_priority():
+    scheduler = RequestScheduler()
+    detector = _detector(scheduler)
+
+    detector.check_ingredients_list(["zorbo", "quux", "frob"])
+    detector.detect_ingredient("blarg")
+
+    assert scheduler.stats()["granted"] == {"interactive": 1, "bulk": 3}
+
+
+def test_bulk_priority_does_not_depend_on_metrics():
+    scheduler = RequestScheduler()
+    detector = _detector(scheduler, metrics=Metrics(enabled=False))
+
+    detector.check_ingredients_list(["zorbo", "quux", "frob"])
+
+    assert scheduler.stats()["granted"] == {"interactive": 0, "bulk": 3}
+
+
+def test_explicit_priority_wins():
+    scheduler = RequestScheduler()
+    detector = _detector(scheduler)
+
+    with priority("interactive"):
+        detector.check_ingredients_list(["zorbo", "quux"])
+
+    assert current_priority() is Priority.INTERACTIVE
+    assert scheduler.stats()["granted"] == {"interactive": 2, "bulk": 0}
+
+
+def test_interactive_requests_are_served_before_bulk():
+    scheduler = RequestScheduler(max_concurrency=1)
+    order = []
+    scheduler.acquire(Priority.INTERACTIVE)
+
+    def wait(level, name):
+        scheduler.acquire(level)
+        order.append(name)
+        scheduler.release()
+
+    threads = [threading.Thread(target=wait, args=(Priority.BULK, "bulk"))]
+    threads[0].start()
+    while not scheduler.queued:
+        time.sleep(0.001)
+    threads.append(
+        threading.Thread(target=wait, args=(Priority.INTERACTIVE, "interactive"))
+    )
+    threads[1].start()
+    while scheduler.queued < 2:
+        time.sleep(0.001)
+    scheduler.release()
+    for thread in threads:
+        thread.join()
+
+    assert order == ["interactive", "bulk"]
+
+
+def test_rate_limit_spaces_requests():
+    scheduler = RequestScheduler(rate=50, burst=1)
+    started = time.monotonic()
+    for _ in range(6):
+        with scheduler.slot(Priority.INTERACTIVE):
+            pass
+
+    assert time.monotonic() - started >= 0.09
+
+
+def test_pause_delays_the_next_request():
+    scheduler = RequestScheduler(rate=1000)
+    scheduler.pause(0.05)
+
+    assert scheduler.acquire(Priority.INTERACTIVE) >= 0.04
+    scheduler.release()
+
+
+def test_unlimited_scheduler_does_not_track_slots():
+    scheduler = RequestScheduler()
+    with scheduler.slot(Priority.BULK) as waited:
+        assert waited == 0.0
+
+    assert not scheduler.limited
+    assert scheduler.stats()["active"] == 0
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from aiohttp.test_utils import TestClient, TestServer  # noqa: E402
+
+from quran import HalalDetector, StubBackend  # noqa: E402
+from quran.server import HalalService  # noqa: E402
+
+
+def _serve(detector, requests, window=0.01):
+    async def main():
+        service = HalalService(detector, window=window)
+        async with TestClient(TestServer(service.app())) as client:
+            return await requests(client)
+
+    return asyncio.run(main())
+
+
+def test_concurrent_lookups_are_batched():
+    backend = StubBackend()
+    detector = HalalDetector(backend=backend, use_lexicon=False)
+    names = [f"zorbo {i}" for i in range(20)]
+
+    async def requests(client):
+        responses = await asyncio.gather(
+            *(client.post("/v1/ingredient", json={"ingredient": n}) for n in names)
+        )
+        return [await response.json() for response in responses]
+
+    results = _serve(detector, requests)
+
+    assert [result["ingredient"] for result in results] == names
+    assert backend.calls < len(names)
+    assert detector.metrics.counter("server_batched_items_total") == len(names)
+
+
+def test_lexicon_hits_skip_the_backend():
+    backend = StubBackend()
+    detector = HalalDetector(backend=backend)
+
+    async def requests(client):
+        response = await client.post("/v1/ingredient", json={"ingredient": "pork"})
+        return await response.json()
+
+    assert _serve(detector, requests)["status"] == "Haram"
+    assert backend.calls == 0
+
+
+def test_invalid_requests_are_rejected():
+    detector = HalalDetector(backend=StubBackend())
+
+    async def requests(client):
+        missing = await client.post("/v1/ingredient", json={})
+        not_json = await client.post("/v1/batch", data="items")
+        bad_type = await client.post("/v1/batch", json={"items": [], "type": "x"})
+        return [
+            (response.status, (await response.json())["error"])
+            for response in (missing, not_json, bad_type)
+        ]
+
+    for status, error in _serve(detector, requests):
+        assert status == 400
+        assert error
+
+
+def test_health_and_metrics():
+    detector = HalalDetector(backend=StubBackend())
+
+    async def requests(client):
+        health = await (await client.get("/health")).json()
+        metrics = await (await client.get("/metrics")).text()
+        return health, metrics
+
+    health, metrics = _serve(detector, requests)
+
+    assert health == {"status": "ok", "circuit": "closed"}
+    assert isinstance(metrics, str)
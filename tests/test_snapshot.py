@@ -0,0 +1,78 @@
+import pytest
+
+from quran import HalalDetector, StubBackend, VerdictSnapshot, build_snapshot
+from quran.snapshot import write_snapshot
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    path = str(tmp_path / "verdicts.snap")
+    detector = HalalDetector(
+        backend=StubBackend({"status": "Halal", "confidence": "High"}),
+        use_lexicon=False,
+    )
+    build_snapshot(detector, ["Zorbo", "quux", "zorbo"], path)
+    return path
+
+
+def test_snapshot_round_trip(snapshot_path):
+    with VerdictSnapshot(snapshot_path) as snapshot:
+        assert len(snapshot) == 2
+        assert "ZORBO " in snapshot
+        assert snapshot.get("quux")["status"] == "Halal"
+        assert snapshot.get("frob") is None
+
+
+def test_detector_answers_from_the_snapshot(snapshot_path):
+    backend = StubBackend()
+    detector = HalalDetector(backend=backend, snapshot=snapshot_path)
+
+    assert detector.detect_ingredient("zorbo").status == "Halal"
+    assert backend.calls == 0
+    assert detector.metrics.counter("snapshot_hits_total") == 1
+    detector.close()
+
+
+def test_snapshot_skips_errors(tmp_path):
+    path = str(tmp_path / "verdicts.snap")
+    detector = HalalDetector(backend=StubBackend(status=500), use_lexicon=False)
+
+    assert build_snapshot(detector, ["zorbo"], path) == 0
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not.snap"
+    path.write_bytes(b"not a snapshot" * 10)
+
+    with pytest.raises(ValueError):
+        VerdictSnapshot(str(path))
+
+
+def test_write_snapshot_keeps_the_first_duplicate(tmp_path):
+    path = str(tmp_path / "verdicts.snap")
+    entries = [("zorbo", {"status": "Halal"}), ("Zorbo", {"status": "Haram"})]
+
+    assert write_snapshot(path, entries, "openai", "v1") == 1
+    with VerdictSnapshot(path) as snapshot:
+        assert snapshot.get("zorbo")["status"] == "Halal"
+
+
+def test_write_snapshot_keeps_zero_values(tmp_path):
+    path = str(tmp_path / "verdicts.snap")
+    verdict = {
+        "status": "Halal",
+        "score": 0,
+        "alcohol_percentage": 0.0,
+        "concerns": [],
+        "certification_required": False,
+        "notes": "",
+    }
+
+    write_snapshot(path, [("zorbo", verdict)], "openai", "v1")
+
+    with VerdictSnapshot(path) as snapshot:
+        assert snapshot.get("zorbo") == {
+            "status": "Halal",
+            "score": 0,
+            "alcohol_percentage": 0.0,
+        }
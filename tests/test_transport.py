@@ -0,0 +1,90 @@
+import time
+from unittest import mock
+
+import pytest
+import requests
+
+from quran import HTTPTransport, Priority, RequestScheduler
+
+
+class _Response:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def close(self):
+        pass
+
+
+def _transport(responses, **kwargs):
+    kwargs.setdefault("backoff_factor", 0.0)
+    transport = HTTPTransport(**kwargs)
+    calls = []
+
+    def post(*args, **kwargs):
+        calls.append(time.monotonic())
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    transport._session = mock.Mock(post=post)
+    return transport, calls
+
+
+def test_retries_retryable_statuses():
+    transport, calls = _transport([_Response(503), _Response(429), _Response(200)])
+
+    assert transport.post("http://upstream", {}).status_code == 200
+    assert len(calls) == 3
+    assert transport.retries == 2
+
+
+def test_gives_up_after_max_retries():
+    transport, calls = _transport([_Response(503)] * 3, max_retries=2)
+
+    assert transport.post("http://upstream", {}).status_code == 503
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize(
+    "error", [requests.ConnectionError("reset"), requests.ConnectTimeout("slow")]
+)
+def test_retries_connection_failures(error):
+    transport, calls = _transport([error, _Response(200)])
+
+    assert transport.post("http://upstream", {}).status_code == 200
+    assert len(calls) == 2
+
+
+def test_does_not_retry_read_timeouts():
+    transport, calls = _transport([requests.ReadTimeout("slow"), _Response(200)])
+
+    with pytest.raises(requests.ReadTimeout):
+        transport.post("http://upstream", {})
+    assert len(calls) == 1
+
+
+def test_honors_retry_after():
+    transport, _ = _transport(
+        [_Response(429, {"Retry-After": "2"}), _Response(200)], backoff_max=30
+    )
+    transport._sleep = mock.Mock()
+
+    transport.post("http://upstream", {})
+
+    transport._sleep.assert_called_once_with(2.0)
+
+
+def test_retries_queue_for_the_scheduler():
+    scheduler = RequestScheduler(rate=20, burst=1)
+    transport, calls = _transport([_Response(503), _Response(503), _Response(200)])
+    transport.scheduler = scheduler
+
+    with scheduler.slot(Priority.INTERACTIVE):
+        transport.post("http://upstream", {})
+
+    assert calls[1] - calls[0] >= 0.04
+    assert calls[2] - calls[1] >= 0.04
+    assert scheduler.stats()["granted"]["interactive"] == 3
+    assert scheduler.stats()["active"] == 0